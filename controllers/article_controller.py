@@ -1,29 +1,64 @@
 import re
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QMessageBox, QApplication
-from workers.article_worker import ArticleManager, SciDownloadThread
+from workers.article_worker import ArticleManager
 from views.table_builder import TableBuilder
 from services.journal_db import JournalDB
 from services.file_service import FileService
+from services.doi_utils import find_all_dois
+from services.article_record import ArticleRecord
+from services.metadata_cache import MetadataCache
+from services.title_matcher import TitleMatcher
+from services.article_library import ArticleLibrary
 from controllers.zotero_controller import ZoteroController
 from controllers.journal_controller import JournalController
+from controllers.download_queue_controller import DownloadQueueController
 from services.notification_service import NotificationServices
 
 
+# Index of the "Saved Articles" entry of the search mode combo box.
+SAVED_ARTICLES_MODE = 2
+# Clipboard watcher: quiet period before scanning, characters scanned and DOIs prefetched per copy.
+CLIPBOARD_DEBOUNCE_MS = 400
+CLIPBOARD_SCAN_CHARS = 200_000
+CLIPBOARD_MAX_DOIS = 20
+
+
 class ArticleController:
     def __init__(self, ui, config_manager):
-        self.download_thread = None
         self.worker = None
+        self.batch_lookup_controller = None
+        self.citation_graph_controller = None
         self.ui = ui
         self.config_manager = config_manager
         self.article_data = {}
+        self.article_candidates = []
+        self.candidate_index = 0
+        self.title_query = None
         self.file_controller = None
         self.file_service = FileService()
+        self.article_library = ArticleLibrary()
         self.zotero_controller = ZoteroController(self.ui, self.config_manager)
         self.journal_controller = JournalController(self.ui)
         self.desktop_notification = NotificationServices()
 
+        # Jobs enqueued from the article section: job id -> float mode.
+        self.download_jobs = {}
+        self.download_queue_controller = DownloadQueueController(self.ui, self.config_manager)
+        self.download_queue_controller.manager.message.connect(self._append_article_log)
+        self.download_queue_controller.manager.job_done.connect(self._on_download_done)
+        self.download_queue_controller.manager.job_failed.connect(self._on_download_failed)
+
+        self.prefetch_workers = []
+        self.prefetched_dois = set()
+        self.clipboard_timer = QTimer()
+        self.clipboard_timer.setSingleShot(True)
+        self.clipboard_timer.setInterval(CLIPBOARD_DEBOUNCE_MS)
+        self.clipboard_timer.timeout.connect(self.check_clipboard_for_doi)
         self.clipboard = QApplication.clipboard()
-        self.clipboard.dataChanged.connect(self.check_clipboard_for_doi)
+        self.clipboard.dataChanged.connect(self.clipboard_timer.start)
+        self.ui.articles_tree_qwidget.itemExpanded.connect(TableBuilder.populate_article_candidate)
+        self.ui.articles_tree_qwidget.itemDoubleClicked.connect(self._select_article_candidate)
 
     def search_articles(self, float_mode = False)-> None:
         self.clear_article_results()
@@ -36,6 +71,11 @@ class ArticleController:
             else:
                 self._append_article_log("Please enter a valid DOI or Title!")
             return
+        if self.ui.search_mode_cbox.currentIndex() == SAVED_ARTICLES_MODE:
+            self._search_saved_articles(search_text, float_mode)
+            return
+        if mode == "DOI":
+            self._report_library_matches(search_text)
         download_path = self.file_controller.get_download_path()
         self._append_article_log(f"Fetching article via {mode}...")
 
@@ -43,15 +83,40 @@ class ArticleController:
         self.worker = ArticleManager(
             download_path= download_path,
             article_doi=search_text if mode == "DOI" else None,
-            article_title=search_text if mode != "DOI" else None
+            article_title=search_text if mode != "DOI" else None,
+            use_cache=self.config_manager.metadata_cache_enabled
         )
+        self.title_query = search_text if mode != "DOI" else None
         self.worker.result.connect(self._handle_article_result)
+        self.worker.candidates.connect(self._handle_article_candidates)
         self.worker.error.connect(lambda err: self._append_article_log(err))
         self.worker.error.connect(self._float_notifications)
         self.worker.start()
         if float_mode:
             self.worker.done.connect(lambda: self.download_article_pdf (float_mode = True))
 
+    def _search_saved_articles(self, text: str, float_mode: bool = False) -> None:
+        """Search previously fetched articles offline; the best match is selected and the others listed."""
+        results = self.article_library.search(text)
+        if not results:
+            self._append_article_log("No saved article matches the search.")
+            if float_mode:
+                self._float_notifications("No saved article matches the search.")
+            return
+        self.title_query = None
+        self._show_article(results[0])
+        if len(results) > 1:
+            self._handle_article_candidates(results)
+        self._append_article_log(f"{len(results)} saved article(s) found.")
+        if float_mode:
+            self.download_article_pdf(float_mode=True)
+
+    def _report_library_matches(self, doi: str) -> None:
+        """Tell the user when the DOI is already linked to a PDF of the local library."""
+        paths = self.file_controller.catalog.find_by_doi(doi)
+        for path in paths:
+            self._append_article_log(f"Already in library at {path}")
+
     def download_article_pdf(self, float_mode:bool = False) -> None:
         """
         Downloads the article using the DOI and Title from the previously searched article.
@@ -78,27 +143,42 @@ class ArticleController:
             return
 
 
-        self._append_article_log(f"Downloading article '{title_text}' to: {download_path}")
-
-        # Create and start the download thread with the DOI and Title.
-        self.download_thread = SciDownloadThread(
-            download_path=download_path,
-            article_doi=doi_text,
-            article_title=title_text
-        )
-        self.download_thread.message.connect(self._append_article_log)
-        self.download_thread.pdf_path.connect(self._open_download_pdf)
-
-        #float node search
-        if float_mode :
-            self.download_thread.failed.connect(self._float_notifications)
-            self.download_thread.success.connect(self._float_notifications)
-        self.download_thread.start()
-        self.download_thread.finished.connect(self._on_download_finished)
+        # Articles already in the library are not downloaded again.
+        existing = self.download_queue_controller.find_in_library(doi_text, title_text, download_path)
+        if existing and not self.download_queue_controller.needs_placement(existing, download_path):
+            self._append_article_log(f"'{title_text}' is already in the library: {existing}")
+            self._use_downloaded_pdf(doi_text, title_text, existing, float_mode)
+            return
 
-    def _on_download_finished(self) -> None:
+        if existing:
+            # The download manager copies or links it into the folder in the background.
+            self._append_article_log(f"'{title_text}' is already in the library: {existing}, placing it in: "
+                                     f"{download_path}")
+        else:
+            self._append_article_log(f"Downloading article '{title_text}' to: {download_path}")
+
+        # Queue the download; the download manager runs it in the background.
+        job_id = self.download_queue_controller.enqueue(doi_text, title_text, download_path)
+        self.download_jobs[job_id] = float_mode
+
+    def _on_download_done(self, job_id: int, pdf_path: str) -> None:
+        job = self.download_queue_controller.queue.get(job_id) or {}
+        self._use_downloaded_pdf(job.get("doi"), job.get("title"), pdf_path, self.download_jobs.pop(job_id, None))
+
+    def _use_downloaded_pdf(self, doi: str | None, title: str | None, pdf_path: str, float_mode: bool | None) -> None:
+        """Link the PDF to its article and list it; it is also opened when this section requested it."""
+        if doi:
+            self.article_library.link_pdf(doi, pdf_path)
+        if float_mode is not None:
+            self._open_download_pdf(pdf_path)
+            if float_mode:
+                self._float_notifications(f"Download completed for:\n {title or pdf_path}")
         self._append_article_log("Process completed.")
-        self.file_controller.refresh_toolbox()
+        self.file_controller.add_downloaded_file(pdf_path)
+
+    def _on_download_failed(self, job_id: int, error: str) -> None:
+        if self.download_jobs.pop(job_id, False):
+            self._float_notifications(f"Process Failed for:\n {error}")
 
     def _open_download_pdf(self, pdf_path: str) -> None:
         """Open the downloaded file automatically if enabled."""
@@ -114,10 +194,41 @@ class ArticleController:
         if not isinstance(article_data, dict):
             QMessageBox.critical(self.ui.centralwidget, "Error", "Invalid article data received.")
             return
+        self._show_article(article_data)
+        self.article_library.save(article_data)
+        self._append_article_log("Article metadata fetched successfully!")
+
+    def _show_article(self, article_data: dict) -> None:
         self.article_data = article_data
         TableBuilder.display_article_data(article_data, self.ui.articles_tree_qwidget.invisibleRootItem())
         self.ui.articles_tree_qwidget.expandAll()
-        self._append_article_log("Article metadata fetched successfully!")
+
+    def _handle_article_candidates(self, candidates: list) -> None:
+        """List the runner-up matches of a title search below the selected article."""
+        self.article_candidates = candidates
+        self.candidate_index = 0
+        TableBuilder.add_article_candidates(self.ui.articles_tree_qwidget, candidates[1:])
+
+    def _select_article_candidate(self, item, column: int) -> None:
+        """Use a double-clicked candidate as the article and remember the choice for this title."""
+        root = item.parent()
+        if root is None or root.parent() is not None or root.text(0) != "Other Candidates":
+            return
+        others = [idx for idx in range(len(self.article_candidates)) if idx != self.candidate_index]
+        index = root.indexOfChild(item)
+        if not 0 <= index < len(others):
+            return
+        self.candidate_index = others[index]
+        chosen = TitleMatcher.without_score(self.article_candidates[self.candidate_index])
+        self.ui.articles_tree_qwidget.clear()
+        self._show_article(chosen)
+        self.article_library.save(chosen)
+        TableBuilder.add_article_candidates(self.ui.articles_tree_qwidget,
+                                            [c for idx, c in enumerate(self.article_candidates)
+                                             if idx != self.candidate_index])
+        if self.title_query and self.config_manager.metadata_cache_enabled:
+            MetadataCache().put(MetadataCache.title_key(self.title_query), ArticleRecord.from_dict(chosen))
+        self._append_article_log(f"Selected candidate: {chosen.get('Title', 'N/A')}")
 
     def export_journal_info(self) -> None:
         """ Export the current article's journal information into the database and refresh the tree """
@@ -154,6 +265,7 @@ class ArticleController:
         self.ui.articles_tree_qwidget.clear()
         self.ui.INFO_pltext.clear()
         self.article_data.clear()
+        self.article_candidates = []
 
     def export_with_change_index(self) -> None:
         """ Export the current article's journal information into the database and change to the journals section """
@@ -170,18 +282,28 @@ class ArticleController:
         return text[:max_length]
 
     def check_clipboard_for_doi(self) -> None:
-        """Check if clipboard contains a DOI and autofill the fields."""
-        clipboard_text = self.clipboard.text().strip()
-
-        # DOI regex pattern
-        doi_pattern = r"(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)"
+        """Autofill the fields with the first DOI of the clipboard and prefetch the metadata of all of them."""
+        dois = find_all_dois(self.clipboard.text(), max_chars=CLIPBOARD_SCAN_CHARS, limit=CLIPBOARD_MAX_DOIS)
+        if not dois:
+            return
+        self.ui.article_info_led.setText(dois[0])
+        self.ui.article_float_search_ledit.setText(dois[0])
+        self._prefetch_metadata(dois)
 
-        match = re.search(doi_pattern, clipboard_text)
+    def _prefetch_metadata(self, dois: list[str]) -> None:
+        """Resolve copied DOIs into the metadata cache in the background."""
+        from workers.metadata_prefetch_worker import MetadataPrefetchWorker
 
-        if match:
-            doi = match.group(1)
-            self.ui.article_info_led.setText(doi)
-            self.ui.article_float_search_ledit.setText(doi)
+        if not self.config_manager.metadata_cache_enabled:
+            return
+        dois = [doi for doi in dois if doi not in self.prefetched_dois]
+        if not dois:
+            return
+        self.prefetched_dois.update(dois)
+        worker = MetadataPrefetchWorker(dois)
+        worker.finished.connect(lambda: self.prefetch_workers.remove(worker))
+        self.prefetch_workers.append(worker)
+        worker.start()
 
     def send_to_zotero(self) -> None:
         library_id = self.ui.zotero_library_id_ledit.text().strip()
@@ -201,6 +323,27 @@ class ArticleController:
             QMessageBox.warning(self.ui.centralwidget, "Zotero Error",
                                 f"error: {e}")
 
+    def open_batch_lookup(self) -> None:
+        """Open the batch lookup window for DOI lists, BibTeX and RIS files."""
+        from controllers.batch_lookup_controller import BatchLookupController
+
+        if self.batch_lookup_controller is None:
+            self.batch_lookup_controller = BatchLookupController(self.ui, self.config_manager)
+        self.batch_lookup_controller.show()
+
+    def open_citation_graph(self) -> None:
+        """Open the citation graph window for the current article's DOI."""
+        from controllers.citation_graph_controller import CitationGraphController
+
+        if self.citation_graph_controller is None:
+            self.citation_graph_controller = CitationGraphController(self.ui)
+        doi = self.article_data.get("DOI", "") if self.article_data else ""
+        self.citation_graph_controller.show(doi if doi not in ("", "N/A") else None)
+
+    def open_download_queue(self) -> None:
+        """Open the download queue panel."""
+        self.download_queue_controller.show()
+
     def float_article_downloader(self) -> None:
         try:
             self.search_articles(float_mode = True)
@@ -0,0 +1,92 @@
+import os
+
+import pandas as pd
+from PySide6.QtWidgets import QFileDialog, QMessageBox
+from services.article_library import ArticleLibrary
+from services.rate_limiter import RateLimiter
+from services.reference_parser import ReferenceParser
+from views.batch_lookup_dialog import BatchLookupDialog, BATCH_COLUMNS
+
+
+class BatchLookupController:
+    """Imports reference lists and resolves them concurrently into the batch lookup dialog."""
+
+    def __init__(self, ui, config_manager):
+        self.ui = ui
+        self.config_manager = config_manager
+        self.worker = None
+        self.entries = []
+        self.article_library = ArticleLibrary()
+        self.dialog = BatchLookupDialog(parent=self.ui.centralwidget)
+        self.dialog.import_btn.clicked.connect(self.import_references)
+        self.dialog.start_btn.clicked.connect(self.start_lookup)
+        self.dialog.stop_btn.clicked.connect(self.stop_lookup)
+        self.dialog.export_btn.clicked.connect(self.export_results)
+
+    def show(self) -> None:
+        self.dialog.show()
+        self.dialog.raise_()
+
+    def import_references(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(self.dialog, "Import References", "",
+                                              "References (*.txt *.bib *.ris);;All Files (*)")
+        if not path:
+            return
+        try:
+            self.entries = ReferenceParser.parse_file(path)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Import Error", f"Failed to read references:\n{str(e)}")
+            return
+        self.dialog.load_entries(self.entries)
+        self.dialog.status_label.setText(f"Imported {len(self.entries)} reference(s) from {os.path.basename(path)}.")
+
+    def start_lookup(self) -> None:
+        from workers.batch_lookup_worker import BatchLookupWorker
+
+        if not self.entries:
+            QMessageBox.warning(self.dialog, "Batch Lookup", "Import a reference list first.")
+            return
+        if self.worker and self.worker.isRunning():
+            return
+        self.dialog.load_entries(self.entries)
+        self.worker = BatchLookupWorker(self.entries, max_concurrency=self.dialog.concurrency_spin.value(),
+                                        use_cache=self.config_manager.metadata_cache_enabled)
+        self.worker.result.connect(self.dialog.set_result)
+        self.worker.result.connect(lambda row, article_data: self.article_library.save(article_data))
+        self.worker.failed.connect(self.dialog.set_failed)
+        self.worker.progress.connect(lambda message, count, percent:
+                                     self.dialog.status_label.setText(f"{message} [{percent}%]{self._budget_text()}"))
+        self.worker.finished.connect(lambda: self.dialog.status_label.setText(
+            self.dialog.status_label.text() + " - Batch lookup completed."))
+        self.worker.start()
+
+    @staticmethod
+    def _budget_text() -> str:
+        """Remaining request budget and queue depth of the metadata providers."""
+        parts = [f'{provider}: {state["tokens"]:.0f}/{state["capacity"]} tokens, {state["waiting"]} queued'
+                 + (f', paused {state["paused_for"]:.0f}s' if state["paused_for"] else "")
+                 for provider, state in RateLimiter.status().items()]
+        return " | " + "; ".join(parts) if parts else ""
+
+    def stop_lookup(self) -> None:
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+
+    def export_results(self) -> None:
+        rows = self.dialog.table_rows()
+        if not rows:
+            QMessageBox.warning(self.dialog, "Export Error", "No results to export.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self.dialog, "Save Results", "",
+                                              "Excel Files (*.xlsx);;CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            df = pd.DataFrame(rows, columns=BATCH_COLUMNS)
+            if path.lower().endswith(".csv"):
+                df.to_csv(path, index=False)
+            else:
+                df.to_excel(path, sheet_name="Batch Lookup", index=False, engine="openpyxl")
+            QMessageBox.information(self.dialog, "Export Successful", f"Results exported to: {path}")
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Error", f"Export failed: {str(e)}")
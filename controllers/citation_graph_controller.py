@@ -0,0 +1,51 @@
+from PySide6.QtWidgets import QMessageBox
+from services.file_service import FileService
+from views.citation_graph_dialog import CitationGraphDialog
+
+
+class CitationGraphController:
+    """Expands references/citations of an article and shows which ones are already in the library."""
+
+    def __init__(self, ui):
+        self.ui = ui
+        self.worker = None
+        self.file_service = FileService()
+        self.dialog = CitationGraphDialog(parent=self.ui.centralwidget)
+        self.dialog.expand_btn.clicked.connect(self.expand)
+        self.dialog.stop_btn.clicked.connect(self.stop)
+        self.dialog.table.cellDoubleClicked.connect(self.open_library_pdf)
+
+    def show(self, doi: str | None = None) -> None:
+        if doi:
+            self.dialog.doi_ledit.setText(doi)
+        self.dialog.show()
+        self.dialog.raise_()
+
+    def expand(self) -> None:
+        from workers.citation_graph_worker import CitationGraphWorker
+
+        doi = self.dialog.doi_ledit.text().strip()
+        if not doi:
+            QMessageBox.warning(self.dialog, "Citation Graph", "Enter a DOI first.")
+            return
+        if self.worker and self.worker.isRunning():
+            return
+        self.worker = CitationGraphWorker(doi, direction=self.dialog.direction(),
+                                          depth=self.dialog.depth_spin.value())
+        self.worker.progress.connect(self.dialog.status_label.setText)
+        self.worker.error_occurred.connect(self.dialog.status_label.setText)
+        self.worker.result.connect(self.dialog.show_rows)
+        self.worker.start()
+
+    def stop(self) -> None:
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+
+    def open_library_pdf(self, row: int, column: int) -> None:
+        path = self.dialog.library_path_at(row)
+        if not path:
+            return
+        try:
+            self.file_service.open_file(path)
+        except FileNotFoundError:
+            QMessageBox.warning(self.dialog, "Open Error", f"The file no longer exists:\n{path}")
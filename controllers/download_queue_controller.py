@@ -0,0 +1,97 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+from services.download_pipeline import DownloadPipeline
+from services.download_queue import DownloadQueue
+from services.file_service import FileService
+from services.library_lookup import LibraryLookup
+from services.network_governor import NetworkGovernor
+from views.download_queue_dialog import DownloadQueueDialog
+from workers.download_manager import DownloadManager
+
+# Coalesce bursts of job updates into one table refresh.
+REFRESH_DELAY_MS = 200
+
+
+class DownloadQueueController:
+    """Owns the persistent download queue, the background download manager and the queue panel."""
+
+    def __init__(self, ui, config_manager):
+        self.ui = ui
+        self.config_manager = config_manager
+        self.file_service = FileService()
+        self.queue = DownloadQueue()
+        self.dialog = DownloadQueueDialog(parent=self.ui.centralwidget)
+        self.dialog.bandwidth_spin.setValue(self.config_manager.network_bandwidth_kbps)
+        self.dialog.connections_spin.setValue(self.config_manager.network_max_connections)
+        self.dialog.set_existing_mode(self.config_manager.existing_pdf_mode)
+        pipeline = DownloadPipeline()
+        self.lookup = LibraryLookup(pipeline.catalog, mode=self.dialog.existing_mode())
+        self.manager = DownloadManager(self.queue, max_concurrency=self.dialog.concurrency_spin.value(),
+                                       pipeline=pipeline, lookup=self.lookup)
+
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(REFRESH_DELAY_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.manager.job_changed.connect(self.refresh_timer.start)
+        self.manager.job_progress.connect(self.dialog.set_progress)
+
+        self.dialog.concurrency_spin.valueChanged.connect(self.manager.set_concurrency)
+        self.dialog.pause_all_btn.toggled.connect(self.manager.set_paused)
+        self.dialog.bandwidth_spin.valueChanged.connect(lambda _: self.set_network_limits())
+        self.dialog.connections_spin.valueChanged.connect(lambda _: self.set_network_limits())
+        self.dialog.existing_cbox.currentIndexChanged.connect(lambda _: self.set_existing_mode())
+        self.dialog.pause_btn.clicked.connect(lambda: self._apply(self.queue.pause))
+        self.dialog.resume_btn.clicked.connect(lambda: self._apply(self.queue.resume))
+        self.dialog.cancel_btn.clicked.connect(lambda: self._apply(self.queue.cancel))
+        self.dialog.clear_btn.clicked.connect(lambda: self._apply(lambda ids: self.queue.clear_finished()))
+        self.dialog.table.cellDoubleClicked.connect(self.open_pdf)
+        QApplication.instance().aboutToQuit.connect(self.stop)
+        self.manager.start()
+
+    def show(self) -> None:
+        self.refresh()
+        self.dialog.show()
+        self.dialog.raise_()
+
+    def enqueue(self, doi: str, title: str, destination: str) -> int:
+        job_id = self.queue.enqueue(doi, title, destination)
+        self.manager.wake()
+        self.refresh_timer.start()
+        return job_id
+
+    def find_in_library(self, doi: str, title: str, destination: str) -> str | None:
+        """Path of the article if the library already has it, else None. Only the catalog is searched."""
+        return self.lookup.find(doi, title, destination)
+
+    def needs_placement(self, path: str, destination: str) -> bool:
+        return self.lookup.needs_placement(path, destination)
+
+    def set_existing_mode(self) -> None:
+        self.lookup.set_mode(self.dialog.existing_mode())
+        self.config_manager.set_existing_pdf_mode(self.lookup.mode)
+
+    def refresh(self) -> None:
+        if self.dialog.isVisible():
+            self.dialog.show_jobs(self.queue.jobs())
+
+    def set_network_limits(self) -> None:
+        """Apply the bandwidth and connection limits to running transfers and remember them."""
+        bandwidth_kbps = self.dialog.bandwidth_spin.value()
+        max_connections = self.dialog.connections_spin.value()
+        NetworkGovernor.shared().configure(max_connections=max_connections, max_bandwidth=bandwidth_kbps * 1024)
+        self.config_manager.set_network_limits(bandwidth_kbps, max_connections)
+
+    def stop(self) -> None:
+        self.manager.stop()
+        self.manager.wait()
+
+    def _apply(self, action) -> None:
+        action(self.dialog.selected_job_ids())
+        self.manager.wake()
+        self.refresh()
+
+    def open_pdf(self, row: int, column: int) -> None:
+        path = self.dialog.path_at(row)
+        if path:
+            self.file_service.open_file(path)
@@ -1,7 +1,9 @@
+import logging
 import os
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QAbstractItemView
 from services.file_service import FileService
+from services.library_catalog import LibraryCatalog
 from views.table_builder import TableBuilder
 
 
@@ -11,6 +13,12 @@ class FileController:
         self.config_manager = config_manager
         self.folder_paths = {}
         self.selected_pdfs = []
+        self.catalog = LibraryCatalog()
+        self.scan_worker = None
+        self.duplicate_worker = None
+        self.doi_worker = None
+        # File name searched while a scan runs; answered once the catalog is up to date.
+        self.pending_search = None
 
         self.load_root_folder()
         self.file_service = FileService()
@@ -23,26 +31,32 @@ class FileController:
         self.file_service = FileService(root_folder=self.root_folder)
 
     def refresh_toolbox(self) -> None:
-        """Refresh the toolbox while keeping the currently selected page."""
+        """Refresh the toolbox from the library catalog and rescan the root folder in the background."""
+        root_folder = self.config_manager.root_path
+        if not root_folder or not os.path.isdir(root_folder):
+            self._clear_toolbox()
+            QMessageBox.warning(self.ui.centralwidget, "Warning", "Root folder is not set or invalid.")
+            return
+
+        self.render_toolbox()
+        self.start_library_scan()
+
+    def render_toolbox(self) -> None:
+        """Rebuild the toolbox pages from the catalog while keeping the currently selected page."""
         current_index = self.ui.files_toolbox.currentIndex() if self.ui.files_toolbox.count() > 0 else -1
         current_folder = self.folder_paths.get(current_index, None) if current_index != -1 else None
 
-        while self.ui.files_toolbox.count() > 0:
-            self.ui.files_toolbox.removeItem(0)
-        self.folder_paths.clear()
-
+        self._clear_toolbox()
         root_folder = self.config_manager.root_path
-        if not root_folder or not os.path.isdir(root_folder):
-            QMessageBox.warning(self.ui.centralwidget, "Warning", "Root folder is not set or invalid.")
+        if not root_folder:
             return
 
         processed_folders = set()
         new_index = -1
 
-        for subdir, _, files in os.walk(root_folder):
+        for subdir, pdf_files in self.catalog.fetch_folders(root_folder):
             folder_name = os.path.basename(subdir)
             if folder_name not in processed_folders:
-                pdf_files = [f for f in files if f.lower().endswith(".pdf")]
                 table = TableBuilder.create_pdf_table(
                     folder_path=subdir,
                     pdf_files=pdf_files,
@@ -60,6 +74,49 @@ class FileController:
         if new_index != -1:
             self.ui.files_toolbox.setCurrentIndex(new_index)
 
+    def add_downloaded_file(self, path: str) -> None:
+        """Show a new PDF (already catalogued) in its folder's page instead of rebuilding the whole dock."""
+        folder = os.path.normpath(os.path.dirname(path))
+        for index, folder_path in self.folder_paths.items():
+            if os.path.normpath(folder_path) == folder:
+                TableBuilder.append_pdf_row(self.ui.files_toolbox.widget(index), folder_path,
+                                            os.path.basename(path), self.open_pdf, self.delete_pdf)
+                return
+        self.render_toolbox()
+
+    def _clear_toolbox(self) -> None:
+        while self.ui.files_toolbox.count() > 0:
+            self.ui.files_toolbox.removeItem(0)
+        self.folder_paths.clear()
+
+    def start_library_scan(self) -> None:
+        """Start an incremental catalog scan of the root folder unless one is already running."""
+        from workers.library_scan_worker import LibraryScanWorker
+
+        if self.scan_worker and self.scan_worker.isRunning():
+            return
+        self.scan_worker = LibraryScanWorker(self.config_manager.root_path, db_path=self.catalog.db_path)
+        self.scan_worker.listing_changed.connect(self.render_toolbox)
+        self.scan_worker.error_occurred.connect(logging.error)
+        self.scan_worker.finished.connect(self._on_scan_finished)
+        self.scan_worker.start()
+
+    def _on_scan_finished(self) -> None:
+        if self.pending_search:
+            search_name, self.pending_search = self.pending_search, None
+            self._search_catalog(search_name)
+        self.start_doi_indexing()
+
+    def start_doi_indexing(self) -> None:
+        """Extract the DOIs of newly catalogued PDFs in the background."""
+        from workers.doi_index_worker import DoiIndexWorker
+
+        if self.doi_worker and self.doi_worker.isRunning():
+            return
+        self.doi_worker = DoiIndexWorker(self.config_manager.root_path, db_path=self.catalog.db_path)
+        self.doi_worker.error_occurred.connect(logging.error)
+        self.doi_worker.start()
+
     def open_pdf(self, file_path) -> None:
         """Open the selected PDF file"""
         try:
@@ -77,6 +134,7 @@ class FileController:
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.file_service.delete_file(file_path)
+                self.catalog.remove_file(file_path)
                 QMessageBox.information(self.ui.centralwidget, "Deleted", f"File deleted:\n{file_path}")
                 self.refresh_toolbox()
             except Exception as e:
@@ -127,6 +185,71 @@ class FileController:
         else:
             QMessageBox.warning(self.ui.centralwidget, "Warning", "No folder selected.")
 
+    def find_duplicates(self) -> None:
+        """Search the root folder for exact and near-duplicate PDFs in the background."""
+        from workers.duplicate_worker import DuplicateFinderWorker
+
+        root_folder = self.config_manager.root_path
+        if not root_folder or not os.path.isdir(root_folder):
+            QMessageBox.warning(self.ui.centralwidget, "Warning", "Root folder is not set or invalid.")
+            return
+        if self.duplicate_worker and self.duplicate_worker.isRunning():
+            QMessageBox.information(self.ui.centralwidget, "Duplicates", "A duplicate search is already running.")
+            return
+
+        self.duplicate_worker = DuplicateFinderWorker(root_folder, db_path=self.catalog.db_path)
+        self.duplicate_worker.result.connect(self._show_duplicates)
+        self.duplicate_worker.error_occurred.connect(
+            lambda err: QMessageBox.critical(self.ui.centralwidget, "Duplicates", err))
+        self.duplicate_worker.start()
+
+    def _show_duplicates(self, exact_groups: list, near_groups: list) -> None:
+        from views.duplicates_dialog import DuplicatesDialog
+
+        if not exact_groups and not near_groups:
+            QMessageBox.information(self.ui.centralwidget, "Duplicates", "No duplicate PDFs found.")
+            return
+        dialog = DuplicatesDialog(exact_groups, near_groups, self._resolve_duplicates, parent=self.ui.centralwidget)
+        dialog.exec()
+
+    def _resolve_duplicates(self, action: str, resolutions: list) -> bool:
+        """Apply the chosen action to every duplicate group. Returns True when the dialog can close."""
+        from services.duplicate_finder import DuplicateFinder
+
+        if not resolutions:
+            QMessageBox.warning(self.ui.centralwidget, "Duplicates", "No group has a file selected to keep.")
+            return False
+        count = sum(len(others) for _, others in resolutions)
+        verb = "Delete" if action == "delete" else "Replace with hard links"
+        reply = QMessageBox.question(
+            self.ui.centralwidget, "Resolve Duplicates",
+            f"{verb} {count} duplicate file(s)?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return False
+
+        errors = []
+        resolved = set()
+        for keep, others in resolutions:
+            # A file replaced in an earlier group is neither kept nor resolved again.
+            if keep in resolved:
+                errors.append(f"{keep}: already removed as a duplicate of another group, group skipped")
+                continue
+            try:
+                handled = DuplicateFinder.resolve_group(keep, [p for p in others if p not in resolved], action)
+                resolved.update(handled)
+                if action == "delete":
+                    for path in handled:
+                        self.catalog.remove_file(path)
+            except Exception as e:
+                errors.append(f"{keep}: {str(e)}")
+        if errors:
+            QMessageBox.critical(self.ui.centralwidget, "Error", "Some duplicates could not be resolved:\n" +
+                                 "\n".join(errors))
+        self.refresh_toolbox()
+        return True
+
     def get_download_path(self) -> str:
         """ Returns the path to use for downloading an article. """
         if self.ui.navigation_mode_cbox.isChecked():
@@ -159,9 +282,11 @@ class FileController:
             index = self.ui.files_toolbox.currentIndex()
             folder = self.folder_paths.get(index, "")
             if folder:
-                self.selected_pdfs = [os.path.join(folder, f)
-                                      for f in os.listdir(folder)
-                                      if f.lower().endswith(".pdf")]
+                self.selected_pdfs = self.catalog.fetch_pdf_paths(folder)
+                if not self.selected_pdfs and os.path.isdir(folder):
+                    self.selected_pdfs = [os.path.join(folder, f)
+                                          for f in os.listdir(folder)
+                                          if f.lower().endswith(".pdf")]
             else:
                 self.ui.pdf_ptext.appendPlainText("No folder selected in the toolbox.")
                 self.selected_pdfs = []
@@ -197,7 +322,13 @@ class FileController:
         if not search_name:
             QMessageBox.warning(self.ui.centralwidget, "Search Error", "Enter a file name to search.")
             return
+        if self.scan_worker and self.scan_worker.isRunning():
+            # The catalog may miss files added since the last scan: search when the scan is done.
+            self.pending_search = search_name
+            return
+        self._search_catalog(search_name)
 
+    def _search_catalog(self, search_name: str) -> None:
         search_folder = self.config_manager.root_path
         if self.ui.navigation_mode_cbox.isChecked():
             index = self.ui.files_toolbox.currentIndex()
@@ -207,11 +338,11 @@ class FileController:
             QMessageBox.warning(self.ui.centralwidget, "Search Error", "Invalid search folder.")
             return
 
-        found_files = []
-        for root, _, files in os.walk(search_folder):
-            for file in files:
-                if search_name.lower() in file.lower() and file.endswith(".pdf"):
-                    found_files.append((root, file))
+        if self.ui.search_text_cbox.isChecked():
+            # Only PDFs that went through the download pipeline have their text indexed.
+            found_files = self.catalog.search_text(search_folder, search_name)
+        else:
+            found_files = self.catalog.search_by_name(search_folder, search_name)
 
         if found_files:
             self._highlight_matching_rows(found_files)
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import QMainWindow, QApplication
 from PySide6.QtCore import QTimer
 from services.config_manager import ConfigManager
 from services.file_service import FileService
+from services.network_governor import NetworkGovernor
 from views.MainUI import Ui_MainWindow
 
 
@@ -19,6 +20,9 @@ class MainWindow(QMainWindow):
         self.config_manager = ConfigManager()
         self.config_manager.load_config()
         self.file_service = FileService()
+        NetworkGovernor.shared().configure(max_connections=self.config_manager.network_max_connections,
+                                           max_bandwidth=self.config_manager.network_bandwidth_kbps * 1024,
+                                           shares=self.config_manager.network_shares)
 
 
         # Delay imports to avoid circular dependencies
@@ -70,6 +74,7 @@ class MainWindow(QMainWindow):
 
         # File operations
         self.ui.refrech_toolbox_btn.clicked.connect(self.file_controller.refresh_toolbox)
+        self.ui.find_duplicates_btn.clicked.connect(self.file_controller.find_duplicates)
         self.ui.open_directory_btn.clicked.connect(self.file_controller.open_directory)
         self.ui.delete_directory_btn.clicked.connect(self.file_controller.delete_directory)
         self.ui.create_file_btn.clicked.connect(self.file_controller.create_folder)
@@ -82,7 +87,10 @@ class MainWindow(QMainWindow):
 
         # Articles section :
         self.ui.article_search_btn.clicked.connect(self.article_controller.search_articles)
+        self.ui.batch_lookup_btn.clicked.connect(self.article_controller.open_batch_lookup)
+        self.ui.citation_graph_btn.clicked.connect(self.article_controller.open_citation_graph)
         self.ui.article_download_btn.clicked.connect(self.article_controller.download_article_pdf)
+        self.ui.download_queue_btn.clicked.connect(self.article_controller.open_download_queue)
         self.ui.export_journal_info_btn.clicked.connect(self.article_controller.export_with_change_index)
         self.ui.articles_downloader_mode_btn.toggled.connect(self.float_downloader)
         self.ui.article_info_led.textEdited.connect(lambda : self.article_controller.clear_article_results() if not self.ui.journal_info_led.text().strip() else None)
@@ -1,15 +1,23 @@
 from PySide6.QtWidgets import QMessageBox
 from pyzotero import zotero
+from services.article_record import ArticleRecord
+from workers.zotero_worker import ZoteroUploadWorker
 
 class ZoteroController:
     def __init__(self, ui, config_manager):
         self.ui = ui
         self.config_manager = config_manager
+        self._clients = {}
+        self.worker = None
 
     def add_to_zotero(self, article_data,library_id,library_type, api_key ) -> None:
-        """Add the current article to Zotero using saved credentials."""
+        """Add the current article to Zotero using saved credentials; the upload runs in a worker."""
+        if self.worker and self.worker.isRunning():
+            QMessageBox.information(self.ui.centralwidget, "Zotero", "Zotero is busy with the previous article, "
+                                                                     "try again in a moment.")
+            return
         # Connect to Zotero
-        zot = zotero.Zotero(library_id, library_type, api_key)
+        zot = self._get_client(library_id, library_type, api_key)
 
         # Get article metadata
         if not article_data:
@@ -18,7 +26,6 @@ class ZoteroController:
 
         doi = article_data.get("DOI", "").strip()
         title = article_data.get("Title", "Unknown Title").strip()
-        authors = article_data.get("Authors", [])
         journal = article_data.get("Journal", "Unknown Journal").strip()
 
         if not doi:
@@ -28,17 +35,24 @@ class ZoteroController:
         item = {
             "itemType": "journalArticle",
             "title": title,
-            "creators": [{"creatorType": "author", "lastName": a.split(",")[0], "firstName": a.split(",")[-1]} for a in
-                         authors],
+            "creators": ArticleRecord.from_dict(article_data).zotero_creators(),
             "publicationTitle": journal,
             "DOI": doi
         }
 
-        try:
-            zot.create_items([item])
-            QMessageBox.information(self.ui.centralwidget, "Success", f"Article '{title}' added to Zotero.")
-        except Exception as e:
-            QMessageBox.critical(self.ui.centralwidget, "Zotero Error", f"Failed to add article to Zotero:\n{e}")
+        self.worker = ZoteroUploadWorker(zot, item)
+        self.worker.uploaded.connect(lambda uploaded_title: QMessageBox.information(
+            self.ui.centralwidget, "Success", f"Article '{uploaded_title}' added to Zotero."))
+        self.worker.error.connect(lambda err: QMessageBox.critical(
+            self.ui.centralwidget, "Zotero Error", f"Failed to add article to Zotero:\n{err}"))
+        self.worker.start()
+
+    def _get_client(self, library_id, library_type, api_key) -> zotero.Zotero:
+        """Reuse one Zotero client (and its open connections) per set of credentials."""
+        key = (library_id, library_type, api_key)
+        if key not in self._clients:
+            self._clients[key] = zotero.Zotero(library_id, library_type, api_key)
+        return self._clients[key]
 
     def load_zotero_credentials(self) -> None:
         """Load Zotero credentials into UI fields if available, else highlight missing fields."""
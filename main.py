@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 import traceback
 from PySide6.QtWidgets import QApplication
 from controllers.main_controller import MainWindow
@@ -6,6 +7,8 @@ from controllers.main_controller import MainWindow
 
 
 def main():
+    # Worker pools spawn processes; required when running from a frozen executable.
+    multiprocessing.freeze_support()
     try:
         app = QApplication(sys.argv)
         window = MainWindow()
@@ -0,0 +1,140 @@
+import json
+import re
+import sqlite3
+import time
+from sqlite3 import Connection
+from typing import Any
+
+from services.doi_utils import normalize_doi
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+class ArticleLibrary:
+    """
+    Every article fetched by the application, kept in SQLite with an FTS5 index over title, authors and journal,
+    so earlier results can be searched offline and reused for export, Zotero and downloads.
+    """
+
+    def __init__(self, db_path="articles.db"):
+        self.db_path = db_path
+        self._create_tables()
+
+    def _get_connection(self) -> Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_tables(self):
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                doi TEXT PRIMARY KEY,
+                title TEXT,
+                authors TEXT,
+                year TEXT,
+                journal TEXT,
+                issn TEXT,
+                open_access TEXT,
+                source TEXT,
+                pdf_path TEXT,
+                data TEXT,
+                fetched_at REAL
+            )
+        ''')
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts
+            USING fts5(title, authors, journal, content='articles', content_rowid='rowid')
+        ''')
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts (rowid, title, authors, journal)
+                VALUES (new.rowid, new.title, new.authors, new.journal);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, authors, journal)
+                VALUES ('delete', old.rowid, old.title, old.authors, old.journal);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, authors, journal)
+                VALUES ('delete', old.rowid, old.title, old.authors, old.journal);
+                INSERT INTO articles_fts (rowid, title, authors, journal)
+                VALUES (new.rowid, new.title, new.authors, new.journal);
+            END;
+        ''')
+        conn.commit()
+        conn.close()
+
+    def save(self, article_data: dict[str, Any]) -> None:
+        """Insert or refresh an article; articles without a DOI are not kept. An existing PDF link is preserved."""
+        doi = article_data.get("DOI")
+        if not doi or doi == "N/A":
+            return
+        published = article_data.get("Published Date")
+        if isinstance(published, list):
+            published = published[0] if published else None
+        data = {key: value for key, value in article_data.items() if key not in ("Match Score", "PDF Path")}
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO articles (doi, title, authors, year, journal, issn, open_access, source, data, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(doi) DO UPDATE SET title = excluded.title, authors = excluded.authors, year = excluded.year,
+                journal = excluded.journal, issn = excluded.issn, open_access = excluded.open_access,
+                source = excluded.source, data = excluded.data, fetched_at = excluded.fetched_at
+        ''', (
+            normalize_doi(doi),
+            article_data.get("Title"),
+            "; ".join(str(author) for author in article_data.get("Authors") or []),
+            str(published) if published not in (None, "N/A") else None,
+            article_data.get("Journal"),
+            article_data.get("ISSN"),
+            article_data.get("Open Access"),
+            article_data.get("Source"),
+            json.dumps(data),
+            time.time(),
+        ))
+        conn.commit()
+        conn.close()
+
+    def link_pdf(self, doi: str, pdf_path: str) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("UPDATE articles SET pdf_path = ? WHERE doi = ?", (pdf_path, normalize_doi(doi)))
+        conn.commit()
+        conn.close()
+
+    def get(self, doi: str) -> dict[str, Any] | None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT data, pdf_path FROM articles WHERE doi = ?", (normalize_doi(doi),))
+        row = cursor.fetchone()
+        conn.close()
+        return self._to_article(row) if row else None
+
+    def search(self, text: str, limit: int = 50) -> list[dict[str, Any]]:
+        """Prefix search over title, authors and journal, best matches first; a DOI returns that article."""
+        if text.strip().startswith("10.") or "doi.org/" in text:
+            article = self.get(text)
+            return [article] if article else []
+        tokens = _SEARCH_TOKEN.findall(text.lower())
+        if not tokens:
+            return []
+        query = " ".join(f'"{token}"*' for token in tokens)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT a.data, a.pdf_path FROM articles_fts
+            JOIN articles a ON a.rowid = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+            ORDER BY bm25(articles_fts) LIMIT ?
+        ''', (query, limit))
+        rows = cursor.fetchall()
+        conn.close()
+        return [self._to_article(row) for row in rows]
+
+    @staticmethod
+    def _to_article(row: tuple) -> dict[str, Any]:
+        article = json.loads(row[0])
+        if row[1]:
+            article["PDF Path"] = row[1]
+        return article
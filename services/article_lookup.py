@@ -0,0 +1,98 @@
+import os
+from services.article_record import ArticleRecord
+from services.metadata_cache import MetadataCache
+from services.metadata_providers import ProviderRouter, merge_results
+from services.offline_metadata import OfflineMetadataStore, OFFLINE_METADATA_DB
+from services.title_matcher import TitleMatcher
+
+# Hits requested from each source for a title query before local re-ranking.
+TITLE_CANDIDATES = 5
+
+
+class ArticleLookup:
+    """
+    Resolves one DOI or title from the metadata cache, the offline snapshot or the online providers.
+    Plain object, so worker threads and thread pools can run lookups without creating Qt objects.
+    """
+
+    def __init__(self, article_doi=None, article_title=None, use_cache=True, offline_db=OFFLINE_METADATA_DB):
+        self.article_doi = article_doi
+        self.article_title = article_title
+        self.use_cache = use_cache
+        self.offline_db = offline_db
+        self.lookup_errors = []
+        self.title_candidates = []
+
+    def search(self) -> ArticleRecord | None:
+        cache = MetadataCache() if self.use_cache else None
+        cache_key = self._cache_key()
+        if cache and cache_key:
+            found, res = cache.get(cache_key)
+            if found:
+                return res
+
+        if self.article_doi:
+            res = self._fetch_from_offline_store() or ProviderRouter.shared().lookup_doi(
+                self.article_doi, on_error=self._record_failure)
+        else:
+            self.title_candidates = self._rank_title_candidates()
+            res = self.title_candidates[0][0] if self.title_candidates else None
+
+        # Misses are only cached when every provider answered; network failures are retried next time.
+        if cache and cache_key and (res or not self.lookup_errors):
+            cache.put(cache_key, res)
+            # A title lookup also answers later lookups of the DOI it resolved to.
+            if res and not self.article_doi and res.doi:
+                cache.put(MetadataCache.doi_key(res.doi), res)
+        return res
+
+    def _rank_title_candidates(self) -> list[tuple[ArticleRecord, float]]:
+        """
+        Collect TITLE_CANDIDATES hits from the offline snapshot, or else from the best-performing online
+        providers, and re-rank them locally, best match first.
+        """
+        if not self.article_title:
+            return []
+        candidates = self._offline_title_candidates() or ProviderRouter.shared().search_title(
+            self.article_title, TITLE_CANDIDATES, on_error=self._record_failure)
+        return TitleMatcher.rank(self.article_title, candidates, merge=merge_results)
+
+    def _record_failure(self, error: Exception) -> None:
+        """Remember provider failures other than the article not being found."""
+        response = getattr(error, "response", None)
+        if "NotFound" in type(error).__name__ or getattr(response, "status_code", None) == 404:
+            return
+        self.lookup_errors.append(error)
+
+    def _cache_key(self) -> str | None:
+        if self.article_doi:
+            return MetadataCache.doi_key(self.article_doi)
+        if self.article_title:
+            return MetadataCache.title_key(self.article_title)
+        return None
+
+    def _fetch_from_offline_store(self) -> ArticleRecord | None:
+        """Answer a DOI query from the imported Crossref/OpenAlex snapshot, if one exists."""
+        if not self.offline_db or not os.path.exists(self.offline_db):
+            return None
+        try:
+            store = OfflineMetadataStore(self.offline_db)
+            return store.find_by_doi(self.article_doi) if self.article_doi else None
+        except Exception as e:
+            self._record_failure(e)
+        return None
+
+    def _offline_title_candidates(self) -> list[ArticleRecord]:
+        if not self.offline_db or not os.path.exists(self.offline_db):
+            return []
+        try:
+            return OfflineMetadataStore(self.offline_db).find_by_title(self.article_title, limit=TITLE_CANDIDATES)
+        except Exception as e:
+            self._record_failure(e)
+            return []
+
+
+def lookup_article(doi: str | None = None, title: str | None = None, use_cache: bool = True,
+                   offline_db: str = OFFLINE_METADATA_DB) -> ArticleRecord | None:
+    """Resolve a DOI, or else a title, to its best ArticleRecord (stored in the metadata cache when enabled)."""
+    return ArticleLookup(doi, title if not doi else None, use_cache, offline_db).search()
@@ -0,0 +1,221 @@
+import marshal
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# Bumped whenever the field layout of ArticleRecord.to_bytes changes.
+RECORD_VERSION = 1
+
+
+def _text(value) -> str | None:
+    if value in (None, "", "N/A"):
+        return None
+    return str(value).strip() or None
+
+
+def _first(values) -> str | None:
+    if isinstance(values, (list, tuple)):
+        return _text(values[0]) if values else None
+    return _text(values)
+
+
+def _date_parts(value) -> tuple[int, ...]:
+    if isinstance(value, (list, tuple)):
+        parts = []
+        for part in value:
+            if isinstance(part, (list, tuple)):
+                return _date_parts(part)
+            if isinstance(part, int) or (isinstance(part, str) and part.isdigit()):
+                parts.append(int(part))
+            else:
+                break
+        return tuple(parts)
+    if isinstance(value, int):
+        return (value,)
+    if isinstance(value, str) and value[:4].isdigit():
+        return tuple(int(part) for part in value.split("-") if part.isdigit())
+    return ()
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a display name ("Ada B Lovelace") into (family, given)."""
+    given, _, family = (name or "").strip().rpartition(" ")
+    return (family, given) if family else (given, "")
+
+
+@dataclass(slots=True)
+class ArticleRecord:
+    """
+    Typed article metadata shared by every provider. Missing values are None instead of "N/A",
+    authors are (family, given) pairs and the publication date is a tuple of ints (year, month, day).
+    """
+    title: str | None = None
+    authors: tuple[tuple[str, str], ...] = ()
+    published: tuple[int, ...] = ()
+    publisher: str | None = None
+    doi: str | None = None
+    journal: str | None = None
+    issn: str | None = None
+    url: str | None = None
+    open_access: bool | None = None
+    citation_count: int | None = None
+    source: str | None = None
+
+    @property
+    def year(self) -> int | None:
+        return self.published[0] if self.published else None
+
+    @classmethod
+    def from_semantic_scholar(cls, meta: dict) -> "ArticleRecord":
+        journal = meta.get("journal") or {}
+        return cls(
+            title=_text(meta.get("title")),
+            authors=tuple(_split_name(a.get("name", "")) for a in meta.get("authors") or [] if a.get("name")),
+            published=_date_parts(meta.get("publicationDate") or meta.get("year")),
+            doi=_text((meta.get("externalIds") or {}).get("DOI")),
+            journal=_text(journal.get("name")),
+            issn=_text(journal.get("issn")),
+            url=_text(meta.get("url")),
+            open_access=bool(meta.get("isOpenAccess", False)),
+            citation_count=meta.get("citationCount"),
+            source="Semantic Scholar",
+        )
+
+    @classmethod
+    def from_crossref(cls, meta: dict) -> "ArticleRecord":
+        return cls(
+            title=_first(meta.get("title")),
+            authors=tuple((a.get("family", ""), a.get("given", "")) for a in meta.get("author", [])),
+            published=_date_parts((meta.get("published-print") or {}).get("date-parts")),
+            publisher=_text(meta.get("publisher")),
+            doi=_text(meta.get("DOI")),
+            journal=_first(meta.get("container-title")),
+            issn=_first(meta.get("ISSN")),
+            url=_text(meta.get("URL")),
+            open_access=bool(meta.get("license")),
+            source="CrossRef",
+        )
+
+    @classmethod
+    def from_openalex(cls, work: dict) -> "ArticleRecord":
+        location = work.get("primary_location") or {}
+        source = location.get("source") or {}
+        doi = _text(work.get("doi"))
+        return cls(
+            title=_text(work.get("title") or work.get("display_name")),
+            authors=tuple(_split_name((a.get("author") or {}).get("display_name", ""))
+                          for a in work.get("authorships") or [] if (a.get("author") or {}).get("display_name")),
+            published=_date_parts(work.get("publication_date") or work.get("publication_year")),
+            publisher=_text(source.get("host_organization_name")),
+            doi=doi.split("doi.org/", 1)[-1] if doi else None,
+            journal=_text(source.get("display_name")),
+            issn=_text(source.get("issn_l")) or _first(source.get("issn")),
+            url=_text(location.get("landing_page_url")),
+            open_access=bool((work.get("open_access") or {}).get("is_oa")),
+            citation_count=work.get("cited_by_count"),
+            source="OpenAlex",
+        )
+
+    @classmethod
+    def from_pubmed(cls, summary: dict) -> "ArticleRecord":
+        """Read an E-utilities esummary document; PubMed names are "Family Initials"."""
+        authors = []
+        for author in summary.get("authors") or []:
+            if author.get("authtype", "Author") == "Author" and author.get("name"):
+                family, _, given = author["name"].rpartition(" ")
+                authors.append((family, given) if family else (given, ""))
+        doi = next((a.get("value") for a in summary.get("articleids") or [] if a.get("idtype") == "doi"), None)
+        uid = summary.get("uid")
+        return cls(
+            title=_text((summary.get("title") or "").rstrip(".")),
+            authors=tuple(authors),
+            published=_date_parts((summary.get("sortpubdate") or "")[:10].replace("/", "-")),
+            doi=_text(doi),
+            journal=_text(summary.get("fulljournalname") or summary.get("source")),
+            issn=_text(summary.get("issn")) or _text(summary.get("essn")),
+            url=f"https://pubmed.ncbi.nlm.nih.gov/{uid}/" if uid else None,
+            source="PubMed",
+        )
+
+    @classmethod
+    def from_arxiv(cls, entry: dict) -> "ArticleRecord":
+        """Read an arXiv Atom entry already flattened to {"id", "title", "authors", "published", "doi", ...}."""
+        arxiv_id = (entry.get("id") or "").rsplit("/abs/", 1)[-1]
+        # Only a trailing version is dropped; old-style categories (e.g. solv-int/9901001v1) contain a "v".
+        base_id = re.sub(r"v\d+$", "", arxiv_id) if arxiv_id else None
+        return cls(
+            title=_text(" ".join((entry.get("title") or "").split())),
+            authors=tuple(_split_name(name) for name in entry.get("authors") or []),
+            published=_date_parts((entry.get("published") or "")[:10]),
+            publisher="arXiv",
+            doi=_text(entry.get("doi")) or (f"10.48550/arXiv.{base_id}" if base_id else None),
+            journal=_text(entry.get("journal_ref")) or "arXiv",
+            url=_text(entry.get("id")),
+            open_access=True,
+            source="arXiv",
+        )
+
+    @classmethod
+    def from_dict(cls, article_data: dict[str, Any]) -> "ArticleRecord":
+        """Read the display dict produced by to_dict (also found in older caches and saved articles)."""
+        authors = []
+        for author in article_data.get("Authors") or []:
+            if isinstance(author, (list, tuple)):
+                authors.append((str(author[0]), str(author[1]) if len(author) > 1 else ""))
+            elif "," in str(author):
+                family, _, given = str(author).partition(",")
+                authors.append((family.strip(), given.strip()))
+            else:
+                authors.append(_split_name(str(author)))
+        open_access = article_data.get("Open Access")
+        citation_count = article_data.get("Impact Factor")
+        return cls(
+            title=_text(article_data.get("Title")),
+            authors=tuple(authors),
+            published=_date_parts(article_data.get("Published Date")),
+            publisher=_text(article_data.get("Publisher")),
+            doi=_text(article_data.get("DOI")),
+            journal=_text(article_data.get("Journal")),
+            issn=_text(article_data.get("ISSN")),
+            url=_text(article_data.get("Article URL")),
+            open_access=None if open_access in (None, "", "N/A") else open_access == "Yes",
+            citation_count=citation_count if isinstance(citation_count, int) else None,
+            source=_text(article_data.get("Source")),
+        )
+
+    def to_dict(self) -> dict[str, str | list[Any] | Any]:
+        """The dict shown in the article tree and used for export; missing values become "N/A"."""
+        return {
+            "Title": self.title or "N/A",
+            "Authors": [f"{family}, {given}" if given else family for family, given in self.authors],
+            "Published Date": list(self.published) or ["N/A"],
+            "Publisher": self.publisher or "N/A",
+            "DOI": self.doi or "N/A",
+            "Journal": self.journal or "N/A",
+            "ISSN": self.issn or "N/A",
+            "Article URL": self.url or "N/A",
+            "Open Access": "N/A" if self.open_access is None else ("Yes" if self.open_access else "No"),
+            "Impact Factor": "N/A" if self.citation_count is None else self.citation_count,
+            "Source": self.source or "N/A",
+        }
+
+    def zotero_creators(self) -> list[dict[str, str]]:
+        creators = []
+        for family, given in self.authors:
+            if given:
+                creators.append({"creatorType": "author", "lastName": family, "firstName": given})
+            else:
+                creators.append({"creatorType": "author", "name": family})
+        return creators
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form for the cache and inter-process transfers (marshal of plain tuples)."""
+        return marshal.dumps((RECORD_VERSION, self.title, self.authors, self.published, self.publisher, self.doi,
+                              self.journal, self.issn, self.url, self.open_access, self.citation_count, self.source))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "ArticleRecord":
+        version, *fields = marshal.loads(payload)
+        if version != RECORD_VERSION:
+            raise ValueError(f"Unsupported article record version: {version}")
+        return cls(*fields)
@@ -0,0 +1,148 @@
+import sqlite3
+import time
+from sqlite3 import Connection
+
+from services.doi_utils import normalize_doi
+
+REFERENCES = "references"
+CITATIONS = "citations"
+
+DAY = 24 * 60 * 60
+# Time after which the neighbours of a paper are fetched again; references rarely change, citations grow.
+FETCHED_TTLS = {
+    REFERENCES: 90 * DAY,
+    CITATIONS: 7 * DAY,
+}
+
+
+class CitationGraph:
+    """
+    SQLite store of papers and citation edges (citing -> cited). Papers are keyed by normalized DOI,
+    or by "s2:<paperId>" when Semantic Scholar knows no DOI for them.
+    """
+
+    def __init__(self, db_path="citation_graph.db"):
+        self.db_path = db_path
+        self._create_tables()
+
+    def _get_connection(self) -> Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_tables(self):
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS papers (
+                paper_key TEXT PRIMARY KEY,
+                title TEXT,
+                year INTEGER,
+                references_fetched_at REAL,
+                citations_fetched_at REAL,
+                references_truncated INTEGER,
+                citations_truncated INTEGER
+            )
+        ''')
+        # Graphs stored before truncation was recorded lack these columns.
+        cursor.execute("PRAGMA table_info(papers)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for direction in (REFERENCES, CITATIONS):
+            if f"{direction}_truncated" not in columns:
+                cursor.execute(f"ALTER TABLE papers ADD COLUMN {direction}_truncated INTEGER")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS edges (
+                citing TEXT,
+                cited TEXT,
+                PRIMARY KEY (citing, cited)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_cited ON edges (cited)")
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def paper_key(doi: str | None = None, paper_id: str | None = None) -> str | None:
+        if doi:
+            return normalize_doi(doi)
+        return f"s2:{paper_id}" if paper_id else None
+
+    def save_neighbours(self, paper_key: str, direction: str, neighbours: list[dict], truncated: bool = False) -> None:
+        """
+        Store the references or citations of a paper, replacing the ones fetched before, and mark that
+        direction as fetched, or as truncated when the list was cut short.
+        Each neighbour is {"key": ..., "title": ..., "year": ...}.
+        """
+        column = self._fetched_column(direction)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT INTO papers (paper_key, title, year) VALUES (?, ?, ?)
+            ON CONFLICT(paper_key) DO UPDATE SET title = COALESCE(excluded.title, title),
+                                                 year = COALESCE(excluded.year, year)
+        ''', [(n["key"], n.get("title"), n.get("year")) for n in neighbours])
+        edges = [(paper_key, n["key"]) if direction == REFERENCES else (n["key"], paper_key) for n in neighbours]
+        cursor.execute(f"DELETE FROM edges WHERE {'citing' if direction == REFERENCES else 'cited'} = ?",
+                       (paper_key,))
+        cursor.executemany("INSERT OR IGNORE INTO edges (citing, cited) VALUES (?, ?)", edges)
+        cursor.execute(f'''
+            INSERT INTO papers (paper_key, {column}, {direction}_truncated) VALUES (?, ?, ?)
+            ON CONFLICT(paper_key) DO UPDATE SET {column} = excluded.{column},
+                                                 {direction}_truncated = excluded.{direction}_truncated
+        ''', (paper_key, time.time(), 1 if truncated else 0))
+        conn.commit()
+        conn.close()
+
+    def unexpanded(self, paper_keys: list[str], direction: str) -> list[str]:
+        """
+        Return the papers whose references (or citations) have not been fetched yet, were cut short,
+        or were fetched longer than FETCHED_TTLS ago.
+        """
+        column = self._fetched_column(direction)
+        fresh_since = time.time() - FETCHED_TTLS[direction]
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        expanded = set()
+        for start in range(0, len(paper_keys), 500):
+            chunk = paper_keys[start:start + 500]
+            cursor.execute(f'''
+                SELECT paper_key FROM papers
+                WHERE {column} > ? AND NOT COALESCE({direction}_truncated, 0)
+                  AND paper_key IN ({", ".join("?" for _ in chunk)})
+            ''', [fresh_since] + chunk)
+            expanded.update(row[0] for row in cursor.fetchall())
+        conn.close()
+        return [key for key in paper_keys if key not in expanded]
+
+    def neighbours(self, paper_keys: list[str], direction: str) -> dict[str, list[str]]:
+        """Return {paper: [referenced or citing papers]} from the stored edges."""
+        source, target = ("citing", "cited") if direction == REFERENCES else ("cited", "citing")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        result = {key: [] for key in paper_keys}
+        for start in range(0, len(paper_keys), 500):
+            chunk = paper_keys[start:start + 500]
+            cursor.execute(f'''
+                SELECT {source}, {target} FROM edges WHERE {source} IN ({", ".join("?" for _ in chunk)})
+            ''', chunk)
+            for key, neighbour in cursor.fetchall():
+                result[key].append(neighbour)
+        conn.close()
+        return result
+
+    def get_papers(self, paper_keys: list[str]) -> dict[str, dict]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        papers = {}
+        for start in range(0, len(paper_keys), 500):
+            chunk = paper_keys[start:start + 500]
+            cursor.execute(f'''
+                SELECT paper_key, title, year FROM papers WHERE paper_key IN ({", ".join("?" for _ in chunk)})
+            ''', chunk)
+            papers.update({key: {"title": title, "year": year} for key, title, year in cursor.fetchall()})
+        conn.close()
+        return papers
+
+    @staticmethod
+    def _fetched_column(direction: str) -> str:
+        if direction not in (REFERENCES, CITATIONS):
+            raise ValueError(f"Unknown citation direction: {direction}")
+        return f"{direction}_fetched_at"
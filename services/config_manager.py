@@ -10,6 +10,15 @@ class ConfigManager:
         self.config_file = self.resource_path(config_file)
         self.root_path = None
         self.last_selected_text = "en_US"
+        self.metadata_cache_enabled = True
+
+        # Network governor: 0 KB/s leaves the bandwidth unlimited; shares override the default category shares.
+        self.network_bandwidth_kbps = 0
+        self.network_max_connections = 24
+        self.network_shares = {}
+
+        # Downloads of articles already in the library: "use", "copy" or "link" the existing PDF.
+        self.existing_pdf_mode = "use"
 
         # Zotero Credentials
         self.library_id = None
@@ -46,6 +55,13 @@ class ConfigManager:
                     # theme changes
                     self.theme = config.get("theme", "")
 
+                    # network lookups
+                    self.metadata_cache_enabled = config.get("metadata_cache_enabled", True)
+                    self.network_bandwidth_kbps = config.get("network_bandwidth_kbps", 0)
+                    self.network_max_connections = config.get("network_max_connections", 24)
+                    self.network_shares = config.get("network_shares", {})
+                    self.existing_pdf_mode = config.get("existing_pdf_mode", "use")
+
 
         except Exception as e:
             logging.error(f"Failed to load config: {e}")
@@ -60,7 +76,12 @@ class ConfigManager:
                     "library_id": self.library_id,
                     "library_type": self.library_type,
                     "api_key": self.api_key,
-                    "theme": self.theme
+                    "theme": self.theme,
+                    "metadata_cache_enabled": self.metadata_cache_enabled,
+                    "network_bandwidth_kbps": self.network_bandwidth_kbps,
+                    "network_max_connections": self.network_max_connections,
+                    "network_shares": self.network_shares,
+                    "existing_pdf_mode": self.existing_pdf_mode
                 }, f, indent=6)
         except Exception as e:
             logging.error(f"Failed to save config: {e}")
@@ -78,6 +99,17 @@ class ConfigManager:
         self.save_config()
 
 
+    def set_network_limits(self, bandwidth_kbps, max_connections) -> None:
+        """Set and save the bandwidth (KB/s, 0 for unlimited) and connection limits of the network governor"""
+        self.network_bandwidth_kbps = bandwidth_kbps
+        self.network_max_connections = max_connections
+        self.save_config()
+
+    def set_existing_pdf_mode(self, mode) -> None:
+        """Set and save what a download does when the article is already in the library"""
+        self.existing_pdf_mode = mode
+        self.save_config()
+
     def set_theme(self, text) -> None:
         """Save last selected ComboBox item"""
         self.theme = text
@@ -0,0 +1,62 @@
+import re
+
+# DOI regex pattern shared by the clipboard watcher and the library scanners
+DOI_PATTERN = re.compile(r"(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)")
+
+
+def find_doi(text: str) -> str | None:
+    """Return the first DOI found in the text, or None."""
+    if not text:
+        return None
+    match = DOI_PATTERN.search(text)
+    return match.group(1).rstrip(".;,") if match else None
+
+
+def find_all_dois(text: str, max_chars: int | None = None, limit: int | None = None) -> list[str]:
+    """
+    Return the distinct normalized DOIs of the text in order of appearance.
+    Only the first max_chars characters are scanned and at most limit DOIs are returned.
+    """
+    if not text:
+        return []
+    if max_chars and len(text) > max_chars:
+        # Cut at a word boundary so the scan does not end in the middle of a DOI.
+        parts = text[:max_chars].rsplit(None, 1)
+        text = parts[0] if parts else ""
+    dois = {}
+    for match in DOI_PATTERN.finditer(text):
+        dois.setdefault(normalize_doi(match.group(1).rstrip(".;,")), None)
+        if limit and len(dois) >= limit:
+            break
+    return list(dois)
+
+
+def normalize_doi(doi: str) -> str:
+    """Lower-case a DOI and strip resolver prefixes so it can be used as a lookup key."""
+    doi = (doi or "").strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+    return doi.strip()
+
+
+def extract_pdf_doi(path: str, max_pages: int = 2) -> tuple[str | None, str | None]:
+    """
+    Look for the DOI of a PDF in its info dictionary, its XMP packet and the text of its first pages.
+    Returns (normalized doi, where it was found) or (None, None).
+    """
+    import fitz
+
+    with fitz.open(path) as doc:
+        metadata = doc.metadata or {}
+        doi = find_doi(" ".join(str(metadata.get(key) or "") for key in ("subject", "keywords", "title")))
+        if doi:
+            return normalize_doi(doi), "metadata"
+        doi = find_doi(doc.get_xml_metadata() or "")
+        if doi:
+            return normalize_doi(doi), "xmp"
+        for page_num in range(min(doc.page_count, max_pages)):
+            doi = find_doi(doc[page_num].get_text("text"))
+            if doi:
+                return normalize_doi(doi), f"page {page_num + 1}"
+    return None, None
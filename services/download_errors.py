@@ -0,0 +1,84 @@
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempts allowed for one error class within a download, and the full-jitter backoff between them."""
+    max_attempts: int
+    base_delay: float = 0.0
+    max_delay: float = 0.0
+
+    def delay(self, attempt: int) -> float | None:
+        """Seconds to wait after the given failed attempt (1-based), or None when no attempt is left."""
+        if attempt >= self.max_attempts:
+            return None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class DownloadError(Exception):
+    """
+    Base of the download failures. `kind` names the class in logs and in the download queue; `retryable`
+    tells whether another attempt later (e.g. a queue retry) can succeed.
+    """
+    kind = "error"
+    retryable = True
+
+    def __init__(self, message: str, retryable: bool | None = None):
+        super().__init__(message)
+        if retryable is not None:
+            self.retryable = retryable
+
+    def __str__(self) -> str:
+        return f"[{self.kind}] {super().__str__()}"
+
+
+class CaptchaError(DownloadError):
+    """The mirror answered with a captcha (or another HTML page) instead of the PDF."""
+    kind = "captcha"
+
+
+class NotFoundError(DownloadError):
+    """No mirror knows the article; retrying will not help."""
+    kind = "not found"
+    retryable = False
+
+
+class NetworkError(DownloadError):
+    """Connection, TLS or timeout failure, or a transfer cut short."""
+    kind = "network"
+
+
+class MirrorDownError(DownloadError):
+    """The mirror answered with a server error, or no mirror is left to try."""
+    kind = "mirror down"
+
+
+class CancelledDownloadError(DownloadError):
+    """The download was cancelled, e.g. because the application is quitting; its partial file is kept."""
+    kind = "cancelled"
+
+
+class InvalidPdfError(DownloadError):
+    """The downloaded file is not a readable PDF (e.g. an HTML captcha or error page)."""
+    kind = "invalid pdf"
+
+
+# Retry policy of each error class inside one download call; the download queue retries later on top of this.
+# Invalid PDFs are only found after the call, so they are left to the queue.
+RETRY_POLICIES = {
+    CaptchaError: RetryPolicy(max_attempts=3, base_delay=2.0, max_delay=10.0),
+    NotFoundError: RetryPolicy(max_attempts=1),
+    NetworkError: RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=15.0),
+    MirrorDownError: RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=5.0),
+}
+DEFAULT_POLICY = RetryPolicy(max_attempts=1)
+# Seconds one download call may spend, retries included.
+DOWNLOAD_DEADLINE = 120.0
+
+
+def retry_delay(error: DownloadError, attempt: int) -> float | None:
+    """Seconds to wait before retrying after `attempt` failures of this error's class, or None to give up."""
+    if not error.retryable:
+        return None
+    return RETRY_POLICIES.get(type(error), DEFAULT_POLICY).delay(attempt)
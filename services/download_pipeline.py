@@ -0,0 +1,73 @@
+import hashlib
+import os
+
+import fitz
+
+from services.doi_utils import find_doi, normalize_doi
+from services.download_errors import InvalidPdfError
+from services.library_catalog import LibraryCatalog
+
+# The PDF header may follow some junk bytes; readers accept it within the first kilobyte.
+PDF_MAGIC = b"%PDF-"
+HEADER_WINDOW = 1024
+# Characters of extracted text kept in the full-text index per PDF.
+MAX_INDEXED_CHARS = 2_000_000
+
+
+class DownloadPipeline:
+    """
+    Post-download stage, run on the download thread: validate the file, read it once into memory for
+    PyMuPDF and the fingerprint, catalog it with its DOI and index its text for the PDF search.
+    """
+
+    def __init__(self, catalog: LibraryCatalog | None = None):
+        self.catalog = catalog or LibraryCatalog()
+
+    def process(self, path: str, doi: str | None = None) -> dict:
+        """Return the catalog record of the PDF; raises InvalidPdfError (and deletes the file) if it is not one."""
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            record = self.inspect(data)
+        except InvalidPdfError:
+            os.remove(path)
+            raise
+        record["path"] = path
+        record["doi"] = normalize_doi(doi) if doi else record["doi"]
+        text = record.pop("text")
+        if self.catalog.add_file(record):
+            self.catalog.index_text(path, text)
+        return record
+
+    @staticmethod
+    def inspect(data: bytes) -> dict:
+        """Validate the PDF bytes and read their fingerprint, page count, title, DOI and text."""
+        if PDF_MAGIC not in data[:HEADER_WINDOW]:
+            raise InvalidPdfError("Downloaded file is not a PDF")
+        try:
+            doc = fitz.open(stream=data, filetype="pdf")
+        except Exception as e:
+            raise InvalidPdfError(f"Downloaded PDF cannot be opened: {e}")
+        with doc:
+            if not doc.page_count:
+                raise InvalidPdfError("Downloaded PDF has no pages")
+            metadata = doc.metadata or {}
+            parts = []
+            size = 0
+            for page in doc:
+                page_text = page.get_text("text")
+                parts.append(page_text)
+                size += len(page_text)
+                if size >= MAX_INDEXED_CHARS:
+                    break
+            text = "".join(parts)[:MAX_INDEXED_CHARS]
+            doi = find_doi(" ".join(str(metadata.get(key) or "") for key in ("subject", "keywords", "title"))) \
+                or find_doi(parts[0] if parts else "")
+            return {
+                "content_hash": hashlib.sha256(data).hexdigest(),
+                "page_count": doc.page_count,
+                "title": (metadata.get("title") or "").strip() or None,
+                "doi": normalize_doi(doi) if doi else None,
+                "has_text": bool(text.strip()),
+                "text": text,
+            }
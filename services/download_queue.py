@@ -0,0 +1,198 @@
+import sqlite3
+import time
+from sqlite3 import Connection
+from typing import Any
+
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+FAILED = "failed"
+DONE = "done"
+CANCELLED = "cancelled"
+
+# Attempts per job before it is marked failed, and the delay before the first retry (doubled each time).
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 30
+RETRY_DELAY_MAX = 15 * 60
+
+_JOB_COLUMNS = ("id", "doi", "title", "destination", "state", "attempts", "error", "pdf_path",
+                "next_attempt_at", "created_at", "updated_at")
+
+
+class DownloadQueue:
+    """
+    Persistent download jobs. A job is queued, running, paused, failed, done or cancelled; failed attempts are
+    rescheduled with an increasing delay until MAX_ATTEMPTS is reached.
+    """
+
+    def __init__(self, db_path="downloads.db"):
+        self.db_path = db_path
+        self._create_table()
+
+    def _get_connection(self) -> Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_table(self):
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS download_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                doi TEXT NOT NULL,
+                title TEXT,
+                destination TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER DEFAULT 0,
+                error TEXT,
+                pdf_path TEXT,
+                next_attempt_at REAL DEFAULT 0,
+                created_at REAL,
+                updated_at REAL
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_download_jobs_state ON download_jobs (state, next_attempt_at)")
+        conn.commit()
+        conn.close()
+
+    def enqueue(self, doi: str, title: str, destination: str) -> int:
+        """Add a job, or return the id of the unfinished job already downloading this DOI to this folder."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id FROM download_jobs WHERE doi = ? AND destination = ? AND state IN (?, ?, ?)
+        ''', (doi, destination, QUEUED, RUNNING, PAUSED))
+        row = cursor.fetchone()
+        if row:
+            conn.close()
+            return row[0]
+        now = time.time()
+        cursor.execute('''
+            INSERT INTO download_jobs (doi, title, destination, state, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (doi, title, destination, QUEUED, now, now))
+        conn.commit()
+        job_id = cursor.lastrowid
+        conn.close()
+        return job_id
+
+    def claim_next(self) -> dict[str, Any] | None:
+        """Move the oldest queued job that is due to running and return it."""
+        now = time.time()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            UPDATE download_jobs SET state = ?, attempts = attempts + 1, updated_at = ?
+            WHERE id = (SELECT id FROM download_jobs WHERE state = ? AND next_attempt_at <= ? ORDER BY id LIMIT 1)
+            RETURNING {", ".join(_JOB_COLUMNS)}
+        ''', (RUNNING, now, QUEUED, now))
+        row = cursor.fetchone()
+        conn.commit()
+        conn.close()
+        return dict(zip(_JOB_COLUMNS, row)) if row else None
+
+    def next_due_in(self) -> float | None:
+        """Seconds until the next scheduled retry, or None when nothing is waiting."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT MIN(next_attempt_at) FROM download_jobs WHERE state = ?", (QUEUED,))
+        due = cursor.fetchone()[0]
+        conn.close()
+        return None if due is None else max(0.0, due - time.time())
+
+    def complete(self, job_id: int, pdf_path: str) -> None:
+        self._finish(job_id, DONE, None, pdf_path)
+
+    def fail(self, job_id: int, error: str, retryable: bool = True) -> str:
+        """
+        Schedule a retry, or mark the job failed after MAX_ATTEMPTS or on a permanent error
+        (`retryable` False). Returns the new state.
+        """
+        job = self.get(job_id)
+        if not job or job["state"] != RUNNING:
+            return job["state"] if job else CANCELLED
+        if not retryable or job["attempts"] >= MAX_ATTEMPTS:
+            self._finish(job_id, FAILED, error)
+            return FAILED
+        delay = min(RETRY_DELAY_MAX, RETRY_DELAY * 2 ** (job["attempts"] - 1))
+        self._finish(job_id, QUEUED, error, next_attempt_at=time.time() + delay)
+        return QUEUED
+
+    def _finish(self, job_id: int, state: str, error: str | None, pdf_path: str | None = None,
+                next_attempt_at: float = 0) -> None:
+        # Only running jobs are finished, so a job cancelled meanwhile stays cancelled.
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE download_jobs SET state = ?, error = ?, pdf_path = COALESCE(?, pdf_path),
+                next_attempt_at = ?, updated_at = ?
+            WHERE id = ? AND state = ?
+        ''', (state, error, pdf_path, next_attempt_at, time.time(), job_id, RUNNING))
+        conn.commit()
+        conn.close()
+
+    def pause(self, job_ids: list[int]) -> None:
+        self._set_state(job_ids, PAUSED, (QUEUED,))
+
+    def resume(self, job_ids: list[int]) -> None:
+        """Queue paused, failed or cancelled jobs again, with a fresh attempt budget."""
+        self._set_state(job_ids, QUEUED, (PAUSED, FAILED, CANCELLED), reset_attempts=True)
+
+    def cancel(self, job_ids: list[int]) -> None:
+        """Cancel jobs; a running download finishes in the background but its result is discarded."""
+        self._set_state(job_ids, CANCELLED, (QUEUED, RUNNING, PAUSED))
+
+    def _set_state(self, job_ids: list[int], state: str, from_states: tuple[str, ...],
+                   reset_attempts: bool = False) -> None:
+        if not job_ids:
+            return
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            UPDATE download_jobs SET state = ?, next_attempt_at = 0, updated_at = ?
+                {", attempts = 0, error = NULL" if reset_attempts else ""}
+            WHERE id IN ({", ".join("?" * len(job_ids))}) AND state IN ({", ".join("?" * len(from_states))})
+        ''', (state, time.time(), *job_ids, *from_states))
+        conn.commit()
+        conn.close()
+
+    def requeue_interrupted(self) -> int:
+        """Jobs left running by a previous session are queued again."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("UPDATE download_jobs SET state = ?, updated_at = ? WHERE state = ?",
+                       (QUEUED, time.time(), RUNNING))
+        count = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return count
+
+    def clear_finished(self) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM download_jobs WHERE state IN (?, ?)", (DONE, CANCELLED))
+        conn.commit()
+        conn.close()
+
+    def get(self, job_id: int) -> dict[str, Any] | None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(_JOB_COLUMNS)} FROM download_jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return dict(zip(_JOB_COLUMNS, row)) if row else None
+
+    def jobs(self) -> list[dict[str, Any]]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(_JOB_COLUMNS)} FROM download_jobs ORDER BY id")
+        rows = cursor.fetchall()
+        conn.close()
+        return [dict(zip(_JOB_COLUMNS, row)) for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT state, COUNT(*) FROM download_jobs GROUP BY state")
+        counts = dict(cursor.fetchall())
+        conn.close()
+        return counts
@@ -0,0 +1,139 @@
+import os
+import re
+import zlib
+from collections import defaultdict
+
+import fitz
+import numpy as np
+from services.file_service import FileService
+
+# MinHash parameters. Changing them invalidates the signatures cached in the catalog.
+NUM_PERM = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 5
+MAX_PAGES = 30
+_MERSENNE_PRIME = np.uint64(4294967311)
+_rng = np.random.default_rng(1)
+_PERM_A = _rng.integers(1, 2 ** 32, NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 2 ** 32, NUM_PERM, dtype=np.uint64)
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class DuplicateFinder:
+    """Exact (content hash) and near (MinHash over extracted text) duplicate detection."""
+
+    @staticmethod
+    def exact_groups(files: list[tuple[str, str]]) -> list[list[str]]:
+        """Group [(path, content_hash)] by hash, keeping only groups with more than one file."""
+        groups = defaultdict(list)
+        for path, content_hash in files:
+            if content_hash:
+                groups[content_hash].append(path)
+        return [sorted(paths) for paths in groups.values() if len(paths) > 1]
+
+    @staticmethod
+    def analyse_file(path: str, need_hash: bool, need_signature: bool) -> tuple[str, str | None, bytes | None]:
+        """Pool task: return (path, content_hash, minhash signature) for a PDF."""
+        content_hash = FileService.hash_file(path) if need_hash else None
+        signature = DuplicateFinder.text_signature(path) if need_signature else None
+        return path, content_hash, signature
+
+    @staticmethod
+    def text_signature(path: str) -> bytes | None:
+        """MinHash signature of the word shingles of a PDF's text layer, or None without text."""
+        with fitz.open(path) as doc:
+            text = " ".join(doc[i].get_text("text") for i in range(min(doc.page_count, MAX_PAGES)))
+        words = _WORD_PATTERN.findall(text.lower())
+        if len(words) < SHINGLE_SIZE:
+            return None
+        shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME
+        return permuted.min(axis=0).astype(np.uint64).tobytes()
+
+    @staticmethod
+    def near_groups(signatures: dict[str, bytes], threshold: float = 0.8) -> list[list[str]]:
+        """
+        Group paths whose estimated Jaccard similarity is at least `threshold`.
+        Candidate pairs come from LSH banding so the comparison stays close to linear.
+        """
+        rows = NUM_PERM // LSH_BANDS
+        vectors = {path: np.frombuffer(sig, dtype=np.uint64) for path, sig in signatures.items() if sig}
+        buckets = defaultdict(list)
+        for path, vector in vectors.items():
+            for band in range(LSH_BANDS):
+                buckets[(band, vector[band * rows:(band + 1) * rows].tobytes())].append(path)
+
+        parent = {path: path for path in vectors}
+
+        def find(p):
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+
+        checked = set()
+        for paths in buckets.values():
+            for i, first in enumerate(paths):
+                for second in paths[i + 1:]:
+                    pair = (first, second) if first < second else (second, first)
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    if np.mean(vectors[first] == vectors[second]) >= threshold:
+                        parent[find(first)] = find(second)
+
+        groups = defaultdict(list)
+        for path in vectors:
+            groups[find(path)].append(path)
+        return [sorted(paths) for paths in groups.values() if len(paths) > 1]
+
+    @staticmethod
+    def merge_overlapping(exact: list[list[str]], near: list[list[str]]) -> tuple[list[list[str]], list[list[str]]]:
+        """
+        Merge groups sharing a file so every file belongs to one group; resolving overlapping groups one
+        after the other could otherwise delete every copy. A merged group stays exact only if it is unchanged.
+        """
+        parent = {}
+
+        def find(p):
+            parent.setdefault(p, p)
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+
+        for group in exact + near:
+            for path in group[1:]:
+                parent[find(path)] = find(group[0])
+        merged = defaultdict(list)
+        for path in parent:
+            merged[find(path)].append(path)
+        exact_sets = {frozenset(group) for group in exact}
+        groups = [sorted(paths) for paths in merged.values() if len(paths) > 1]
+        return ([group for group in groups if frozenset(group) in exact_sets],
+                [group for group in groups if frozenset(group) not in exact_sets])
+
+    @staticmethod
+    def resolve_group(keep: str, others: list[str], action: str) -> list[str]:
+        """
+        Resolve a duplicate group by keeping one file and either deleting the others
+        or replacing them with hard links to the kept file. Returns the handled paths.
+        Nothing is touched when the kept file no longer exists.
+        """
+        if not os.path.isfile(keep):
+            raise FileNotFoundError(f"The file to keep no longer exists: {keep}")
+        handled = []
+        for path in others:
+            if path == keep or not os.path.exists(path):
+                continue
+            if action == "delete":
+                FileService.delete_file(path)
+            elif action == "hardlink":
+                temp_path = path + ".link-tmp"
+                os.link(keep, temp_path)
+                os.replace(temp_path, path)
+            else:
+                raise ValueError(f"Unknown duplicate action: {action}")
+            handled.append(path)
+        return handled
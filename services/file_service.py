@@ -1,3 +1,4 @@
+import hashlib
 import os
 from pathlib import Path
 import subprocess
@@ -23,6 +24,15 @@ class FileService:
         else:
             raise RuntimeError("Unsupported OS")
 
+    @staticmethod
+    def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """Return the SHA-256 of a file, read in chunks so large PDFs are never fully loaded."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     @staticmethod
     def delete_file(file_path: str) -> None:
         if not os.path.exists(file_path):
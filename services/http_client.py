@@ -0,0 +1,179 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import httpx
+from services.network_governor import NetworkGovernor
+from services.rate_limiter import RateLimiter
+
+USER_AGENT = "ResearchManager/1.0"
+DEFAULT_TIMEOUT = httpx.Timeout(20.0, connect=10.0)
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 6
+
+# Retries of rate limited (429), unavailable (5xx) and transport failures.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HttpClient:
+    """
+    Pooled HTTP client shared by every network worker of the application.
+    Connections are kept alive between requests so TLS handshakes are paid once per host,
+    HTTP/2 is used when the `h2` package is installed, and each host gets a bounded
+    number of concurrent requests. Every request also takes a connection slot and
+    bandwidth from the NetworkGovernor, in the category of its provider.
+    """
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, verify=True, proxy=None, headers=None, timeout=DEFAULT_TIMEOUT,
+                 max_per_host=MAX_CONNECTIONS_PER_HOST):
+        self.max_per_host = max_per_host
+        self._host_slots = {}
+        self._slots_lock = threading.Lock()
+        self._client = httpx.Client(
+            http2=_http2_available(),
+            verify=verify,
+            proxy=proxy,
+            timeout=timeout,
+            follow_redirects=True,
+            headers=headers or {"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        )
+
+    @classmethod
+    def shared(cls, name: str = "default", **kwargs) -> "HttpClient":
+        """Return the application-wide client registered under `name`, creating it on first use."""
+        with cls._instances_lock:
+            if name not in cls._instances:
+                cls._instances[name] = cls(**kwargs)
+            return cls._instances[name]
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._instances_lock:
+            for client in cls._instances.values():
+                client.close()
+            cls._instances.clear()
+
+    def request(self, method: str, url: str, provider: str | None = None,
+                max_retries: int = MAX_RETRIES, **kwargs) -> httpx.Response:
+        """
+        Send a request. When `provider` is given the call takes a token from that provider's
+        rate limiter, and 429/5xx responses or transport errors are retried with jittered
+        exponential backoff, honouring the server's Retry-After header. Other errors are
+        returned (or raised) immediately.
+        """
+        if provider is None:
+            with self._slot(url):
+                return self._received(self._client.request(method, url, **kwargs))
+
+        bucket = RateLimiter.for_provider(provider)
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                with self._slot(url, provider):
+                    response = self._received(self._client.request(method, url, **kwargs), provider)
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                return response
+            delay = self._retry_after(response)
+            if delay is not None:
+                bucket.pause(delay)
+            else:
+                time.sleep(self._backoff(attempt))
+            response.close()
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url: str, provider: str | None = None, **kwargs):
+        """
+        Stream a response body; the connection and host slots are held until the block exits. A `provider`
+        takes a token from its rate limiter first, but streams are never retried here. Read the body with
+        `iter_bytes` so it counts against the bandwidth.
+        """
+        if provider is not None:
+            RateLimiter.for_provider(provider).acquire()
+        with self._slot(url, provider):
+            with self._client.stream(method, url, **kwargs) as response:
+                yield response
+
+    @staticmethod
+    def iter_bytes(response: httpx.Response, chunk_size: int, provider: str | None = None):
+        """Chunks of a streamed body, throttled to the bandwidth of the provider's category."""
+        governor = NetworkGovernor.shared()
+        for chunk in response.iter_bytes(chunk_size):
+            governor.throttle(len(chunk), provider)
+            yield chunk
+
+    def close(self) -> None:
+        self._client.close()
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float | None:
+        """Seconds to wait according to a Retry-After header (delta seconds or HTTP date)."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return min(max(float(value), 0.0), BACKOFF_MAX)
+        except ValueError:
+            pass
+        try:
+            return min(max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0), BACKOFF_MAX)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _received(response: httpx.Response, provider: str | None = None) -> httpx.Response:
+        NetworkGovernor.shared().throttle(len(response.content), provider)
+        return response
+
+    @contextmanager
+    def _slot(self, url: str, provider: str | None = None):
+        with NetworkGovernor.shared().connection(provider), self._host_slot(url):
+            yield
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlsplit(str(url)).netloc.lower()
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+        with slot:
+            yield
@@ -0,0 +1,416 @@
+import os
+import re
+import sqlite3
+import time
+from sqlite3 import Connection
+from typing import Any
+
+from services.doi_utils import normalize_doi
+
+
+class LibraryCatalog:
+    """Persistent record of every folder and PDF found under the root folder."""
+
+    def __init__(self, db_path="library.db"):
+        self.db_path = db_path
+        self._create_table()
+
+    def _get_connection(self) -> Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_table(self):
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS folders (
+                path TEXT PRIMARY KEY,
+                root TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS pdf_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT UNIQUE,
+                root TEXT,
+                folder TEXT,
+                file_name TEXT,
+                size INTEGER,
+                mtime REAL,
+                content_hash TEXT,
+                page_count INTEGER,
+                title TEXT,
+                doi TEXT,
+                has_text INTEGER,
+                scanned_at REAL
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS text_signatures (
+                content_hash TEXT PRIMARY KEY,
+                signature BLOB
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS doi_index (
+                path TEXT PRIMARY KEY,
+                doi TEXT,
+                source TEXT,
+                mtime REAL
+            )
+        ''')
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS pdf_text USING fts5(path UNINDEXED, content)
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_folders_root ON folders (root)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pdf_files_root ON pdf_files (root)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pdf_files_folder ON pdf_files (folder)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pdf_files_hash ON pdf_files (content_hash)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pdf_files_doi ON pdf_files (doi)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_doi_index_doi ON doi_index (doi)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pdf_files_title ON pdf_files (lower(title))")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pdf_files_name ON pdf_files (lower(file_name))")
+        conn.commit()
+        conn.close()
+
+    def get_snapshot(self, root: str) -> dict[str, tuple[int, float]]:
+        """
+        Return {path: (size, mtime)} for every catalogued file under the root, including files
+        catalogued under another root that contains or lies inside this one.
+        """
+        prefix = os.path.join(root, "")
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path, size, mtime FROM pdf_files WHERE root = ? OR substr(path, 1, ?) = ?",
+                       (root, len(prefix), prefix))
+        snapshot = {path: (size, mtime) for path, size, mtime in cursor.fetchall()}
+        conn.close()
+        return snapshot
+
+    def sync_listing(self, root: str, folders: list[str], files: list[tuple[str, int, float]]) -> bool:
+        """
+        Bring the folder and file listing of a root in line with what is on disk.
+        New or modified files are stored without metadata until `update_metadata` fills it.
+        Returns True if anything changed.
+        """
+        snapshot = self.get_snapshot(root)
+        on_disk = {path for path, _, _ in files}
+        removed = [(path,) for path in snapshot if path not in on_disk]
+        changed = [(path, root, os.path.dirname(path), os.path.basename(path), size, mtime)
+                   for path, size, mtime in files if snapshot.get(path) != (size, mtime)]
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path FROM folders WHERE root = ?", (root,))
+        known_folders = {row[0] for row in cursor.fetchall()}
+        folders_changed = known_folders != set(folders)
+        if folders_changed:
+            cursor.execute("DELETE FROM folders WHERE root = ?", (root,))
+            cursor.executemany("INSERT OR REPLACE INTO folders (path, root) VALUES (?, ?)",
+                               [(folder, root) for folder in folders])
+        cursor.executemany("DELETE FROM pdf_files WHERE path = ?", removed)
+        cursor.executemany("DELETE FROM doi_index WHERE path = ?", removed)
+        cursor.executemany("DELETE FROM pdf_text WHERE path = ?", removed + [(change[0],) for change in changed])
+        # Unchanged files of a previous root keep their metadata and move to this one.
+        prefix = os.path.join(root, "")
+        cursor.execute("UPDATE pdf_files SET root = ? WHERE root != ? AND substr(path, 1, ?) = ?",
+                       (root, root, len(prefix), prefix))
+        rehomed = cursor.rowcount
+        cursor.executemany('''
+            INSERT INTO pdf_files (path, root, folder, file_name, size, mtime)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                root = excluded.root,
+                folder = excluded.folder,
+                file_name = excluded.file_name,
+                size = excluded.size,
+                mtime = excluded.mtime,
+                content_hash = NULL,
+                page_count = NULL,
+                title = NULL,
+                doi = NULL,
+                has_text = NULL,
+                scanned_at = NULL
+        ''', changed)
+        conn.commit()
+        conn.close()
+        return folders_changed or bool(removed) or bool(changed) or rehomed > 0
+
+    def fetch_pending(self, root: str) -> list[str]:
+        """Return the paths of files whose metadata has not been extracted yet."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path FROM pdf_files WHERE root = ? AND scanned_at IS NULL", (root,))
+        results = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def update_metadata(self, records: list[dict]) -> None:
+        """Store the extracted metadata of a batch of files."""
+        now = time.time()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany('''
+            UPDATE pdf_files
+            SET content_hash = ?,
+                page_count = ?,
+                title = ?,
+                doi = ?,
+                has_text = ?,
+                scanned_at = ?
+            WHERE path = ?
+        ''', [(
+            record.get("content_hash"),
+            record.get("page_count"),
+            record.get("title"),
+            record.get("doi"),
+            1 if record.get("has_text") else 0,
+            now,
+            record["path"]
+        ) for record in records])
+        conn.commit()
+        conn.close()
+
+    def fetch_folders(self, root: str) -> list[tuple[str, list[str]]]:
+        """Return [(folder_path, [pdf file names])] for the root, parents before children."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path FROM folders WHERE root = ? ORDER BY path", (root,))
+        folders = {row[0]: [] for row in cursor.fetchall()}
+        cursor.execute("SELECT folder, file_name FROM pdf_files WHERE root = ? ORDER BY file_name COLLATE NOCASE",
+                       (root,))
+        for folder, file_name in cursor.fetchall():
+            folders.setdefault(folder, []).append(file_name)
+        conn.close()
+        return list(folders.items())
+
+    def fetch_pdf_paths(self, folder: str) -> list[str]:
+        """Return the paths of the PDFs directly inside a folder."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path FROM pdf_files WHERE folder = ? ORDER BY file_name COLLATE NOCASE", (folder,))
+        results = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def search_by_name(self, folder: str, text: str) -> list[tuple[str, str]]:
+        """Return [(folder, file_name)] of the PDFs under a folder whose name contains the text."""
+        folder = folder.rstrip("/\\")
+        pattern = folder.replace("!", "!!").replace("%", "!%").replace("_", "!_") + os.sep + "%"
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT folder, file_name FROM pdf_files
+            WHERE (folder = ? OR folder LIKE ? ESCAPE '!') AND instr(lower(file_name), lower(?)) > 0
+        ''', (folder, pattern, text))
+        results = cursor.fetchall()
+        conn.close()
+        return results
+
+    def remove_file(self, path: str) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM pdf_files WHERE path = ?", (path,))
+        cursor.execute("DELETE FROM doi_index WHERE path = ?", (path,))
+        cursor.execute("DELETE FROM pdf_text WHERE path = ?", (path,))
+        conn.commit()
+        conn.close()
+
+    def add_file(self, record: dict) -> bool:
+        """
+        Catalog one new PDF with its metadata (e.g. right after a download) so the next scan finds it up to date.
+        Returns False when its folder is not part of a catalogued root yet.
+        """
+        path = record["path"]
+        folder = os.path.dirname(path)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT root FROM folders WHERE path = ?", (folder,))
+        row = cursor.fetchone()
+        if not row:
+            conn.close()
+            return False
+        stat = os.stat(path)
+        cursor.execute('''
+            INSERT OR REPLACE INTO pdf_files (path, root, folder, file_name, size, mtime, content_hash, page_count,
+                                              title, doi, has_text, scanned_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (path, row[0], folder, os.path.basename(path), stat.st_size, stat.st_mtime, record.get("content_hash"),
+              record.get("page_count"), record.get("title"), record.get("doi"), 1 if record.get("has_text") else 0,
+              time.time()))
+        if record.get("doi"):
+            cursor.execute("INSERT OR REPLACE INTO doi_index (path, doi, source, mtime) VALUES (?, ?, ?, ?)",
+                           (path, record["doi"], "download", stat.st_mtime))
+        conn.commit()
+        conn.close()
+        return True
+
+    def add_copy(self, source: str, path: str) -> bool:
+        """Catalog a copy (or link) of a catalogued PDF with the source's metadata and text, without reading it."""
+        record = self.get_file(source)
+        if not record:
+            return False
+        record["path"] = path
+        if not self.add_file(record):
+            return False
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM pdf_text WHERE path = ?", (path,))
+        cursor.execute("INSERT INTO pdf_text (path, content) SELECT ?, content FROM pdf_text WHERE path = ?",
+                       (path, source))
+        conn.commit()
+        conn.close()
+        return True
+
+    def index_text(self, path: str, text: str) -> None:
+        """Store the extracted text of a PDF in the full-text index, replacing an older version."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM pdf_text WHERE path = ?", (path,))
+        cursor.execute("INSERT INTO pdf_text (path, content) VALUES (?, ?)", (path, text))
+        conn.commit()
+        conn.close()
+
+    def search_text(self, folder: str, text: str, limit: int = 200) -> list[tuple[str, str]]:
+        """Return [(folder, file_name)] of the indexed PDFs under a folder whose text contains every word."""
+        tokens = re.findall(r"\w+", text.lower())
+        if not tokens:
+            return []
+        folder = folder.rstrip("/\\")
+        pattern = folder.replace("!", "!!").replace("%", "!%").replace("_", "!_") + os.sep + "%"
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT f.folder, f.file_name FROM pdf_text
+            JOIN pdf_files f ON f.path = pdf_text.path
+            WHERE pdf_text MATCH ? AND (f.folder = ? OR f.folder LIKE ? ESCAPE '!')
+            ORDER BY bm25(pdf_text) LIMIT ?
+        ''', (" ".join(f'"{token}"' for token in tokens), folder, pattern, limit))
+        results = cursor.fetchall()
+        conn.close()
+        return results
+
+    def fetch_doi_pending(self, root: str) -> list[str]:
+        """Return the paths of files under the root that were never DOI-indexed or changed since."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT f.path FROM pdf_files f
+            LEFT JOIN doi_index d ON d.path = f.path
+            WHERE f.root = ? AND (d.path IS NULL OR d.mtime IS NOT f.mtime)
+        ''', (root,))
+        results = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def save_doi_index(self, records: list[tuple[str, str | None, str | None]]) -> None:
+        """Store [(path, doi, source)] results of the DOI extraction; files without a DOI are kept as checked."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT OR REPLACE INTO doi_index (path, doi, source, mtime)
+            SELECT ?, ?, ?, mtime FROM pdf_files WHERE path = ?
+        ''', [(path, doi, source, path) for path, doi, source in records])
+        conn.commit()
+        conn.close()
+
+    def find_by_doi(self, doi: str) -> list[str]:
+        """Return the paths of the files whose detected or extracted DOI matches."""
+        doi = normalize_doi(doi)
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT path FROM pdf_files WHERE doi = ?
+            UNION
+            SELECT path FROM doi_index WHERE doi = ?
+        ''', (doi, doi))
+        results = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def find_by_dois(self, dois: list[str]) -> dict[str, list[str]]:
+        """Return {normalized DOI: [paths]} for the DOIs that have a PDF in the library."""
+        dois = list(dict.fromkeys(normalize_doi(doi) for doi in dois if doi))
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        matches = {}
+        for start in range(0, len(dois), 500):
+            chunk = dois[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(f'''
+                SELECT doi, path FROM pdf_files WHERE doi IN ({placeholders})
+                UNION
+                SELECT doi, path FROM doi_index WHERE doi IN ({placeholders})
+            ''', chunk + chunk)
+            for doi, path in cursor.fetchall():
+                matches.setdefault(doi, []).append(path)
+        conn.close()
+        return matches
+
+    def find_by_title(self, title: str) -> list[str]:
+        """Return the paths of the files whose PDF title, or file name without ".pdf", equals the title (any case)."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT path FROM pdf_files WHERE lower(title) = lower(?)
+            UNION
+            SELECT path FROM pdf_files WHERE lower(file_name) = lower(?)
+        ''', (title.strip(), title.strip() + ".pdf"))
+        results = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def find_by_hash(self, content_hash: str) -> list[str]:
+        """Return the paths of the files with the given content hash."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path FROM pdf_files WHERE content_hash = ?", (content_hash,))
+        results = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def fetch_hashed_files(self, root: str) -> list[tuple[str, str | None, int | None]]:
+        """Return [(path, content_hash, has_text)] for every catalogued file under the root."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT path, content_hash, has_text FROM pdf_files WHERE root = ?", (root,))
+        results = cursor.fetchall()
+        conn.close()
+        return results
+
+    def set_content_hashes(self, hashes: dict[str, str]) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("UPDATE pdf_files SET content_hash = ? WHERE path = ?",
+                           [(content_hash, path) for path, content_hash in hashes.items()])
+        conn.commit()
+        conn.close()
+
+    def get_signatures(self, content_hashes: list[str]) -> dict[str, bytes]:
+        """Return the cached MinHash signatures for the given content hashes."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        signatures = {}
+        for i in range(0, len(content_hashes), 500):
+            chunk = content_hashes[i:i + 500]
+            cursor.execute(f"SELECT content_hash, signature FROM text_signatures "
+                           f"WHERE content_hash IN ({','.join('?' * len(chunk))})", chunk)
+            signatures.update(cursor.fetchall())
+        conn.close()
+        return signatures
+
+    def save_signatures(self, signatures: dict[str, bytes]) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("INSERT OR REPLACE INTO text_signatures (content_hash, signature) VALUES (?, ?)",
+                           list(signatures.items()))
+        conn.commit()
+        conn.close()
+
+    def get_file(self, path: str) -> dict[str, Any] | None:
+        conn = self._get_connection()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM pdf_files WHERE path = ?", (path,))
+        row = cursor.fetchone()
+        conn.close()
+        return dict(row) if row else None
@@ -0,0 +1,91 @@
+import os
+import shutil
+
+from services.library_catalog import LibraryCatalog
+
+# What to do with a requested PDF that is already in the library under another folder.
+USE_EXISTING = "use"
+COPY = "copy"
+LINK = "link"
+PLACEMENT_MODES = (USE_EXISTING, COPY, LINK)
+# Shorter titles (e.g. "Introduction") are too generic to identify a paper without its DOI.
+MIN_TITLE_LENGTH = 20
+
+
+class LibraryLookup:
+    """
+    Answers download requests from the local library before any network work: finds the PDF by DOI in the
+    catalog and DOI index, else by exact title or file name, and uses it where it is or copies or links it
+    into the target folder.
+    """
+
+    def __init__(self, catalog: LibraryCatalog | None = None, mode: str = USE_EXISTING):
+        self.catalog = catalog or LibraryCatalog()
+        self.mode = mode
+
+    def set_mode(self, mode: str) -> None:
+        if mode not in PLACEMENT_MODES:
+            raise ValueError(f"Unknown placement mode: {mode}")
+        self.mode = mode
+
+    def find(self, doi: str | None, title: str | None = None, destination: str | None = None) -> str | None:
+        """Path of an existing copy of the article, preferring one inside `destination`."""
+        paths = self.catalog.find_by_doi(doi) if doi else []
+        if not paths and title and len(title.strip()) >= MIN_TITLE_LENGTH:
+            paths = self.catalog.find_by_title(title)
+        paths = [path for path in paths if os.path.isfile(path)]
+        if not paths:
+            return None
+        if destination:
+            folder = os.path.normcase(os.path.normpath(destination))
+            for path in paths:
+                if os.path.normcase(os.path.dirname(path)) == folder:
+                    return path
+        return paths[0]
+
+    def resolve(self, doi: str | None, title: str | None, destination: str) -> str | None:
+        """Path to use for the request when the library already has the article, else None."""
+        path = self.find(doi, title, destination)
+        return self.place(path, destination) if path else None
+
+    def needs_placement(self, path: str, destination: str) -> bool:
+        """Whether `place` has to copy or link the file, i.e. file work the UI thread should not do."""
+        return self.mode != USE_EXISTING and os.path.normcase(os.path.dirname(path)) != \
+            os.path.normcase(os.path.normpath(destination))
+
+    def place(self, path: str, destination: str) -> str:
+        """Put an existing PDF into `destination` according to the mode and return the path to use."""
+        if not self.needs_placement(path, destination):
+            return path
+        target = os.path.join(destination, os.path.basename(path))
+        stem, extension = os.path.splitext(target)
+        counter = 2
+        # A file of the same name is reused only when it is this article placed there before.
+        while os.path.exists(target):
+            if self._same_article(path, target):
+                return target
+            target = f"{stem} ({counter}){extension}"
+            counter += 1
+        os.makedirs(destination, exist_ok=True)
+        if self.mode == LINK:
+            try:
+                os.link(path, target)
+            except OSError:
+                # Across file systems (or without hard link support) fall back to a symbolic link, then a copy.
+                try:
+                    os.symlink(path, target)
+                except OSError:
+                    shutil.copy2(path, target)
+        else:
+            shutil.copy2(path, target)
+        self.catalog.add_copy(path, target)
+        return target
+
+    def _same_article(self, path: str, other: str) -> bool:
+        """Whether the catalog knows `other` as the same file (content hash) or the same article (DOI)."""
+        if os.path.samefile(path, other):
+            return True
+        source, existing = self.catalog.get_file(path), self.catalog.get_file(other)
+        if not source or not existing:
+            return False
+        return any(source.get(key) and source.get(key) == existing.get(key) for key in ("content_hash", "doi"))
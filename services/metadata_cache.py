@@ -0,0 +1,123 @@
+import json
+import re
+import sqlite3
+import time
+from sqlite3 import Connection
+
+from services.article_record import ArticleRecord
+from services.doi_utils import normalize_doi
+
+DAY = 24 * 60 * 60
+
+# Time to live of a cached answer, per metadata source.
+SOURCE_TTLS = {
+    "Semantic Scholar": 7 * DAY,
+    "CrossRef": 30 * DAY,
+}
+DEFAULT_TTL = 7 * DAY
+NEGATIVE_TTL = DAY
+
+
+class MetadataCache:
+    """SQLite cache of article metadata keyed by normalized DOI or title, with negative entries for misses."""
+
+    def __init__(self, db_path="metadata_cache.db", max_entries=50000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._create_table()
+
+    def _get_connection(self) -> Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_table(self):
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS metadata_cache (
+                cache_key TEXT PRIMARY KEY,
+                source TEXT,
+                payload BLOB,
+                expires_at REAL,
+                last_access REAL
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_metadata_cache_access ON metadata_cache (last_access)")
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def doi_key(doi: str) -> str:
+        return "doi:" + normalize_doi(doi)
+
+    @staticmethod
+    def title_key(title: str) -> str:
+        return "title:" + " ".join(re.sub(r"[^\w]+", " ", (title or "").lower()).split())
+
+    def get(self, cache_key: str) -> tuple[bool, ArticleRecord | None]:
+        """
+        Return (found, record). A found entry with a None record is a cached miss.
+        Expired entries, and entries that no longer decode (e.g. after a RECORD_VERSION bump),
+        are reported as not found; the latter are dropped.
+        """
+        now = time.time()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT payload, expires_at FROM metadata_cache WHERE cache_key = ?", (cache_key,))
+        row = cursor.fetchone()
+        if row and row[1] > now:
+            cursor.execute("UPDATE metadata_cache SET last_access = ? WHERE cache_key = ?", (now, cache_key))
+            conn.commit()
+        conn.close()
+        if not row or row[1] <= now:
+            return False, None
+        if not row[0]:
+            return True, None
+        try:
+            # Entries written before payloads became binary article records are JSON text.
+            if isinstance(row[0], str):
+                return True, ArticleRecord.from_dict(json.loads(row[0]))
+            return True, ArticleRecord.from_bytes(row[0])
+        except (ValueError, EOFError, TypeError):
+            self._delete(cache_key)
+            return False, None
+
+    def _delete(self, cache_key: str) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM metadata_cache WHERE cache_key = ?", (cache_key,))
+        conn.commit()
+        conn.close()
+
+    def put(self, cache_key: str, record: ArticleRecord | None) -> None:
+        """Store an answer, or a miss when record is None, then evict the least recently used entries."""
+        now = time.time()
+        if record:
+            source = record.source or ""
+            ttl = SOURCE_TTLS.get(source, DEFAULT_TTL)
+            payload = record.to_bytes()
+        else:
+            source, ttl, payload = "", NEGATIVE_TTL, None
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO metadata_cache (cache_key, source, payload, expires_at, last_access)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (cache_key, source, payload, now + ttl, now))
+        cursor.execute("SELECT COUNT(*) FROM metadata_cache")
+        excess = cursor.fetchone()[0] - self.max_entries
+        if excess > 0:
+            cursor.execute('''
+                DELETE FROM metadata_cache WHERE cache_key IN (
+                    SELECT cache_key FROM metadata_cache ORDER BY last_access LIMIT ?
+                )
+            ''', (excess,))
+        conn.commit()
+        conn.close()
+
+    def clear(self) -> None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM metadata_cache")
+        conn.commit()
+        conn.close()
@@ -0,0 +1,359 @@
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import fields, replace
+from typing import Callable
+from urllib.parse import quote
+
+from services.article_record import ArticleRecord
+from services.doi_utils import normalize_doi
+from services.http_client import HttpClient
+from services.network_governor import NetworkGovernor
+
+SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1"
+CROSSREF_API = "https://api.crossref.org"
+OPENALEX_API = "https://api.openalex.org"
+PUBMED_API = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+ARXIV_API = "https://export.arxiv.org/api/query"
+# Only the paper fields we map are requested from Semantic Scholar.
+SEMANTIC_SCHOLAR_FIELDS = "title,authors,year,externalIds,journal,url,isOpenAccess,citationCount"
+# Maximum number of ids accepted by one call of the paper batch endpoint.
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500
+ARXIV_DOI_PREFIX = "10.48550/arxiv."
+
+# Seconds to wait for the providers before giving up, and for the slower ones once a result is in.
+PROVIDER_TIMEOUT = 20
+MERGE_WINDOW = 0.75
+
+# Router: lookups remembered per provider and identifier type, the latency assumed before any
+# measurement, the shortest wait before hedging to the next provider, and providers asked per title search.
+ROLLING_WINDOW = 20
+PRIOR_LATENCY = 1.0
+MIN_HEDGE_DELAY = 0.3
+TITLE_FANOUT = 2
+
+
+def is_complete(record: ArticleRecord) -> bool:
+    return bool(record.title and record.doi and record.authors)
+
+
+def merge_results(primary: ArticleRecord, secondary: ArticleRecord) -> ArticleRecord:
+    """Fill the missing fields of the primary result (e.g. publisher, citation count) from the secondary."""
+    missing = {field.name: getattr(secondary, field.name) for field in fields(ArticleRecord)
+               if field.name != "source" and getattr(primary, field.name) in (None, "", ())
+               and getattr(secondary, field.name) not in (None, "", ())}
+    if not missing:
+        return primary
+    return replace(primary, source=f"{primary.source} + {secondary.source}", **missing)
+
+
+class MetadataProvider:
+    """
+    A metadata source. Lookups return ArticleRecords, None or [] when nothing matches, and raise on
+    network or server errors.
+    """
+    name = ""
+
+    def supports(self, kind: str, value: str) -> bool:
+        return True
+
+    def lookup_doi(self, doi: str) -> ArticleRecord | None:
+        raise NotImplementedError
+
+    def search_title(self, title: str, limit: int) -> list[ArticleRecord]:
+        raise NotImplementedError
+
+    @staticmethod
+    def _get(url: str, provider: str, **kwargs):
+        """GET through the shared client; returns None on 404."""
+        res = HttpClient.shared().get(url, provider=provider, **kwargs)
+        if res.status_code == 404:
+            return None
+        res.raise_for_status()
+        return res
+
+
+class SemanticScholarProvider(MetadataProvider):
+    name = "Semantic Scholar"
+
+    def lookup_doi(self, doi: str) -> ArticleRecord | None:
+        res = self._get(f"{SEMANTIC_SCHOLAR_API}/paper/DOI:{quote(doi, safe='/')}", "semantic_scholar",
+                        params={"fields": SEMANTIC_SCHOLAR_FIELDS})
+        return ArticleRecord.from_semantic_scholar(res.json()) if res else None
+
+    def search_title(self, title: str, limit: int) -> list[ArticleRecord]:
+        res = self._get(f"{SEMANTIC_SCHOLAR_API}/paper/search", "semantic_scholar",
+                        params={"query": title, "limit": limit, "fields": SEMANTIC_SCHOLAR_FIELDS})
+        return [ArticleRecord.from_semantic_scholar(meta) for meta in (res.json().get("data") or [])] \
+            if res else []
+
+    @staticmethod
+    def fetch_batch(dois: list[str]) -> dict[str, ArticleRecord]:
+        """
+        Resolve many DOIs with the paper batch endpoint, SEMANTIC_SCHOLAR_BATCH_SIZE ids per request.
+        Returns {normalized DOI: ArticleRecord} for the papers that were found.
+        """
+        client = HttpClient.shared()
+        dois = list(dict.fromkeys(normalize_doi(doi) for doi in dois if doi))
+        results = {}
+        for start in range(0, len(dois), SEMANTIC_SCHOLAR_BATCH_SIZE):
+            chunk = dois[start:start + SEMANTIC_SCHOLAR_BATCH_SIZE]
+            res = client.post(f"{SEMANTIC_SCHOLAR_API}/paper/batch", params={"fields": SEMANTIC_SCHOLAR_FIELDS},
+                              json={"ids": [f"DOI:{doi}" for doi in chunk]}, provider="semantic_scholar")
+            res.raise_for_status()
+            # Papers come back in request order, with null for unknown ids.
+            for doi, meta in zip(chunk, res.json()):
+                if meta:
+                    results[doi] = ArticleRecord.from_semantic_scholar(meta)
+        return results
+
+
+class CrossrefProvider(MetadataProvider):
+    name = "CrossRef"
+
+    def lookup_doi(self, doi: str) -> ArticleRecord | None:
+        res = self._get(f"{CROSSREF_API}/works/{quote(doi, safe='/')}", "crossref")
+        meta = res.json().get("message") if res else None
+        return ArticleRecord.from_crossref(meta) if meta else None
+
+    def search_title(self, title: str, limit: int) -> list[ArticleRecord]:
+        res = self._get(f"{CROSSREF_API}/works", "crossref", params={"query": title, "rows": limit})
+        return [ArticleRecord.from_crossref(meta)
+                for meta in (res.json().get("message", {}).get("items") or [])] if res else []
+
+
+class OpenAlexProvider(MetadataProvider):
+    name = "OpenAlex"
+
+    def lookup_doi(self, doi: str) -> ArticleRecord | None:
+        res = self._get(f"{OPENALEX_API}/works/https://doi.org/{quote(normalize_doi(doi), safe='/')}", "openalex")
+        return ArticleRecord.from_openalex(res.json()) if res else None
+
+    def search_title(self, title: str, limit: int) -> list[ArticleRecord]:
+        res = self._get(f"{OPENALEX_API}/works", "openalex", params={"search": title, "per-page": limit})
+        return [ArticleRecord.from_openalex(work) for work in (res.json().get("results") or [])] \
+            if res else []
+
+
+class PubMedProvider(MetadataProvider):
+    name = "PubMed"
+
+    def lookup_doi(self, doi: str) -> ArticleRecord | None:
+        return next(iter(self._search(f"{normalize_doi(doi)}[doi]", 1)), None)
+
+    def search_title(self, title: str, limit: int) -> list[ArticleRecord]:
+        return self._search(f"{title}[Title]", limit)
+
+    def _search(self, term: str, limit: int) -> list[ArticleRecord]:
+        res = self._get(f"{PUBMED_API}/esearch.fcgi", "pubmed",
+                        params={"db": "pubmed", "term": term, "retmax": limit, "retmode": "json"})
+        ids = (res.json().get("esearchresult") or {}).get("idlist") or [] if res else []
+        if not ids:
+            return []
+        res = self._get(f"{PUBMED_API}/esummary.fcgi", "pubmed",
+                        params={"db": "pubmed", "id": ",".join(ids), "retmode": "json"})
+        summaries = res.json().get("result") or {} if res else {}
+        return [ArticleRecord.from_pubmed(summaries[uid]) for uid in ids if uid in summaries]
+
+
+class ArxivProvider(MetadataProvider):
+    """arXiv only resolves its own DOIs (10.48550/arXiv.<id>), but searches every title."""
+    name = "arXiv"
+    _NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+
+    def supports(self, kind: str, value: str) -> bool:
+        return kind != "doi" or normalize_doi(value).startswith(ARXIV_DOI_PREFIX)
+
+    def lookup_doi(self, doi: str) -> ArticleRecord | None:
+        arxiv_id = normalize_doi(doi)[len(ARXIV_DOI_PREFIX):]
+        return next(iter(self._query({"id_list": arxiv_id, "max_results": 1})), None)
+
+    def search_title(self, title: str, limit: int) -> list[ArticleRecord]:
+        words = " AND ".join(f"ti:{word}" for word in title.replace('"', " ").split() if len(word) > 2)
+        return self._query({"search_query": words, "max_results": limit}) if words else []
+
+    def _query(self, params: dict) -> list[ArticleRecord]:
+        res = self._get(ARXIV_API, "arxiv", params=params)
+        if not res:
+            return []
+        entries = []
+        for entry in ET.fromstring(res.content).findall("atom:entry", self._NS):
+            text = lambda path: (entry.findtext(path, default="", namespaces=self._NS) or "").strip()
+            if not text("atom:title"):
+                continue
+            entries.append(ArticleRecord.from_arxiv({
+                "id": text("atom:id"),
+                "title": text("atom:title"),
+                "authors": [name.text.strip() for name in entry.findall("atom:author/atom:name", self._NS)
+                            if name.text],
+                "published": text("atom:published"),
+                "doi": text("arxiv:doi"),
+                "journal_ref": text("arxiv:journal_ref"),
+            }))
+        return entries
+
+
+class ProviderRouter:
+    """
+    Orders providers by their rolling latency and success rate for each identifier type, asks the best one
+    first and hedges to the next one when it is slow or fails.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, providers: list[MetadataProvider]):
+        self.providers = providers
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "ProviderRouter":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls([SemanticScholarProvider(), CrossrefProvider(), OpenAlexProvider(),
+                                   PubMedProvider(), ArxivProvider()])
+            return cls._shared
+
+    def ranked(self, kind: str, value: str) -> list[MetadataProvider]:
+        """Providers able to answer, best expected first."""
+        candidates = [p for p in self.providers if p.supports(kind, value)]
+        return sorted(candidates, key=lambda p: self._score(p, kind))
+
+    def status(self) -> dict[str, dict]:
+        """Rolling mean latency and success rate of every provider and identifier type that was used."""
+        with self._lock:
+            stats = {key: list(window) for key, window in self._stats.items()}
+        return {
+            f"{name} ({kind})": {
+                "latency": round(sum(latency for latency, _ in window) / len(window), 3),
+                "success_rate": round(sum(1 for _, ok in window if ok) / len(window), 3),
+                "samples": len(window),
+            }
+            for (name, kind), window in stats.items() if window
+        }
+
+    def lookup_doi(self, doi: str, on_error: Callable[[Exception], None] | None = None) -> ArticleRecord | None:
+        """
+        Return the first complete answer. Providers still running when it arrives are merged in
+        if they answer within MERGE_WINDOW.
+        """
+        queue = self.ranked("doi", doi)
+        if not queue:
+            return None
+        pool = ThreadPoolExecutor(max_workers=len(queue))
+        # The lookups count in the caller's network category, e.g. background for batch workers.
+        timed = NetworkGovernor.shared().bind(self._timed)
+        pending = set()
+        providers = {}
+        results = []
+        winner = None
+
+        def launch():
+            provider = queue.pop(0)
+            future = pool.submit(timed, provider, "doi", provider.lookup_doi, doi, on_error)
+            providers[future] = provider
+            pending.add(future)
+            return provider
+
+        try:
+            deadline = time.monotonic() + PROVIDER_TIMEOUT
+            hedge_delay = self._hedge_delay(launch(), "doi")
+            while pending and winner is None:
+                remaining = max(0.0, deadline - time.monotonic())
+                done, pending_left = wait(pending, timeout=min(hedge_delay, remaining) if queue else remaining,
+                                          return_when=FIRST_COMPLETED)
+                pending.clear()
+                pending.update(pending_left)
+                for future in done:
+                    res = future.result()
+                    if res:
+                        results.append(res)
+                        if winner is None and is_complete(res):
+                            winner = res
+                if winner is not None or time.monotonic() >= deadline:
+                    break
+                # Hedge when the running providers are slow or none of them is left running.
+                if queue and (not done or not pending):
+                    hedge_delay = self._hedge_delay(launch(), "doi")
+
+            if winner is not None and pending:
+                done, pending_left = wait(pending, timeout=MERGE_WINDOW)
+                results.extend(res for res in (future.result() for future in done) if res)
+                pending = pending_left
+            elif pending:
+                # Without an answer, providers still running have timed out rather than found nothing.
+                self._report_timeouts({future: providers[future] for future in pending}, on_error)
+
+            if winner is None and results:
+                winner = results[0]
+            for other in results:
+                if other is not winner:
+                    winner = merge_results(winner, other)
+            return winner
+        finally:
+            # Running lookups cannot be interrupted; they finish in the background and are discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def search_title(self, title: str, limit: int,
+                     on_error: Callable[[Exception], None] | None = None) -> list[ArticleRecord]:
+        """Collect up to `limit` hits from each of the TITLE_FANOUT best providers."""
+        providers = self.ranked("title", title)[:TITLE_FANOUT]
+        if not providers:
+            return []
+        pool = ThreadPoolExecutor(max_workers=len(providers))
+        timed = NetworkGovernor.shared().bind(self._timed)
+        futures = {pool.submit(timed, provider, "title", provider.search_title, title, on_error, limit): provider
+                   for provider in providers}
+        candidates = []
+        try:
+            done, not_done = wait(futures, timeout=PROVIDER_TIMEOUT)
+            for future in done:
+                candidates.extend(future.result() or [])
+            self._report_timeouts({future: futures[future] for future in not_done}, on_error)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return candidates
+
+    @staticmethod
+    def _report_timeouts(pending: dict, on_error: Callable[[Exception], None] | None) -> None:
+        """Report the providers that did not answer within PROVIDER_TIMEOUT, so a miss is not taken as final."""
+        if on_error:
+            for provider in pending.values():
+                on_error(TimeoutError(f"{provider.name} did not answer within {PROVIDER_TIMEOUT}s"))
+
+    def _timed(self, provider: MetadataProvider, kind: str, func, value: str, on_error, *args):
+        start = time.monotonic()
+        try:
+            res = func(value, *args)
+        except Exception as e:
+            self._record(provider, kind, time.monotonic() - start, False)
+            if on_error:
+                on_error(e)
+            return None
+        self._record(provider, kind, time.monotonic() - start, bool(res))
+        return res
+
+    def _record(self, provider: MetadataProvider, kind: str, latency: float, ok: bool) -> None:
+        with self._lock:
+            self._stats.setdefault((provider.name, kind), deque(maxlen=ROLLING_WINDOW)).append((latency, ok))
+
+    def _score(self, provider: MetadataProvider, kind: str) -> float:
+        """Expected seconds per useful answer: mean latency divided by the (smoothed) success rate."""
+        with self._lock:
+            window = list(self._stats.get((provider.name, kind), ()))
+        # Unmeasured providers keep their registration order.
+        latency = PRIOR_LATENCY * (1 + 0.1 * self.providers.index(provider))
+        if window:
+            latency = sum(latency for latency, _ in window) / len(window)
+        success = (sum(1 for _, ok in window if ok) + 1) / (len(window) + 2)
+        return latency / success
+
+    def _hedge_delay(self, provider: MetadataProvider, kind: str) -> float:
+        """Wait about as long as the provider usually needs before asking the next one."""
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self._stats.get((provider.name, kind), ()) if ok)
+        if not latencies:
+            return PRIOR_LATENCY
+        return max(MIN_HEDGE_DELAY, latencies[int(len(latencies) * 0.75) - 1 if len(latencies) > 1 else 0] * 1.5)
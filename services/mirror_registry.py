@@ -0,0 +1,172 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger("MirrorRegistry")
+
+MIRRORS_CACHE = "scihub_mirrors.json"
+DISCOVERY_URL = "https://sci-hub.now.sh/"
+# Seconds a discovered mirror list stays fresh, and the timeout of one health probe.
+DISCOVERY_TTL = 24 * 60 * 60
+PROBE_TIMEOUT = 5.0
+# Circuit breaker: consecutive failures that open it, and the seconds before a mirror is tried again.
+FAILURE_THRESHOLD = 3
+OPEN_SECONDS = 5 * 60
+# Weight of a new latency sample in the moving average.
+LATENCY_ALPHA = 0.3
+
+
+class MirrorRegistry:
+    """
+    Sci-Hub mirrors discovered once per DISCOVERY_TTL and cached on disk, probed concurrently for latency,
+    with a circuit breaker per mirror. `best()` returns the fastest mirror whose breaker is closed (or half-open
+    after OPEN_SECONDS), so a download does not wait for discovery once a list is cached.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, client, cache_path=MIRRORS_CACHE):
+        self.client = client
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._discovery_lock = threading.Lock()
+        self._refreshing = False
+        self._mirrors = {}
+        self._discovered_at = 0.0
+        self._load()
+
+    @classmethod
+    def shared(cls, client) -> "MirrorRegistry":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(client)
+            return cls._shared
+
+    def best(self, exclude: str | None = None) -> str | None:
+        """
+        Fastest usable mirror other than `exclude` when possible. Discovers mirrors on first use;
+        a stale list is refreshed in the background.
+        """
+        if not self._mirrors:
+            # Concurrent first calls wait for a single discovery.
+            with self._discovery_lock:
+                if not self._mirrors:
+                    self.refresh()
+        elif time.time() - self._discovered_at > DISCOVERY_TTL:
+            self._refresh_in_background()
+        now = time.time()
+        with self._lock:
+            usable = [(state["latency"], url) for url, state in self._mirrors.items()
+                      if state["healthy"] and state["open_until"] <= now]
+            if len(usable) > 1:
+                usable = [(latency, url) for latency, url in usable if url != exclude]
+            if not usable:
+                # Everything failed recently: fall back to the mirror whose breaker closes first.
+                usable = [(state["open_until"], url) for url, state in self._mirrors.items()]
+        return min(usable)[1] if usable else None
+
+    def report_success(self, url: str, latency: float) -> None:
+        with self._lock:
+            state = self._mirrors.get(url)
+            if state:
+                state["failures"] = 0
+                state["open_until"] = 0.0
+                state["healthy"] = True
+                state["latency"] = (1 - LATENCY_ALPHA) * state["latency"] + LATENCY_ALPHA * latency
+        self._save()
+
+    def report_failure(self, url: str) -> None:
+        """Count a failure; FAILURE_THRESHOLD in a row open the mirror's breaker for OPEN_SECONDS."""
+        with self._lock:
+            state = self._mirrors.get(url)
+            if not state:
+                return
+            state["failures"] += 1
+            # A half-open mirror that fails again is opened at once.
+            if state["failures"] >= FAILURE_THRESHOLD or state["open_until"]:
+                state["open_until"] = time.time() + OPEN_SECONDS
+                logger.info("Circuit opened for %s", url)
+        self._save()
+
+    def refresh(self) -> None:
+        """Discover the mirror list and probe every mirror; the cached list is kept if discovery fails."""
+        try:
+            urls = self._discover()
+        except Exception as e:
+            logger.info("Mirror discovery failed: %s", e)
+            urls = list(self._mirrors)
+        if not urls:
+            return
+        latencies = self.probe(urls)
+        with self._lock:
+            mirrors = {}
+            for url in urls:
+                state = self._mirrors.get(url) or {"failures": 0, "open_until": 0.0}
+                latency = latencies.get(url)
+                state["healthy"] = latency is not None
+                state["latency"] = latency if latency is not None else PROBE_TIMEOUT
+                mirrors[url] = state
+            self._mirrors = mirrors
+            self._discovered_at = time.time()
+        self._save()
+
+    def probe(self, urls: list[str]) -> dict[str, float | None]:
+        """Concurrently request each mirror's home page; returns {url: seconds}, None for unhealthy mirrors."""
+        def timed(url):
+            start = time.monotonic()
+            try:
+                res = self.client.get(url, timeout=PROBE_TIMEOUT)
+            except Exception:
+                return url, None
+            return url, time.monotonic() - start if res.status_code < 500 else None
+
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as pool:
+            return dict(pool.map(timed, urls))
+
+    def status(self) -> dict[str, dict]:
+        with self._lock:
+            return {url: dict(state) for url, state in self._mirrors.items()}
+
+    def _discover(self) -> list[str]:
+        res = self.client.get(DISCOVERY_URL, timeout=PROBE_TIMEOUT)
+        soup = BeautifulSoup(res.content, "html.parser")
+        urls = [a["href"].rstrip("/") for a in soup.find_all("a", href=True) if "sci-hub." in a["href"]]
+        return list(dict.fromkeys(urls))
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                self._refreshing = False
+        threading.Thread(target=run, daemon=True).start()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._mirrors = data.get("mirrors", {})
+            self._discovered_at = data.get("discovered_at", 0.0)
+        except (OSError, ValueError) as e:
+            logger.info("Ignoring unreadable mirror cache: %s", e)
+
+    def _save(self) -> None:
+        with self._lock:
+            data = {"discovered_at": self._discovered_at, "mirrors": self._mirrors}
+            try:
+                with open(self.cache_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1)
+            except OSError as e:
+                logger.info("Could not write the mirror cache: %s", e)
@@ -0,0 +1,154 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Categories of network work. Interactive lookups are the ones a user is waiting for.
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+DOWNLOAD = "download"
+UPLOAD = "upload"
+# Default share of the connections and of the bandwidth of each category.
+CATEGORY_SHARES = {INTERACTIVE: 0.4, DOWNLOAD: 0.3, BACKGROUND: 0.2, UPLOAD: 0.1}
+# Rate limiter providers whose traffic always belongs to one category.
+PROVIDER_CATEGORIES = {"scihub": DOWNLOAD, "zotero": UPLOAD}
+MAX_CONNECTIONS = 24
+# Bytes per second across all categories; 0 leaves the bandwidth unlimited.
+MAX_BANDWIDTH = 0
+# Seconds of traffic a category may transfer at once after being idle.
+BURST_SECONDS = 1.0
+
+
+class NetworkGovernor:
+    """
+    Process-wide budget of concurrent connections and bandwidth, split between categories of network work.
+    Each category holds at most its share of the connections. The bandwidth is divided between the categories
+    that currently hold a connection in proportion to their shares, so an idle category does not waste its part.
+    Limits and shares can be changed while transfers are running.
+
+    The category of a transfer comes from its provider (see PROVIDER_CATEGORIES), else from the calling thread
+    (see `using`), else it is INTERACTIVE.
+    """
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_connections: int = MAX_CONNECTIONS, max_bandwidth: int = MAX_BANDWIDTH,
+                 shares: dict[str, float] | None = None):
+        self.max_connections = max_connections
+        self.max_bandwidth = max_bandwidth
+        self.shares = dict(shares or CATEGORY_SHARES)
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._active = {}
+        self._waiting = {}
+        self._next_free = {}
+        self._transferred = {}
+
+    @classmethod
+    def shared(cls) -> "NetworkGovernor":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def configure(self, max_connections: int | None = None, max_bandwidth: int | None = None,
+                  shares: dict[str, float] | None = None) -> None:
+        """Change the limits; waiting and running transfers follow the new values at once."""
+        with self._cond:
+            if max_connections is not None:
+                self.max_connections = max(1, int(max_connections))
+            if max_bandwidth is not None:
+                self.max_bandwidth = max(0, int(max_bandwidth))
+            if shares:
+                self.shares.update({category: share for category, share in shares.items() if share > 0})
+            self._cond.notify_all()
+
+    def category_for(self, provider: str | None = None) -> str:
+        return PROVIDER_CATEGORIES.get(provider) or getattr(self._local, "category", None) or INTERACTIVE
+
+    @contextmanager
+    def using(self, category: str):
+        """Count the network work of the current thread under `category` inside the block."""
+        previous = getattr(self._local, "category", None)
+        self._local.category = category
+        try:
+            yield
+        finally:
+            self._local.category = previous
+
+    def bind(self, func, category: str | None = None):
+        """
+        Wrap `func` to run in `category`, by default the calling thread's, e.g. when it is submitted
+        to a thread pool.
+        """
+        category = category or getattr(self._local, "category", None)
+
+        def run(*args, **kwargs):
+            with self.using(category):
+                return func(*args, **kwargs)
+        return run
+
+    @contextmanager
+    def connection(self, provider: str | None = None):
+        """Hold a connection slot of the category inside the block; waits while the category is at its quota."""
+        category = self.category_for(provider)
+        with self._cond:
+            self._waiting[category] = self._waiting.get(category, 0) + 1
+            try:
+                self._cond.wait_for(lambda: self._admits(category))
+            finally:
+                self._waiting[category] -= 1
+            self._active[category] = self._active.get(category, 0) + 1
+        try:
+            yield category
+        finally:
+            with self._cond:
+                self._active[category] -= 1
+                self._cond.notify_all()
+
+    def throttle(self, nbytes: int, provider: str | None = None) -> None:
+        """Account `nbytes` transferred and sleep as long as needed to keep the category within its bandwidth."""
+        category = self.category_for(provider)
+        with self._cond:
+            self._transferred[category] = self._transferred.get(category, 0) + nbytes
+            rate = self._bandwidth(category)
+            if not rate:
+                return
+            now = time.monotonic()
+            start = max(self._next_free.get(category, 0.0), now - BURST_SECONDS)
+            self._next_free[category] = start + nbytes / rate
+            wait = self._next_free[category] - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def status(self) -> dict[str, dict]:
+        """Share, quota, open and waiting connections, current bandwidth and bytes transferred of each category."""
+        with self._cond:
+            categories = set(self.shares) | set(self._active) | set(self._transferred)
+            return {
+                category: {
+                    "share": self._share(category),
+                    "quota": self._quota(category),
+                    "connections": self._active.get(category, 0),
+                    "waiting": self._waiting.get(category, 0),
+                    "bandwidth": round(self._bandwidth(category)),
+                    "transferred": self._transferred.get(category, 0),
+                }
+                for category in sorted(categories)
+            }
+
+    def _share(self, category: str) -> float:
+        return self.shares.get(category) or min(self.shares.values())
+
+    def _quota(self, category: str) -> int:
+        return max(1, round(self.max_connections * self._share(category) / sum(self.shares.values())))
+
+    def _admits(self, category: str) -> bool:
+        return (self._active.get(category, 0) < self._quota(category)
+                and sum(self._active.values()) < self.max_connections)
+
+    def _bandwidth(self, category: str) -> float:
+        """Bytes per second of the category among the active ones; 0 when the bandwidth is unlimited."""
+        if not self.max_bandwidth:
+            return 0.0
+        active = {c for c, count in self._active.items() if count} | {category}
+        return self.max_bandwidth * self._share(category) / sum(self._share(c) for c in active)
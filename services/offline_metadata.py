@@ -0,0 +1,256 @@
+import argparse
+import gzip
+import json
+import re
+import sqlite3
+from sqlite3 import Connection
+from typing import Callable, Iterator
+
+from services.article_record import ArticleRecord, _date_parts
+from services.doi_utils import normalize_doi
+
+OFFLINE_METADATA_DB = "offline_metadata.db"
+IMPORT_BATCH_SIZE = 5000
+
+_WORK_COLUMNS = ("doi", "title", "title_key", "authors", "published", "publisher", "journal", "issn", "url",
+                 "open_access", "origin")
+
+
+class OfflineMetadataStore:
+    """
+    Local SQLite store of article metadata imported from Crossref or OpenAlex JSON Lines dumps,
+    answering DOI and title lookups without network access.
+    """
+
+    def __init__(self, db_path=OFFLINE_METADATA_DB):
+        self.db_path = db_path
+        self._create_tables()
+
+    def _get_connection(self) -> Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_tables(self):
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS works (
+                doi TEXT PRIMARY KEY,
+                title TEXT,
+                title_key TEXT,
+                authors TEXT,
+                published TEXT,
+                publisher TEXT,
+                journal TEXT,
+                issn TEXT,
+                url TEXT,
+                open_access INTEGER,
+                origin TEXT
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_works_title_key ON works (title_key)")
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS works_fts USING fts5(title, content='works', content_rowid='rowid')
+        ''')
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS works_ai AFTER INSERT ON works BEGIN
+                INSERT INTO works_fts (rowid, title) VALUES (new.rowid, new.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS works_ad AFTER DELETE ON works BEGIN
+                INSERT INTO works_fts (works_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS works_au AFTER UPDATE ON works BEGIN
+                INSERT INTO works_fts (works_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+                INSERT INTO works_fts (rowid, title) VALUES (new.rowid, new.title);
+            END;
+        ''')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def title_key(title: str) -> str:
+        return " ".join(re.sub(r"[^\w]+", " ", (title or "").lower()).split())
+
+    def import_dump(self, path: str, progress: Callable[[int], None] | None = None) -> int:
+        """
+        Stream a Crossref or OpenAlex dump (JSON Lines, optionally gzipped) into the store.
+        Lines may hold a single work or a Crossref {"items": [...]} page. Returns the number of works imported.
+        """
+        conn = self._get_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        cursor = conn.cursor()
+        placeholders = ", ".join("?" for _ in _WORK_COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in _WORK_COLUMNS[1:])
+        statement = (f"INSERT INTO works ({', '.join(_WORK_COLUMNS)}) VALUES ({placeholders}) "
+                     f"ON CONFLICT(doi) DO UPDATE SET {updates}")
+
+        imported = 0
+        batch = []
+        try:
+            for work in self._read_works(path):
+                row = self._parse_work(work)
+                if not row:
+                    continue
+                batch.append(row)
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    cursor.executemany(statement, batch)
+                    conn.commit()
+                    imported += len(batch)
+                    batch = []
+                    if progress:
+                        progress(imported)
+            if batch:
+                cursor.executemany(statement, batch)
+                conn.commit()
+                imported += len(batch)
+                if progress:
+                    progress(imported)
+        finally:
+            conn.close()
+        return imported
+
+    def find_by_doi(self, doi: str) -> ArticleRecord | None:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(_WORK_COLUMNS)} FROM works WHERE doi = ?", (normalize_doi(doi),))
+        row = cursor.fetchone()
+        conn.close()
+        return self._to_article(row) if row else None
+
+    def find_by_title(self, title: str, limit: int = 1) -> list[ArticleRecord]:
+        """Exact matches of the normalized title first, then full-text matches ranked by relevance."""
+        key = self.title_key(title)
+        if not key:
+            return []
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(_WORK_COLUMNS)} FROM works WHERE title_key = ? LIMIT ?", (key, limit))
+        rows = cursor.fetchall()
+        if len(rows) < limit:
+            query = " ".join(f'"{token}"' for token in key.split())
+            cursor.execute(f'''
+                SELECT {', '.join("w." + column for column in _WORK_COLUMNS)}
+                FROM works_fts JOIN works w ON w.rowid = works_fts.rowid
+                WHERE works_fts MATCH ? AND w.title_key != ?
+                ORDER BY bm25(works_fts) LIMIT ?
+            ''', (query, key, limit - len(rows)))
+            rows += cursor.fetchall()
+        conn.close()
+        return [self._to_article(row) for row in rows]
+
+    def count(self) -> int:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM works")
+        total = cursor.fetchone()[0]
+        conn.close()
+        return total
+
+    @staticmethod
+    def _read_works(path: str) -> Iterator[dict]:
+        opener = gzip.open if path.lower().endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and isinstance(record.get("items"), list):
+                    yield from record["items"]
+                elif isinstance(record, dict):
+                    yield record
+
+    @staticmethod
+    def _parse_work(work: dict) -> tuple | None:
+        if str(work.get("id", "")).startswith("https://openalex.org/"):
+            return OfflineMetadataStore._parse_openalex(work)
+        return OfflineMetadataStore._parse_crossref(work)
+
+    @staticmethod
+    def _parse_crossref(work: dict) -> tuple | None:
+        doi = work.get("DOI")
+        if not doi:
+            return None
+        title = (work.get("title") or [""])[0]
+        date_parts = (work.get("published-print") or work.get("issued") or {}).get("date-parts")
+        return (
+            normalize_doi(doi),
+            title,
+            OfflineMetadataStore.title_key(title),
+            json.dumps([f'{a.get("family", "")}, {a.get("given", "")}' for a in work.get("author", [])]),
+            json.dumps(list(_date_parts(date_parts))),
+            work.get("publisher"),
+            (work.get("container-title") or [None])[0],
+            (work.get("ISSN") or [None])[0],
+            work.get("URL"),
+            1 if work.get("license") else 0,
+            "Crossref",
+        )
+
+    @staticmethod
+    def _parse_openalex(work: dict) -> tuple | None:
+        doi = work.get("doi")
+        if not doi:
+            return None
+        title = work.get("title") or work.get("display_name") or ""
+        authors = []
+        for authorship in work.get("authorships") or []:
+            name = ((authorship.get("author") or {}).get("display_name") or "").strip()
+            given, _, family = name.rpartition(" ")
+            authors.append(f"{family}, {given}" if given else name)
+        # Malformed dates in a dump are read as far as they go instead of aborting the import.
+        published = list(_date_parts(work.get("publication_date")) or _date_parts(work.get("publication_year")))
+        location = work.get("primary_location") or {}
+        source = location.get("source") or {}
+        return (
+            normalize_doi(doi),
+            title,
+            OfflineMetadataStore.title_key(title),
+            json.dumps(authors),
+            json.dumps(published),
+            source.get("host_organization_name"),
+            source.get("display_name"),
+            source.get("issn_l") or (source.get("issn") or [None])[0],
+            location.get("landing_page_url") or f"https://doi.org/{normalize_doi(doi)}",
+            1 if (work.get("open_access") or {}).get("is_oa") else 0,
+            "OpenAlex",
+        )
+
+    @staticmethod
+    def _to_article(row: tuple) -> ArticleRecord:
+        """Build the ArticleRecord the online providers return; authors are stored as "Family, Given"."""
+        work = dict(zip(_WORK_COLUMNS, row))
+        authors = (author.partition(",") for author in json.loads(work["authors"] or "[]"))
+        return ArticleRecord(
+            title=work["title"] or None,
+            authors=tuple((family.strip(), given.strip()) for family, _, given in authors if family.strip()),
+            published=tuple(part for part in json.loads(work["published"] or "[]") if isinstance(part, int)),
+            publisher=work["publisher"] or None,
+            doi=work["doi"],
+            journal=work["journal"] or None,
+            issn=work["issn"] or None,
+            url=work["url"] or None,
+            open_access=bool(work["open_access"]),
+            source=f'Offline {work["origin"]}',
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import Crossref/OpenAlex metadata dumps for offline lookups.')
+    parser.add_argument('dumps', metavar='path', nargs='+', help='JSON Lines dump files, optionally gzipped')
+    parser.add_argument('-d', '--database', metavar='path', help='offline metadata database',
+                        default=OFFLINE_METADATA_DB, type=str)
+    args = parser.parse_args()
+
+    store = OfflineMetadataStore(args.database)
+    for path in args.dumps:
+        imported = store.import_dump(path, progress=lambda count: print(f"\r{path}: {count} works", end=""))
+        print(f"\r{path}: {imported} works imported")
+    print(f"{store.count()} works in {args.database}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import threading
+import time
+
+# (requests per second, burst size) for each remote service.
+PROVIDER_LIMITS = {
+    "semantic_scholar": (1.0, 3),
+    "crossref": (5.0, 5),
+    "scihub": (2.0, 2),
+    "openalex": (10.0, 10),
+    "pubmed": (3.0, 3),
+    "arxiv": (0.33, 1),
+    "zotero": (2.0, 5),
+}
+DEFAULT_LIMIT = (5.0, 5)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can also be paused, e.g. for a server's Retry-After."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Block until a token is available. Returns False if the timeout expires first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = max(self._blocked_until - now, 0.0)
+                    if not wait:
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            return True
+                        wait = (1 - self._tokens) / self.rate
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    return False
+                time.sleep(min(wait, 1.0))
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def status(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "tokens": round(self._tokens, 2),
+                "capacity": self.capacity,
+                "rate": self.rate,
+                "waiting": self._waiting,
+                "paused_for": round(max(self._blocked_until - now, 0.0), 2),
+            }
+
+    def _refill(self, now: float) -> None:
+        if now < self._blocked_until:
+            self._last = now
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+
+class RateLimiter:
+    """Registry of one token bucket per provider."""
+    _buckets = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def for_provider(cls, provider: str) -> TokenBucket:
+        with cls._lock:
+            if provider not in cls._buckets:
+                cls._buckets[provider] = TokenBucket(*PROVIDER_LIMITS.get(provider, DEFAULT_LIMIT))
+            return cls._buckets[provider]
+
+    @classmethod
+    def status(cls) -> dict[str, dict]:
+        """Current budget and queue depth of every provider that has been used."""
+        with cls._lock:
+            buckets = dict(cls._buckets)
+        return {provider: bucket.status() for provider, bucket in buckets.items()}
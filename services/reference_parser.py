@@ -0,0 +1,128 @@
+import os
+import re
+from services.doi_utils import find_doi, normalize_doi
+
+_BIB_ENTRY_START = re.compile(r"@(\w+)\s*[{(]")
+_BIB_FIELD = re.compile(r"(\w[\w-]*)\s*=\s*")
+_RIS_LINE = re.compile(r"^([A-Z][A-Z0-9])\s{2}-\s?(.*)$")
+
+
+class ReferenceParser:
+    """Reads reference lists (plain DOI/title lists, BibTeX, RIS) into [{"doi": ..., "title": ...}] entries."""
+
+    @staticmethod
+    def parse_file(path: str) -> list[dict]:
+        extension = os.path.splitext(path)[1].lower()
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        if extension == ".bib":
+            entries = ReferenceParser.parse_bibtex(text)
+        elif extension == ".ris":
+            entries = ReferenceParser.parse_ris(text)
+        else:
+            entries = ReferenceParser.parse_list(text)
+        return ReferenceParser._deduplicate(entries)
+
+    @staticmethod
+    def parse_list(text: str) -> list[dict]:
+        """One DOI or title per line; lines containing a DOI are looked up by DOI."""
+        entries = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            doi = find_doi(line)
+            entries.append({"doi": normalize_doi(doi), "title": None} if doi else {"doi": None, "title": line})
+        return entries
+
+    @staticmethod
+    def parse_bibtex(text: str) -> list[dict]:
+        entries = []
+        for match in _BIB_ENTRY_START.finditer(text):
+            if match.group(1).lower() in ("comment", "preamble", "string"):
+                continue
+            body = ReferenceParser._balanced_body(text, match.end())
+            fields = ReferenceParser._bibtex_fields(body)
+            doi = find_doi(fields.get("doi", ""))
+            title = re.sub(r"[{}]", "", fields.get("title", "")).strip()
+            if doi or title:
+                entries.append({"doi": normalize_doi(doi) if doi else None, "title": title or None})
+        return entries
+
+    @staticmethod
+    def parse_ris(text: str) -> list[dict]:
+        entries = []
+        current = {}
+        for line in text.splitlines():
+            match = _RIS_LINE.match(line.strip())
+            if not match:
+                continue
+            tag, value = match.group(1), match.group(2).strip()
+            if tag == "TY":
+                current = {}
+            elif tag == "DO":
+                current["doi"] = value
+            elif tag in ("TI", "T1") and "title" not in current:
+                current["title"] = value
+            elif tag == "ER":
+                doi = find_doi(current.get("doi", ""))
+                if doi or current.get("title"):
+                    entries.append({"doi": normalize_doi(doi) if doi else None, "title": current.get("title")})
+                current = {}
+        return entries
+
+    @staticmethod
+    def _balanced_body(text: str, start: int) -> str:
+        """Return the text of a BibTeX entry up to its matching closing brace."""
+        depth = 1
+        for idx in range(start, len(text)):
+            char = text[idx]
+            if char in "{(":
+                depth += 1
+            elif char in "})":
+                depth -= 1
+                if depth == 0:
+                    return text[start:idx]
+        return text[start:]
+
+    @staticmethod
+    def _bibtex_fields(body: str) -> dict[str, str]:
+        fields = {}
+        pos = 0
+        while True:
+            match = _BIB_FIELD.search(body, pos)
+            if not match:
+                break
+            name = match.group(1).lower()
+            idx = match.end()
+            if idx < len(body) and body[idx] in "{\"":
+                closing = "}" if body[idx] == "{" else "\""
+                depth = 0
+                end = idx
+                for end in range(idx, len(body)):
+                    char = body[end]
+                    if char == "{":
+                        depth += 1
+                    elif char == "}":
+                        depth -= 1
+                    if (closing == "}" and depth == 0) or (closing == "\"" and char == "\"" and end > idx and depth == 0):
+                        break
+                fields[name] = body[idx + 1:end]
+                pos = end + 1
+            else:
+                end = body.find(",", idx)
+                end = len(body) if end == -1 else end
+                fields[name] = body[idx:end].strip()
+                pos = end + 1
+        return fields
+
+    @staticmethod
+    def _deduplicate(entries: list[dict]) -> list[dict]:
+        seen = set()
+        unique = []
+        for entry in entries:
+            key = entry["doi"] or (entry["title"] or "").lower()
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(entry)
+        return unique
@@ -0,0 +1,89 @@
+import re
+from difflib import SequenceMatcher
+
+from services.article_record import ArticleRecord
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+_YEAR = re.compile(r"\b(1[89]\d\d|20\d\d)\b")
+
+# Weights of the ranking signals; title similarity dominates.
+TITLE_WEIGHT = 0.8
+YEAR_WEIGHT = 0.1
+AUTHOR_WEIGHT = 0.1
+AGREEMENT_BONUS = 0.05
+
+
+class TitleMatcher:
+    """Ranks metadata candidates of a title query by normalized title similarity, author and year agreement."""
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(re.sub(r"[^\w]+", " ", str(text or "").lower()).split())
+
+    @staticmethod
+    def token_set_ratio(first: str, second: str) -> float:
+        """Similarity in [0, 1] that ignores word order and extra words on either side."""
+        first, second = TitleMatcher.normalize(first), TitleMatcher.normalize(second)
+        if not first or not second:
+            return 0.0
+        if fuzz is not None:
+            return fuzz.token_set_ratio(first, second) / 100
+        tokens_a, tokens_b = set(first.split()), set(second.split())
+        common = " ".join(sorted(tokens_a & tokens_b))
+        rest_a = (common + " " + " ".join(sorted(tokens_a - tokens_b))).strip()
+        rest_b = (common + " " + " ".join(sorted(tokens_b - tokens_a))).strip()
+        pairs = [(rest_a, rest_b)] + ([(common, rest_a), (common, rest_b)] if common else [])
+        return max(SequenceMatcher(None, a, b).ratio() for a, b in pairs)
+
+    @staticmethod
+    def score(query: str, candidate: ArticleRecord) -> float:
+        """Score a candidate against the query; years and author surnames typed in the query count as evidence."""
+        score = TITLE_WEIGHT * TitleMatcher.token_set_ratio(query, candidate.title or "")
+        query_years = set(_YEAR.findall(query))
+        if query_years and str(candidate.year) in query_years:
+            score += YEAR_WEIGHT
+        query_tokens = set(TitleMatcher.normalize(query).split())
+        surnames = {TitleMatcher.normalize(family).split()[-1]
+                    for family, _ in candidate.authors if TitleMatcher.normalize(family)}
+        if query_tokens & surnames:
+            score += AUTHOR_WEIGHT
+        return score
+
+    @staticmethod
+    def rank(query: str, candidates: list[ArticleRecord], merge=None) -> list[tuple[ArticleRecord, float]]:
+        """
+        Group candidates describing the same DOI (merged with `merge(primary, secondary)` when given),
+        reward papers returned by several providers, and return (record, match score) pairs, best first.
+        """
+        groups = {}
+        for candidate in candidates:
+            key = candidate.doi.lower() if candidate.doi else TitleMatcher.normalize(candidate.title)
+            groups.setdefault(key, []).append(candidate)
+
+        ranked = []
+        for group in groups.values():
+            best = max(group, key=lambda c: TitleMatcher.score(query, c))
+            score = TitleMatcher.score(query, best)
+            if len({c.source for c in group}) > 1:
+                score += AGREEMENT_BONUS
+            merged = best
+            for other in group:
+                if other is not best and merge is not None:
+                    merged = merge(merged, other)
+            ranked.append((merged, round(min(score, 1.0), 3)))
+        ranked.sort(key=lambda pair: pair[1], reverse=True)
+        return ranked
+
+    @staticmethod
+    def with_score(candidate: ArticleRecord, score: float) -> dict:
+        """The display dict of a ranked candidate, listed with its "Match Score"."""
+        return {**candidate.to_dict(), "Match Score": score}
+
+    @staticmethod
+    def without_score(candidate: dict) -> dict:
+        """The candidate without its internal "Match Score", as stored and shown as the article."""
+        return {key: value for key, value in candidate.items() if key != "Match Score"}
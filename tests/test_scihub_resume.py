@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.download_errors import CancelledDownloadError
+from services.http_client import HttpClient
+from workers.scihub import SciHub, CHUNK_SIZE
+
+CONTENT = bytes(range(256)) * 400
+ETAG = '"v1"'
+
+
+class PdfHandler(BaseHTTPRequestHandler):
+    """Serves CONTENT as a pdf, honouring Range/If-Range unless the test sets `server.mode`."""
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        range_header = self.headers.get('Range')
+        if range_header and self.server.mode == 'unsatisfiable':
+            self._send(416, b'', {'Content-Range': 'bytes */%d' % len(CONTENT)})
+        elif range_header and self.server.mode == 'wrong-range':
+            self._send(206, CONTENT, {'Content-Range': 'bytes 0-%d/%d' % (len(CONTENT) - 1, len(CONTENT))})
+        elif range_header and self.headers.get('If-Range') == ETAG:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            self._send(206, CONTENT[start:], {'Content-Range': 'bytes %d-%d/%d'
+                                              % (start, len(CONTENT) - 1, len(CONTENT))})
+        else:
+            self._send(200, CONTENT)
+        # the first ranged request only misbehaves once
+        if range_header:
+            self.server.mode = None
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', ETAG)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), PdfHandler)
+    httpd.requests = []
+    httpd.mode = None
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def scihub():
+    # the mirror registry is not needed for a direct pdf url
+    sh = object.__new__(SciHub)
+    sh.sess = HttpClient()
+    sh.mirror = 'http://127.0.0.1'
+    sh.base_url = sh.mirror + '/'
+    yield sh
+    sh.sess.close()
+
+
+def pdf_url(server):
+    return 'http://127.0.0.1:%d/paper.pdf' % server.server_address[1]
+
+
+def write_partial(scihub, url, destination, size, etag=ETAG):
+    part_path = scihub._part_path(url, destination, 'paper.pdf')
+    with open(part_path, 'wb') as f:
+        f.write(CONTENT[:size])
+    with open(part_path + '.json', 'w') as f:
+        json.dump({'url': url, 'etag': etag, 'last_modified': None}, f)
+    return part_path
+
+
+def assert_complete(result, part_path):
+    with open(result['path'], 'rb') as f:
+        assert f.read() == CONTENT
+    assert result['md5'] == hashlib.md5(CONTENT).hexdigest()
+    assert result['size'] == len(CONTENT)
+    assert not os.path.exists(part_path) and not os.path.exists(part_path + '.json')
+
+
+def test_resume_appends_to_partial_file(server, scihub, tmp_path):
+    url = pdf_url(server)
+    part_path = write_partial(scihub, url, str(tmp_path), 1000)
+    result = scihub.fetch(url, str(tmp_path), 'paper.pdf')
+    assert_complete(result, part_path)
+    assert len(server.requests) == 1
+    assert server.requests[0]['Range'] == 'bytes=1000-'
+    assert server.requests[0]['If-Range'] == ETAG
+
+
+def test_changed_resource_restarts_with_full_body(server, scihub, tmp_path):
+    url = pdf_url(server)
+    part_path = write_partial(scihub, url, str(tmp_path), 1000, etag='"stale"')
+    result = scihub.fetch(url, str(tmp_path), 'paper.pdf')
+    assert_complete(result, part_path)
+    assert len(server.requests) == 1
+    assert server.requests[0]['If-Range'] == '"stale"'
+
+
+def test_unsatisfiable_range_discards_partial_file(server, scihub, tmp_path):
+    server.mode = 'unsatisfiable'
+    url = pdf_url(server)
+    part_path = write_partial(scihub, url, str(tmp_path), 1000)
+    result = scihub.fetch(url, str(tmp_path), 'paper.pdf')
+    assert_complete(result, part_path)
+    assert len(server.requests) == 2
+    assert 'Range' not in server.requests[1]
+
+
+def test_mismatched_content_range_discards_partial_file(server, scihub, tmp_path):
+    server.mode = 'wrong-range'
+    url = pdf_url(server)
+    part_path = write_partial(scihub, url, str(tmp_path), 1000)
+    result = scihub.fetch(url, str(tmp_path), 'paper.pdf')
+    assert_complete(result, part_path)
+    assert len(server.requests) == 2
+    assert 'Range' not in server.requests[1]
+
+
+def test_cancelled_download_keeps_partial_file_for_resuming(server, scihub, tmp_path):
+    url = pdf_url(server)
+    part_path = scihub._part_path(url, str(tmp_path), 'paper.pdf')
+    cancel = threading.Event()
+    with pytest.raises(CancelledDownloadError):
+        scihub.fetch(url, str(tmp_path), 'paper.pdf', progress=lambda received, total: cancel.set(), cancel=cancel)
+    assert os.path.getsize(part_path) == CHUNK_SIZE
+    result = scihub.fetch(url, str(tmp_path), 'paper.pdf')
+    assert_complete(result, part_path)
+    assert server.requests[1]['Range'] == 'bytes=%d-' % CHUNK_SIZE
+
+
+def test_without_partial_file_no_range_is_sent(server, scihub, tmp_path):
+    url = pdf_url(server)
+    result = scihub.fetch(url, str(tmp_path), 'paper.pdf')
+    assert_complete(result, scihub._part_path(url, str(tmp_path), 'paper.pdf'))
+    assert 'Range' not in server.requests[0]
@@ -458,6 +458,34 @@ class Ui_MainWindow(object):
         self.article_search_btn.setIconSize(QtCore.QSize(35, 35))
         self.article_search_btn.setObjectName("article_search_btn")
         self.horizontalLayout_6.addWidget(self.article_search_btn)
+        self.batch_lookup_btn = QtWidgets.QPushButton(parent=self.SearchLinDFrame)
+        self.batch_lookup_btn.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.batch_lookup_btn.setFont(font)
+        self.batch_lookup_btn.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.batch_lookup_btn.setToolTipDuration(0)
+        self.batch_lookup_btn.setText("")
+        icon_batch = QtGui.QIcon()
+        icon_batch.addPixmap(QtGui.QPixmap(":/Icons/icons/stuff.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.batch_lookup_btn.setIcon(icon_batch)
+        self.batch_lookup_btn.setIconSize(QtCore.QSize(35, 35))
+        self.batch_lookup_btn.setObjectName("batch_lookup_btn")
+        self.horizontalLayout_6.addWidget(self.batch_lookup_btn)
+        self.citation_graph_btn = QtWidgets.QPushButton(parent=self.SearchLinDFrame)
+        self.citation_graph_btn.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.citation_graph_btn.setFont(font)
+        self.citation_graph_btn.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.citation_graph_btn.setToolTipDuration(0)
+        self.citation_graph_btn.setText("")
+        icon_citations = QtGui.QIcon()
+        icon_citations.addPixmap(QtGui.QPixmap(":/Icons/icons/webpage.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.citation_graph_btn.setIcon(icon_citations)
+        self.citation_graph_btn.setIconSize(QtCore.QSize(35, 35))
+        self.citation_graph_btn.setObjectName("citation_graph_btn")
+        self.horizontalLayout_6.addWidget(self.citation_graph_btn)
         self.horizontalLayout_2.addWidget(self.SearchLinDFrame)
         self.SearchButtonFram = QtWidgets.QFrame(parent=self.SearchFrame)
         self.SearchButtonFram.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
@@ -476,6 +504,7 @@ class Ui_MainWindow(object):
         self.search_mode_cbox.setObjectName("search_mode_cbox")
         self.search_mode_cbox.addItem("")
         self.search_mode_cbox.addItem("")
+        self.search_mode_cbox.addItem("")
         self.horizontalLayout_7.addWidget(self.search_mode_cbox)
         self.horizontalLayout_2.addWidget(self.SearchButtonFram)
         self.verticalLayout_3.addWidget(self.SearchFrame, 0, QtCore.Qt.AlignmentFlag.AlignVCenter)
@@ -635,6 +664,20 @@ class Ui_MainWindow(object):
         self.article_download_btn.setIconSize(QtCore.QSize(35, 35))
         self.article_download_btn.setObjectName("article_download_btn")
         self.horizontalLayout_10.addWidget(self.article_download_btn)
+        self.download_queue_btn = QtWidgets.QPushButton(parent=self.JournalExportFrame)
+        self.download_queue_btn.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.download_queue_btn.setFont(font)
+        self.download_queue_btn.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.download_queue_btn.setToolTipDuration(0)
+        self.download_queue_btn.setText("")
+        icon_queue = QtGui.QIcon()
+        icon_queue.addPixmap(QtGui.QPixmap(":/Icons/icons/documents.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.download_queue_btn.setIcon(icon_queue)
+        self.download_queue_btn.setIconSize(QtCore.QSize(35, 35))
+        self.download_queue_btn.setObjectName("download_queue_btn")
+        self.horizontalLayout_10.addWidget(self.download_queue_btn)
         self.export_journal_info_btn = QtWidgets.QPushButton(parent=self.JournalExportFrame)
         self.export_journal_info_btn.setMinimumSize(QtCore.QSize(0, 35))
         font = QtGui.QFont()
@@ -1161,6 +1204,14 @@ class Ui_MainWindow(object):
         self.pdf_file_search_btn.setIconSize(QtCore.QSize(35, 35))
         self.pdf_file_search_btn.setObjectName("pdf_file_search_btn")
         self.horizontalLayout_14.addWidget(self.pdf_file_search_btn)
+        self.search_text_cbox = QtWidgets.QCheckBox(parent=self.AddFileFram)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.search_text_cbox.setFont(font)
+        self.search_text_cbox.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.search_text_cbox.setChecked(False)
+        self.search_text_cbox.setObjectName("search_text_cbox")
+        self.horizontalLayout_14.addWidget(self.search_text_cbox)
         self.create_file_btn = QtWidgets.QPushButton(parent=self.AddFileFram)
         self.create_file_btn.setMinimumSize(QtCore.QSize(0, 35))
         font = QtGui.QFont()
@@ -1225,6 +1276,20 @@ class Ui_MainWindow(object):
         self.refrech_toolbox_btn.setIconSize(QtCore.QSize(35, 35))
         self.refrech_toolbox_btn.setObjectName("refrech_toolbox_btn")
         self.horizontalLayout_20.addWidget(self.refrech_toolbox_btn)
+        self.find_duplicates_btn = QtWidgets.QPushButton(parent=self.OtherToolsFram)
+        self.find_duplicates_btn.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.find_duplicates_btn.setFont(font)
+        self.find_duplicates_btn.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.find_duplicates_btn.setToolTipDuration(0)
+        self.find_duplicates_btn.setText("")
+        icon_duplicates = QtGui.QIcon()
+        icon_duplicates.addPixmap(QtGui.QPixmap(":/Icons/icons/documents.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.find_duplicates_btn.setIcon(icon_duplicates)
+        self.find_duplicates_btn.setIconSize(QtCore.QSize(35, 35))
+        self.find_duplicates_btn.setObjectName("find_duplicates_btn")
+        self.horizontalLayout_20.addWidget(self.find_duplicates_btn)
         self.verticalLayout_21.addWidget(self.OtherToolsFram)
         self.verticalLayout_19.addWidget(self.ToolsFram)
         self.verticalLayout_4.addWidget(self.files_managers_tools)
@@ -1469,6 +1534,7 @@ class Ui_MainWindow(object):
         self.article_float_search_mode_cbox.setObjectName("article_float_search_mode_cbox")
         self.article_float_search_mode_cbox.addItem("")
         self.article_float_search_mode_cbox.addItem("")
+        self.article_float_search_mode_cbox.addItem("")
         self.horizontalLayout_32.addWidget(self.article_float_search_mode_cbox)
         self.horizontalLayout_30.addWidget(self.frame_6)
         self.horizontalLayout_29.addWidget(self.frame)
@@ -1573,9 +1639,12 @@ class Ui_MainWindow(object):
         self.article_section_label.setText(_translate.get("Articles Section"))
         self.article_info_led.setPlaceholderText(_translate.get("Enter the Journal DOI or Title"))
         self.article_search_btn.setToolTip(_translate.get("Search for Article"))
+        self.batch_lookup_btn.setToolTip(_translate.get("Batch Lookup"))
+        self.citation_graph_btn.setToolTip(_translate.get("Citation Graph"))
         self.search_mode_cbox.setToolTip(_translate.get("Search Mode"))
         self.search_mode_cbox.setItemText(0, _translate.get("DOI"))
         self.search_mode_cbox.setItemText(1, _translate.get("Title"))
+        self.search_mode_cbox.setItemText(2, _translate.get("Saved Articles"))
 
         self.articles_tree_qwidget.headerItem().setText(0, _translate.get("Parameters"))
         self.articles_tree_qwidget.headerItem().setText(1, _translate.get("Data"))
@@ -1587,6 +1656,7 @@ class Ui_MainWindow(object):
         self.zotero_library_type_cbox.setItemText(1, _translate.get("group"))
         self.article_download_path_ledit.setPlaceholderText(_translate.get("Article Path"))
         self.article_download_btn.setToolTip(_translate.get("Download Article"))
+        self.download_queue_btn.setToolTip(_translate.get("Download Queue"))
         self.export_journal_info_btn.setToolTip(_translate.get("Export Journal"))
         self.pdfs_section_label.setText(_translate.get("PDFs Section"))
         self.Fetch_pdf_led.setPlaceholderText(_translate.get("Enter your search term"))
@@ -1620,10 +1690,13 @@ class Ui_MainWindow(object):
         self.folder_name_input.setToolTip(_translate.get("insert the Folder or the PDF name"))
         self.folder_name_input.setPlaceholderText(_translate.get("Folder/PDF file name"))
         self.pdf_file_search_btn.setToolTip(_translate.get("Search For PDF"))
+        self.search_text_cbox.setToolTip(_translate.get("Search the text of downloaded PDFs instead of the file names"))
+        self.search_text_cbox.setText(_translate.get("Search Text"))
         self.create_file_btn.setToolTip(_translate.get("New Folder"))
         self.open_directory_btn.setToolTip(_translate.get("Open path"))
         self.delete_directory_btn.setToolTip(_translate.get("Delete folder"))
         self.refrech_toolbox_btn.setToolTip(_translate.get("Refresh List"))
+        self.find_duplicates_btn.setToolTip(_translate.get("Find Duplicate PDFs"))
         self.navigation_mode_cbox.setToolTip(_translate.get("Use File Manager To Navigate"))
         self.navigation_mode_cbox.setText(_translate.get("Navigation Mode"))
         self.auto_open_pdf_cbox.setToolTip(_translate.get("Auto Open PDFs after download"))
@@ -1635,6 +1708,7 @@ class Ui_MainWindow(object):
         self.article_float_search_ledit.setPlaceholderText(_translate.get("Enter the Journal DOI or Title"))
         self.article_float_search_mode_cbox.setItemText(0, _translate.get("DOI"))
         self.article_float_search_mode_cbox.setItemText(1, _translate.get("Title"))
+        self.article_float_search_mode_cbox.setItemText(2, _translate.get("Saved Articles"))
 
         self.articles_downloader_mode_btn.setToolTip(_translate.get("Float Mode"))
         self.zotero_add_btn.setToolTip(_translate.get("Add to Zotero"))
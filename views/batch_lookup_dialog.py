@@ -0,0 +1,104 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, \
+    QLabel, QSpinBox, QHeaderView, QAbstractItemView
+
+BATCH_COLUMNS = ["Query", "Title", "Authors", "Year", "DOI", "Journal", "Source", "Status"]
+
+
+class BatchLookupDialog(QDialog):
+    """Table of batch lookup entries whose rows are filled in as results stream in."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Batch Article Lookup")
+        self.resize(1100, 600)
+        self._query_items = {}
+
+        layout = QVBoxLayout(self)
+        tools = QHBoxLayout()
+        self.import_btn = QPushButton("Import DOIs / BibTeX / RIS")
+        self.import_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.import_btn)
+        tools.addWidget(QLabel("Concurrent lookups:"))
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 32)
+        self.concurrency_spin.setValue(8)
+        tools.addWidget(self.concurrency_spin)
+        self.start_btn = QPushButton("Start")
+        self.start_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.start_btn)
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.stop_btn)
+        self.export_btn = QPushButton("Export")
+        self.export_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.export_btn)
+        tools.addStretch()
+        layout.addLayout(tools)
+
+        self.table = QTableWidget(0, len(BATCH_COLUMNS))
+        self.table.setHorizontalHeaderLabels(BATCH_COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.setColumnWidth(0, 200)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("Import a DOI list, a .bib or a .ris file to start.")
+        layout.addWidget(self.status_label)
+
+    def load_entries(self, entries: list[dict]) -> None:
+        """Add one pending row per entry."""
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        self._query_items.clear()
+        self.table.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            query_item = QTableWidgetItem(entry.get("doi") or entry.get("title") or "")
+            self.table.setItem(row, 0, query_item)
+            self.table.setItem(row, len(BATCH_COLUMNS) - 1, QTableWidgetItem("Queued"))
+            self._query_items[row] = query_item
+        self.table.setSortingEnabled(True)
+
+    def set_result(self, entry_index: int, article_data: dict) -> None:
+        published = article_data.get("Published Date", "")
+        if isinstance(published, list):
+            published = published[0] if published else ""
+        values = {
+            "Title": article_data.get("Title", ""),
+            "Authors": "; ".join(article_data.get("Authors", []) or []),
+            "Year": published,
+            "DOI": article_data.get("DOI", ""),
+            "Journal": article_data.get("Journal", ""),
+            "Source": article_data.get("Source", ""),
+            "Status": "Found"
+        }
+        self._set_row(entry_index, values)
+
+    def set_failed(self, entry_index: int, message: str) -> None:
+        self._set_row(entry_index, {"Status": message})
+
+    def _set_row(self, entry_index: int, values: dict) -> None:
+        query_item = self._query_items.get(entry_index)
+        if query_item is None:
+            return
+        self.table.setSortingEnabled(False)
+        row = query_item.row()
+        for column, name in enumerate(BATCH_COLUMNS):
+            if name in values:
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, values[name] if isinstance(values[name], int)
+                             else str(values[name]))
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+
+    def table_rows(self) -> list[list[str]]:
+        """Return the current table content in display order."""
+        rows = []
+        for row in range(self.table.rowCount()):
+            rows.append([self.table.item(row, column).text() if self.table.item(row, column) else ""
+                         for column in range(len(BATCH_COLUMNS))])
+        return rows
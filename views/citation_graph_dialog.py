@@ -0,0 +1,77 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, \
+    QLabel, QSpinBox, QHeaderView, QAbstractItemView, QLineEdit, QComboBox, QCheckBox
+
+GRAPH_COLUMNS = ["Depth", "Title", "Year", "DOI", "In Library"]
+
+
+class CitationGraphDialog(QDialog):
+    """References or citing papers of an article, marking the ones already in the local library."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Citation Graph")
+        self.resize(1100, 600)
+        self._rows = []
+
+        layout = QVBoxLayout(self)
+        tools = QHBoxLayout()
+        self.doi_ledit = QLineEdit()
+        self.doi_ledit.setPlaceholderText("DOI")
+        tools.addWidget(self.doi_ledit)
+        self.direction_cbox = QComboBox()
+        self.direction_cbox.addItems(["References", "Citations"])
+        tools.addWidget(self.direction_cbox)
+        tools.addWidget(QLabel("Depth:"))
+        self.depth_spin = QSpinBox()
+        self.depth_spin.setRange(1, 3)
+        tools.addWidget(self.depth_spin)
+        self.library_only_cbox = QCheckBox("Only papers in library")
+        self.library_only_cbox.toggled.connect(lambda: self.show_rows(self._rows))
+        tools.addWidget(self.library_only_cbox)
+        self.expand_btn = QPushButton("Expand")
+        self.expand_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.expand_btn)
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.stop_btn)
+        layout.addLayout(tools)
+
+        self.table = QTableWidget(0, len(GRAPH_COLUMNS))
+        self.table.setHorizontalHeaderLabels(GRAPH_COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.setColumnWidth(4, 250)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("Enter a DOI and press Expand. Double-click a paper in the library to open it.")
+        layout.addWidget(self.status_label)
+
+    def direction(self) -> str:
+        return self.direction_cbox.currentText().lower()
+
+    def show_rows(self, rows: list[dict]) -> None:
+        self._rows = rows
+        if self.library_only_cbox.isChecked():
+            rows = [row for row in rows if row["paths"]]
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row_idx, row in enumerate(rows):
+            values = [row["depth"], row["title"], row["year"], row["doi"], "; ".join(row["paths"])]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, value if isinstance(value, int) else str(value))
+                if column == 4 and row["paths"]:
+                    item.setData(Qt.ItemDataRole.UserRole, row["paths"][0])
+                self.table.setItem(row_idx, column, item)
+        self.table.setSortingEnabled(True)
+        in_library = sum(1 for row in self._rows if row["paths"])
+        self.status_label.setText(f"{len(self._rows)} paper(s), {in_library} already in the library.")
+
+    def library_path_at(self, row: int) -> str | None:
+        item = self.table.item(row, len(GRAPH_COLUMNS) - 1)
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
@@ -0,0 +1,129 @@
+from PySide6.QtCore import Qt, QItemSelection, QItemSelectionModel
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, \
+    QLabel, QSpinBox, QHeaderView, QAbstractItemView, QComboBox
+from services.library_lookup import USE_EXISTING, COPY, LINK
+
+QUEUE_COLUMNS = ["ID", "Title", "DOI", "State", "Progress", "Attempts", "Error", "Path"]
+EXISTING_MODES = [("Use existing file", USE_EXISTING), ("Copy into folder", COPY), ("Link into folder", LINK)]
+
+
+class DownloadQueueDialog(QDialog):
+    """Download jobs with their state, and the controls of the download manager."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Download Queue")
+        self.resize(1100, 600)
+        self._progress = {}
+
+        layout = QVBoxLayout(self)
+        tools = QHBoxLayout()
+        tools.addWidget(QLabel("Concurrent downloads:"))
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 16)
+        self.concurrency_spin.setValue(3)
+        tools.addWidget(self.concurrency_spin)
+        tools.addWidget(QLabel("Bandwidth (KB/s):"))
+        self.bandwidth_spin = QSpinBox()
+        self.bandwidth_spin.setRange(0, 1_000_000)
+        self.bandwidth_spin.setSingleStep(100)
+        self.bandwidth_spin.setSpecialValueText("Unlimited")
+        self.bandwidth_spin.setToolTip("Total bandwidth of downloads, lookups and uploads")
+        self.bandwidth_spin.setKeyboardTracking(False)
+        tools.addWidget(self.bandwidth_spin)
+        tools.addWidget(QLabel("Connections:"))
+        self.connections_spin = QSpinBox()
+        self.connections_spin.setRange(1, 64)
+        self.connections_spin.setValue(24)
+        self.connections_spin.setToolTip("Total concurrent network connections")
+        self.connections_spin.setKeyboardTracking(False)
+        tools.addWidget(self.connections_spin)
+        tools.addWidget(QLabel("Already in library:"))
+        self.existing_cbox = QComboBox()
+        for label, mode in EXISTING_MODES:
+            self.existing_cbox.addItem(label, mode)
+        self.existing_cbox.setToolTip("What to do when a requested article is already in the library")
+        tools.addWidget(self.existing_cbox)
+        self.pause_all_btn = QPushButton("Pause Queue")
+        self.pause_all_btn.setCheckable(True)
+        self.pause_all_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.pause_all_btn)
+        self.pause_btn = QPushButton("Pause")
+        self.pause_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.pause_btn)
+        self.resume_btn = QPushButton("Resume / Retry")
+        self.resume_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.resume_btn)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.cancel_btn)
+        self.clear_btn = QPushButton("Clear Finished")
+        self.clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        tools.addWidget(self.clear_btn)
+        tools.addStretch()
+        layout.addLayout(tools)
+
+        self.table = QTableWidget(0, len(QUEUE_COLUMNS))
+        self.table.setHorizontalHeaderLabels(QUEUE_COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.setColumnWidth(0, 50)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("No downloads queued. Double-click a finished download to open it.")
+        layout.addWidget(self.status_label)
+
+    def show_jobs(self, jobs: list[dict]) -> None:
+        """Redraw the table, keeping the selected jobs selected."""
+        selected = set(self.selected_job_ids())
+        selection = QItemSelection()
+        self.table.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            values = [job["id"], job["title"], job["doi"], job["state"], self._progress.get(job["id"], ""),
+                      job["attempts"], job["error"], job["pdf_path"]]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, value if isinstance(value, int) else str(value or ""))
+                if column == 0:
+                    item.setData(Qt.ItemDataRole.UserRole, job["id"])
+                self.table.setItem(row, column, item)
+            if job["id"] in selected:
+                selection.select(self.table.model().index(row, 0), self.table.model().index(row, len(values) - 1))
+        # selectRow would replace the selection with each row, so all rows are selected in one call.
+        self.table.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+                                           | QItemSelectionModel.SelectionFlag.Rows)
+        counts = {}
+        for job in jobs:
+            counts[job["state"]] = counts.get(job["state"], 0) + 1
+        self.status_label.setText(", ".join(f"{count} {state}" for state, count in counts.items())
+                                  or "No downloads queued.")
+
+    def set_progress(self, job_id: int, received: int, total: int) -> None:
+        """Show the transferred size of a running download without redrawing the table."""
+        text = f"{received / total:.0%}" if total else f"{received / 1024 / 1024:.1f} MB"
+        self._progress[job_id] = text
+        column = QUEUE_COLUMNS.index("Progress")
+        for row in range(self.table.rowCount()):
+            item = self.table.item(row, 0)
+            if item and item.data(Qt.ItemDataRole.UserRole) == job_id:
+                self.table.item(row, column).setText(text)
+                break
+
+    def existing_mode(self) -> str:
+        return self.existing_cbox.currentData()
+
+    def set_existing_mode(self, mode: str) -> None:
+        index = self.existing_cbox.findData(mode)
+        self.existing_cbox.setCurrentIndex(max(index, 0))
+
+    def selected_job_ids(self) -> list[int]:
+        rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+        return [self.table.item(row, 0).data(Qt.ItemDataRole.UserRole) for row in sorted(rows)
+                if self.table.item(row, 0)]
+
+    def path_at(self, row: int) -> str | None:
+        item = self.table.item(row, QUEUE_COLUMNS.index("Path"))
+        return item.text() if item and item.text() else None
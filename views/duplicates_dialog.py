@@ -0,0 +1,96 @@
+import os
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem, QPushButton, \
+    QLabel, QHeaderView
+
+
+class DuplicatesDialog(QDialog):
+    """Lists duplicate groups and lets the user keep one file per group and resolve the rest."""
+
+    def __init__(self, exact_groups: list, near_groups: list, resolve_callback, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Duplicate PDFs")
+        self.resize(900, 500)
+        self.resolve_callback = resolve_callback
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel(
+            f"{len(exact_groups)} exact duplicate group(s), {len(near_groups)} near-duplicate group(s). "
+            f"Check the file to keep in each group.")
+        layout.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(3)
+        self.tree.setHeaderLabels(["Keep", "File Name", "Folder"])
+        self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        self.tree.header().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.tree.setColumnWidth(1, 300)
+        self.tree.itemChanged.connect(self._on_item_changed)
+        layout.addWidget(self.tree)
+
+        self._add_groups(exact_groups, "Exact duplicates")
+        self._add_groups(near_groups, "Near duplicates")
+        self.tree.expandAll()
+
+        buttons = QHBoxLayout()
+        delete_btn = QPushButton("Delete Others")
+        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        delete_btn.clicked.connect(lambda: self._resolve("delete"))
+        buttons.addWidget(delete_btn)
+        link_btn = QPushButton("Hardlink Others")
+        link_btn.setToolTip("Replace the other copies with hard links to the kept file (same drive only)")
+        link_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        link_btn.clicked.connect(lambda: self._resolve("hardlink"))
+        buttons.addWidget(link_btn)
+        close_btn = QPushButton("Close")
+        close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        close_btn.clicked.connect(self.reject)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def _add_groups(self, groups: list, label: str) -> None:
+        self.tree.blockSignals(True)
+        for number, paths in enumerate(groups, start=1):
+            group_item = QTreeWidgetItem(self.tree, ["", f"{label} #{number}", f"{len(paths)} files"])
+            for idx, path in enumerate(paths):
+                item = QTreeWidgetItem(group_item, ["", os.path.basename(path), os.path.dirname(path)])
+                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(0, Qt.CheckState.Checked if idx == 0 else Qt.CheckState.Unchecked)
+                item.setData(0, Qt.ItemDataRole.UserRole, path)
+                item.setToolTip(1, path)
+        self.tree.blockSignals(False)
+
+    def _on_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
+        """Keep exactly one checked file per group."""
+        parent = item.parent()
+        if parent is None or column != 0 or item.checkState(0) != Qt.CheckState.Checked:
+            return
+        self.tree.blockSignals(True)
+        for i in range(parent.childCount()):
+            child = parent.child(i)
+            if child is not item:
+                child.setCheckState(0, Qt.CheckState.Unchecked)
+        self.tree.blockSignals(False)
+
+    def selected_resolutions(self) -> list[tuple[str, list[str]]]:
+        """Return [(kept_path, [other paths])] for every group with a checked file."""
+        resolutions = []
+        for i in range(self.tree.topLevelItemCount()):
+            group_item = self.tree.topLevelItem(i)
+            keep = None
+            others = []
+            for j in range(group_item.childCount()):
+                child = group_item.child(j)
+                path = child.data(0, Qt.ItemDataRole.UserRole)
+                if child.checkState(0) == Qt.CheckState.Checked:
+                    keep = path
+                else:
+                    others.append(path)
+            if keep and others:
+                resolutions.append((keep, others))
+        return resolutions
+
+    def _resolve(self, action: str) -> None:
+        if self.resolve_callback(action, self.selected_resolutions()):
+            self.accept()
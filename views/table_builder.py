@@ -45,6 +45,48 @@ class TableBuilder:
             else:
                 QTreeWidgetItem(parent, [key, str(value)])
 
+    @staticmethod
+    def add_article_candidates(tree: QTreeWidget, candidates: list) -> QTreeWidgetItem:
+        """
+        Add the ranked alternatives of a title or saved-article search under a collapsed "Other Candidates" item.
+        Candidate details are only built when the candidate is expanded (see populate_article_candidate).
+        """
+        root = QTreeWidgetItem(tree, ["Other Candidates", f"{len(candidates)} ranked matches"])
+        for candidate in candidates:
+            year = candidate.get("Published Date")
+            year = year[0] if isinstance(year, list) and year else year
+            score = f'{candidate["Match Score"]:.0%}' if "Match Score" in candidate else ""
+            item = QTreeWidgetItem(root, [score,
+                                          f'{candidate.get("Title", "N/A")} ({year}, {candidate.get("Source")})'])
+            item.setData(0, Qt.ItemDataRole.UserRole, candidate)
+            item.setToolTip(1, "Double-click to use this article")
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+        root.setExpanded(False)
+        return root
+
+    @classmethod
+    def populate_article_candidate(cls, item: QTreeWidgetItem) -> None:
+        """Fill a candidate item with its metadata the first time it is expanded."""
+        candidate = item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(candidate, dict) and item.childCount() == 0:
+            cls.display_article_data(candidate, item)
+
+    @staticmethod
+    def append_pdf_row(table: QTableWidget, folder_path: str, file_name: str, open_callback, delete_callback) -> None:
+        """Add one PDF to an existing folder table, replacing the "No PDFs Found" placeholder if needed."""
+        if not table.isEnabled():
+            table.clearSpans()
+            table.setRowCount(0)
+            table.setEnabled(True)
+        for row in range(table.rowCount()):
+            item = table.item(row, 0)
+            if item and item.text() == file_name:
+                return
+        row = table.rowCount()
+        table.insertRow(row)
+        TableBuilder._add_file_row(table, row, file_name, os.path.join(folder_path, file_name),
+                                   open_callback, delete_callback)
+
     @staticmethod
     def _add_file_row(table, row, file_name, file_path, open_callback, delete_callback)-> None:
         """Add PDF files to the Tree"""
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PySide6.QtCore import QThread, Signal
+from services.article_lookup import lookup_article
+from services.article_record import ArticleRecord
+from services.doi_utils import normalize_doi
+from services.metadata_cache import MetadataCache
+from services.metadata_providers import SemanticScholarProvider, is_complete
+from services.network_governor import NetworkGovernor, BACKGROUND
+
+
+class BatchLookupWorker(QThread):
+    """
+    Resolves a list of DOI/title entries with a bounded number of concurrent lookups, in the background
+    network category so interactive lookups keep their share.
+    """
+    result = Signal(int, dict)
+    failed = Signal(int, str)
+    progress = Signal(str, int, int)
+
+    def __init__(self, entries: list[dict], max_concurrency: int = 8, use_cache: bool = True):
+        super().__init__()
+        self.entries = entries
+        self.max_concurrency = max(1, max_concurrency)
+        self.use_cache = use_cache
+        self.running = False
+
+    def run(self) -> None:
+        with NetworkGovernor.shared().using(BACKGROUND):
+            self._run()
+
+    def _run(self) -> None:
+        self.running = True
+        total = len(self.entries)
+        prefetched = self._prefetch_dois()
+        lookup = NetworkGovernor.shared().bind(self._lookup)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = {pool.submit(lookup, entry, prefetched): row for row, entry in enumerate(self.entries)}
+            for idx, future in enumerate(as_completed(futures), start=1):
+                row = futures[future]
+                if not self.running:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                try:
+                    res = future.result()
+                    if res:
+                        self.result.emit(row, res.to_dict())
+                    else:
+                        self.failed.emit(row, "No results found.")
+                except Exception as e:
+                    self.failed.emit(row, f"Error: {str(e)}")
+                self.progress.emit(f"Resolved {idx}/{total}", idx, int(idx / total * 100))
+
+    def stop(self) -> None:
+        self.running = False
+
+    def _prefetch_dois(self) -> dict[str, ArticleRecord]:
+        """
+        Resolve the uncached DOIs with the Semantic Scholar batch endpoint and cache the complete results,
+        so only the remaining entries need individual lookups. Without the cache every DOI is fetched.
+        """
+        cache = MetadataCache() if self.use_cache else None
+        dois = [entry["doi"] for entry in self.entries if entry.get("doi")]
+        missing = [doi for doi in dois if not cache or not cache.get(MetadataCache.doi_key(doi))[0]]
+        if not missing:
+            return {}
+        self.progress.emit(f"Fetching {len(missing)} DOI(s) from Semantic Scholar in batches...", 0, 0)
+        try:
+            results = SemanticScholarProvider.fetch_batch(missing)
+        except Exception as e:
+            self.progress.emit(f"Batch request failed, falling back to single lookups: {str(e)}", 0, 0)
+            return {}
+        prefetched = {doi: res for doi, res in results.items() if is_complete(res)}
+        if cache:
+            for doi, res in prefetched.items():
+                cache.put(MetadataCache.doi_key(doi), res)
+        return prefetched
+
+    def _lookup(self, entry: dict, prefetched: dict[str, ArticleRecord]) -> ArticleRecord | None:
+        if entry.get("doi") and normalize_doi(entry["doi"]) in prefetched:
+            return prefetched[normalize_doi(entry["doi"])]
+        return lookup_article(entry.get("doi"), entry.get("title"), use_cache=self.use_cache)
@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
+from PySide6.QtCore import QThread, Signal
+from services.citation_graph import CitationGraph, REFERENCES
+from services.http_client import HttpClient
+from services.library_catalog import LibraryCatalog
+from services.metadata_providers import SEMANTIC_SCHOLAR_API, CROSSREF_API
+from services.network_governor import NetworkGovernor, BACKGROUND
+
+# Papers read per Semantic Scholar page, and the most neighbours kept for one paper.
+PAGE_SIZE = 1000
+MAX_NEIGHBOURS = 5000
+NEIGHBOUR_FIELDS = "title,year,externalIds"
+
+
+class CitationGraphWorker(QThread):
+    """
+    Expands the citation graph around a DOI level by level. Only papers whose references (or citations)
+    were never fetched, were cut at MAX_NEIGHBOURS or are stale are requested, with a bounded number of
+    concurrent lookups.
+    """
+    result = Signal(list)
+    progress = Signal(str)
+    error_occurred = Signal(str)
+
+    def __init__(self, doi: str, direction: str = REFERENCES, depth: int = 1, max_concurrency: int = 4,
+                 db_path: str = "citation_graph.db", library_db_path: str = "library.db"):
+        super().__init__()
+        self.root = CitationGraph.paper_key(doi=doi)
+        self.direction = direction
+        self.depth = max(1, depth)
+        self.max_concurrency = max(1, max_concurrency)
+        self.db_path = db_path
+        self.library_db_path = library_db_path
+        self.running = False
+
+    def run(self) -> None:
+        self.running = True
+        try:
+            graph = CitationGraph(self.db_path)
+            levels = {self.root: 0}
+            frontier = [self.root]
+            for level in range(1, self.depth + 1):
+                if not self.running or not frontier:
+                    break
+                self._expand(graph, graph.unexpanded(frontier, self.direction), level)
+                next_frontier = []
+                for neighbours in graph.neighbours(frontier, self.direction).values():
+                    for key in neighbours:
+                        if key not in levels:
+                            levels[key] = level
+                            next_frontier.append(key)
+                frontier = next_frontier
+            self.result.emit(self._rows(graph, levels))
+        except Exception as e:
+            self.error_occurred.emit(f"Citation graph error: {str(e)}")
+
+    def stop(self) -> None:
+        self.running = False
+
+    def _expand(self, graph: CitationGraph, paper_keys: list[str], level: int) -> None:
+        if not paper_keys:
+            self.progress.emit(f"Level {level}: all {self.direction} already stored locally.")
+            return
+        # Graph expansion is batch work: it runs in the background network category.
+        fetch = NetworkGovernor.shared().bind(self._fetch_neighbours, BACKGROUND)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = {pool.submit(fetch, key, self.direction): key for key in paper_keys}
+            for idx, future in enumerate(as_completed(futures), start=1):
+                if not self.running:
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                key = futures[future]
+                try:
+                    neighbours, truncated = future.result()
+                    graph.save_neighbours(key, self.direction, neighbours, truncated)
+                    if truncated:
+                        self.progress.emit(f"Only the first {MAX_NEIGHBOURS} {self.direction} of {key} were kept.")
+                except Exception as e:
+                    self.progress.emit(f"Failed to fetch {self.direction} of {key}: {str(e)}")
+                self.progress.emit(f"Level {level}: fetched {idx}/{len(paper_keys)} paper(s)")
+
+    def _rows(self, graph: CitationGraph, levels: dict[str, int]) -> list[dict]:
+        """Join the reached papers with the local library."""
+        keys = [key for key in levels if key != self.root]
+        papers = graph.get_papers(keys)
+        in_library = LibraryCatalog(self.library_db_path).find_by_dois(
+            [key for key in keys if not key.startswith("s2:")])
+        rows = []
+        for key in keys:
+            paper = papers.get(key, {})
+            rows.append({
+                "doi": "" if key.startswith("s2:") else key,
+                "title": paper.get("title") or "",
+                "year": paper.get("year") or "",
+                "depth": levels[key],
+                "paths": in_library.get(key, []),
+            })
+        rows.sort(key=lambda row: (row["depth"], not row["paths"], row["title"].lower()))
+        return rows
+
+    @staticmethod
+    def _fetch_neighbours(paper_key: str, direction: str) -> tuple[list[dict], bool]:
+        """
+        Read the references or citations of a paper from Semantic Scholar, falling back to Crossref references.
+        Returns (neighbours, truncated), truncated being True when more than MAX_NEIGHBOURS exist.
+        """
+        try:
+            return CitationGraphWorker._semantic_scholar_neighbours(paper_key, direction)
+        except Exception:
+            if direction != REFERENCES or paper_key.startswith("s2:"):
+                raise
+            return CitationGraphWorker._crossref_references(paper_key), False
+
+    @staticmethod
+    def _semantic_scholar_neighbours(paper_key: str, direction: str) -> tuple[list[dict], bool]:
+        paper_id = paper_key[3:] if paper_key.startswith("s2:") else f"DOI:{quote(paper_key, safe='/')}"
+        linked = "citedPaper" if direction == REFERENCES else "citingPaper"
+        client = HttpClient.shared()
+        neighbours = []
+        offset = 0
+        while offset is not None and len(neighbours) < MAX_NEIGHBOURS:
+            res = client.get(f"{SEMANTIC_SCHOLAR_API}/paper/{paper_id}/{direction}",
+                             params={"fields": NEIGHBOUR_FIELDS, "offset": offset, "limit": PAGE_SIZE},
+                             provider="semantic_scholar")
+            res.raise_for_status()
+            body = res.json()
+            for entry in body.get("data") or []:
+                paper = entry.get(linked) or {}
+                key = CitationGraph.paper_key(doi=(paper.get("externalIds") or {}).get("DOI"),
+                                              paper_id=paper.get("paperId"))
+                if key:
+                    neighbours.append({"key": key, "title": paper.get("title"), "year": paper.get("year")})
+            offset = body.get("next")
+        return neighbours[:MAX_NEIGHBOURS], offset is not None or len(neighbours) > MAX_NEIGHBOURS
+
+    @staticmethod
+    def _crossref_references(doi: str) -> list[dict]:
+        res = HttpClient.shared().get(f"{CROSSREF_API}/works/{quote(doi, safe='/')}", provider="crossref")
+        res.raise_for_status()
+        neighbours = []
+        for reference in res.json().get("message", {}).get("reference") or []:
+            if reference.get("DOI"):
+                year = str(reference.get("year") or "")
+                neighbours.append({"key": CitationGraph.paper_key(doi=reference["DOI"]),
+                                   "title": reference.get("article-title"),
+                                   "year": int(year) if year.isdigit() else None})
+        return neighbours
@@ -0,0 +1,61 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from PySide6.QtCore import QThread, Signal
+from services.doi_utils import extract_pdf_doi
+from services.library_catalog import LibraryCatalog
+
+
+def _extract(path: str) -> tuple[str, str | None, str | None]:
+    """Pool task: return (path, doi, source) for a PDF."""
+    try:
+        doi, source = extract_pdf_doi(path)
+    except Exception:
+        doi, source = None, None
+    return path, doi, source
+
+
+class DoiIndexWorker(QThread):
+    """
+    Extracts the DOI of every PDF not yet indexed under the root folder, in a process pool,
+    and stores the DOI -> file mapping in the library catalog.
+    """
+    progress = Signal(str, int, int)
+    error_occurred = Signal(str)
+
+    BATCH_SIZE = 50
+
+    def __init__(self, root_folder, db_path="library.db", max_workers=None):
+        super().__init__()
+        self.root_folder = root_folder
+        self.db_path = db_path
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.running = False
+
+    def run(self) -> None:
+        self.running = True
+        try:
+            catalog = LibraryCatalog(self.db_path)
+            pending = catalog.fetch_doi_pending(self.root_folder)
+            total = len(pending)
+            if not total:
+                return
+            batch = []
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(_extract, path) for path in pending]
+                for idx, future in enumerate(as_completed(futures), start=1):
+                    if not self.running:
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        break
+                    batch.append(future.result())
+                    if len(batch) >= self.BATCH_SIZE:
+                        catalog.save_doi_index(batch)
+                        batch.clear()
+                    self.progress.emit(f"Indexing DOIs {idx}/{total}", idx, int(idx / total * 100))
+            if batch:
+                catalog.save_doi_index(batch)
+        except Exception as e:
+            self.error_occurred.emit(f"DOI indexing error: {str(e)}")
+
+    def stop(self) -> None:
+        self.running = False
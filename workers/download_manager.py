@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import QThread, Signal
+from services.download_errors import CancelledDownloadError
+from services.download_pipeline import DownloadPipeline
+from services.download_queue import DownloadQueue, QUEUED, DONE, FAILED
+from services.library_lookup import LibraryLookup
+from workers.scihub import SciHub
+
+# Upper bound of the concurrency setting, and the longest sleep between two looks at the queue.
+MAX_CONCURRENCY = 16
+POLL_INTERVAL = 5.0
+# Seconds between two progress updates of one download.
+PROGRESS_INTERVAL = 0.25
+
+
+class DownloadManager(QThread):
+    """
+    Drains the persistent download queue in the background with a bounded number of concurrent downloads.
+    The queue can be paused as a whole; single jobs are paused, resumed or cancelled through DownloadQueue.
+    Each finished file goes through the pipeline (validation, catalog, text index) before the job is done.
+    Jobs whose article is already in the library are answered by the lookup without downloading.
+    """
+    message = Signal(str)
+    job_changed = Signal(int)
+    job_done = Signal(int, str)
+    job_failed = Signal(int, str)
+    job_progress = Signal(int, int, int)
+
+    def __init__(self, queue: DownloadQueue, max_concurrency: int = 3, pipeline: DownloadPipeline | None = None,
+                 lookup: LibraryLookup | None = None):
+        super().__init__()
+        self.queue = queue
+        self.pipeline = pipeline
+        self.lookup = lookup
+        self.max_concurrency = max(1, min(MAX_CONCURRENCY, max_concurrency))
+        self.paused = False
+        self._running = set()
+        self._stopped = False
+        self._wake = threading.Event()
+        self._cancel = threading.Event()
+
+    def set_concurrency(self, max_concurrency: int) -> None:
+        self.max_concurrency = max(1, min(MAX_CONCURRENCY, max_concurrency))
+        self.wake()
+
+    def set_paused(self, paused: bool) -> None:
+        """Stop or restart starting new downloads; running ones are let to finish."""
+        self.paused = paused
+        self.wake()
+
+    def wake(self) -> None:
+        """Look at the queue now, e.g. after jobs were added or resumed."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop starting downloads and cancel the running ones; they are queued again on the next start."""
+        self._stopped = True
+        self._cancel.set()
+        self.wake()
+
+    def run(self) -> None:
+        requeued = self.queue.requeue_interrupted()
+        if requeued:
+            self.message.emit(f"{requeued} interrupted download(s) queued again.")
+        pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY)
+        while not self._stopped:
+            self._wake.clear()
+            while not self.paused and len(self._running) < self.max_concurrency:
+                job = self.queue.claim_next()
+                if not job:
+                    break
+                self._running.add(job["id"])
+                self.job_changed.emit(job["id"])
+                pool.submit(self._run_job, job)
+            due = self.queue.next_due_in()
+            self._wake.wait(POLL_INTERVAL if due is None else min(POLL_INTERVAL, due + 0.1))
+        # Running downloads stop at their next chunk and stay running in the queue, so the next
+        # start queues them again and resumes their partial files.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    def _run_job(self, job: dict) -> None:
+        try:
+            pdf_path = self.lookup.resolve(job["doi"], job["title"], job["destination"]) if self.lookup else None
+            if pdf_path:
+                self.message.emit(f"Already in the library: {pdf_path}")
+            else:
+                self.message.emit(f"Fetching article: {job['doi']}")
+                pdf_path = self.download(job["doi"], job["destination"], job["title"],
+                                         progress=self._progress_callback(job["id"]), cancel=self._cancel)
+                if self.pipeline:
+                    self.pipeline.process(pdf_path, job["doi"])
+        except CancelledDownloadError:
+            return
+        except Exception as e:
+            # Errors without a classification (see services.download_errors) are assumed transient.
+            state = self.queue.fail(job["id"], str(e), retryable=getattr(e, "retryable", True))
+            if state == FAILED:
+                self.message.emit(f"Download failed for {job['title']}: {e}")
+                self.job_failed.emit(job["id"], str(e))
+            elif state == QUEUED:
+                self.message.emit(f"Download of {job['title']} failed, retry scheduled: {e}")
+        else:
+            self.queue.complete(job["id"], pdf_path)
+            if (self.queue.get(job["id"]) or {}).get("state") == DONE:
+                self.message.emit(f"Download completed for: {job['title']}\nSaved in: {pdf_path}")
+                self.job_done.emit(job["id"], pdf_path)
+        finally:
+            self._running.discard(job["id"])
+            if not self._stopped:
+                self.job_changed.emit(job["id"])
+                self.wake()
+
+    def _progress_callback(self, job_id: int):
+        """Report (received, total) bytes of a job at most every PROGRESS_INTERVAL seconds."""
+        last_emit = 0.0
+
+        def progress(received: int, total: int) -> None:
+            nonlocal last_emit
+            now = time.monotonic()
+            if now - last_emit >= PROGRESS_INTERVAL or received == total:
+                last_emit = now
+                self.job_progress.emit(job_id, received, total)
+        return progress
+
+    @staticmethod
+    def download(doi: str, destination: str, title: str, progress=None, cancel=None) -> str:
+        """Download one article into the destination folder and return the PDF path; raises a DownloadError."""
+        os.makedirs(destination, exist_ok=True)
+        result = SciHub().download(identifier=doi, destination=destination, path=(title or "Article") + ".pdf",
+                                   progress=progress, cancel=cancel)
+        return result["path"]
@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from PySide6.QtCore import QThread, Signal
+from services.duplicate_finder import DuplicateFinder
+from services.library_catalog import LibraryCatalog
+
+
+class DuplicateFinderWorker(QThread):
+    """
+    Finds exact and near-duplicate PDFs under the root folder.
+    Hashes and text signatures missing from the catalog are computed in a process pool
+    and cached, so repeated runs only analyse new or modified files.
+    """
+    progress = Signal(str, int, int)
+    result = Signal(list, list)
+    error_occurred = Signal(str)
+
+    def __init__(self, root_folder, db_path="library.db", near_threshold=0.8, max_workers=None):
+        super().__init__()
+        self.root_folder = root_folder
+        self.db_path = db_path
+        self.near_threshold = near_threshold
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.running = False
+
+    def run(self) -> None:
+        self.running = True
+        try:
+            catalog = LibraryCatalog(self.db_path)
+            files = [(path, content_hash, has_text) for path, content_hash, has_text
+                     in catalog.fetch_hashed_files(self.root_folder) if os.path.exists(path)]
+            cached = catalog.get_signatures([h for _, h, _ in files if h])
+
+            tasks = [(path, not content_hash, has_text != 0 and content_hash not in cached)
+                     for path, content_hash, has_text in files]
+            tasks = [task for task in tasks if task[1] or task[2]]
+            hashes = {path: content_hash for path, content_hash, _ in files}
+            signatures = {}
+
+            if tasks:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures = [pool.submit(DuplicateFinder.analyse_file, *task) for task in tasks]
+                    for idx, future in enumerate(as_completed(futures), start=1):
+                        if not self.running:
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                        try:
+                            path, content_hash, signature = future.result()
+                        except Exception as e:
+                            self.error_occurred.emit(f"Duplicate analysis error: {str(e)}")
+                            continue
+                        if content_hash:
+                            hashes[path] = content_hash
+                        if signature:
+                            signatures[hashes[path]] = signature
+                        self.progress.emit(f"Analysing {idx}/{len(tasks)}", idx, int(idx / len(tasks) * 100))
+
+                catalog.set_content_hashes({path: hashes[path] for path, need_hash, _ in tasks
+                                            if need_hash and hashes.get(path)})
+                catalog.save_signatures(signatures)
+
+            exact = DuplicateFinder.exact_groups(list(hashes.items()))
+
+            # Near duplicates are compared once per distinct content, then expanded back to paths.
+            cached.update(signatures)
+            by_hash = {}
+            for path, content_hash in hashes.items():
+                by_hash.setdefault(content_hash, []).append(path)
+            representatives = {paths[0]: cached[h] for h, paths in by_hash.items() if h in cached}
+            near = []
+            for group in DuplicateFinder.near_groups(representatives, self.near_threshold):
+                near.append(sorted(p for rep in group for p in by_hash[hashes[rep]]))
+
+            self.result.emit(*DuplicateFinder.merge_overlapping(exact, near))
+        except Exception as e:
+            self.error_occurred.emit(f"Duplicate search error: {str(e)}")
+
+    def stop(self) -> None:
+        self.running = False
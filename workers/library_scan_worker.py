@@ -0,0 +1,85 @@
+import os
+import fitz
+from PySide6.QtCore import QThread, Signal
+from services.doi_utils import find_doi, normalize_doi
+from services.file_service import FileService
+from services.library_catalog import LibraryCatalog
+
+
+class LibraryScanWorker(QThread):
+    """
+    Incrementally scans the root folder into the library catalog.
+    The folder/file listing is synced first (stat only) so the file dock can be
+    redrawn right away, then metadata is extracted for new or modified PDFs.
+    """
+    progress = Signal(str, int, int)
+    listing_changed = Signal()
+    error_occurred = Signal(str)
+
+    BATCH_SIZE = 25
+
+    def __init__(self, root_folder, db_path="library.db"):
+        super().__init__()
+        self.root_folder = root_folder
+        self.db_path = db_path
+        self.running = False
+
+    def run(self) -> None:
+        self.running = True
+        try:
+            catalog = LibraryCatalog(self.db_path)
+            folders, files = self._list_root()
+            if catalog.sync_listing(self.root_folder, folders, files):
+                self.listing_changed.emit()
+
+            pending = catalog.fetch_pending(self.root_folder)
+            total = len(pending)
+            batch = []
+            for idx, path in enumerate(pending, start=1):
+                if not self.running:
+                    break
+                batch.append(self.extract_metadata(path))
+                if len(batch) >= self.BATCH_SIZE or idx == total:
+                    catalog.update_metadata(batch)
+                    batch.clear()
+                    self.progress.emit(f"Cataloguing {idx}/{total}", idx, int(idx / total * 100))
+        except Exception as e:
+            self.error_occurred.emit(f"Library scan error: {str(e)}")
+
+    def stop(self) -> None:
+        self.running = False
+
+    def _list_root(self) -> tuple[list[str], list[tuple[str, int, float]]]:
+        """Walk the root folder and stat every PDF."""
+        folders = []
+        files = []
+        for subdir, _, file_names in os.walk(self.root_folder):
+            folders.append(subdir)
+            for file_name in file_names:
+                if not file_name.lower().endswith(".pdf"):
+                    continue
+                path = os.path.join(subdir, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((path, stat.st_size, stat.st_mtime))
+        return folders, files
+
+    @staticmethod
+    def extract_metadata(path: str) -> dict:
+        """Read the hash, page count, title, DOI and text-layer presence of a PDF."""
+        record = {"path": path}
+        try:
+            record["content_hash"] = FileService.hash_file(path)
+            with fitz.open(path) as doc:
+                metadata = doc.metadata or {}
+                record["page_count"] = doc.page_count
+                record["title"] = (metadata.get("title") or "").strip() or None
+                doi = find_doi(" ".join(str(metadata.get(key) or "") for key in ("subject", "keywords", "title")))
+                record["doi"] = normalize_doi(doi) if doi else None
+                record["has_text"] = bool(doc.page_count and doc[0].get_text("text").strip())
+        except Exception:
+            # Unreadable or encrypted PDFs stay in the catalog with whatever could be read.
+            pass
+        return record
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import QThread, Signal
+from services.article_lookup import lookup_article
+from services.article_record import ArticleRecord
+from services.metadata_cache import MetadataCache
+from services.network_governor import NetworkGovernor, BACKGROUND
+
+
+class MetadataPrefetchWorker(QThread):
+    """Looks up DOIs that are not cached yet so a later search is answered from the metadata cache."""
+    prefetched = Signal(int)
+
+    def __init__(self, dois: list[str], max_concurrency: int = 4):
+        super().__init__()
+        self.dois = dois
+        self.max_concurrency = max(1, max_concurrency)
+
+    def run(self) -> None:
+        cache = MetadataCache()
+        missing = [doi for doi in self.dois if not cache.get(MetadataCache.doi_key(doi))[0]]
+        if not missing:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            results = list(pool.map(NetworkGovernor.shared().bind(self._prefetch, BACKGROUND), missing))
+        self.prefetched.emit(sum(1 for res in results if res))
+
+    @staticmethod
+    def _prefetch(doi: str) -> ArticleRecord | None:
+        try:
+            # The lookup stores the answer (or the miss) in the metadata cache.
+            return lookup_article(doi)
+        except Exception:
+            return None
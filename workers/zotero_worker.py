@@ -0,0 +1,30 @@
+import json
+from PySide6.QtCore import QThread, Signal
+from services.network_governor import NetworkGovernor
+from services.rate_limiter import RateLimiter
+
+
+class ZoteroUploadWorker(QThread):
+    """
+    Uploads one item to Zotero off the UI thread; the rate limiter and the connection cap
+    of the network governor may both wait before the request goes out.
+    """
+    uploaded = Signal(str)
+    error = Signal(str)
+
+    def __init__(self, client, item: dict):
+        super().__init__()
+        self.client = client
+        self.item = item
+
+    def run(self) -> None:
+        try:
+            RateLimiter.for_provider("zotero").acquire()
+            # pyzotero has its own HTTP client, so the upload is registered with the governor here.
+            governor = NetworkGovernor.shared()
+            with governor.connection("zotero"):
+                governor.throttle(len(json.dumps(self.item)), "zotero")
+                self.client.create_items([self.item])
+            self.uploaded.emit(self.item["title"])
+        except Exception as e:
+            self.error.emit(str(e))